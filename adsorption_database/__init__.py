@@ -1 +1,4 @@
 from ._adsorption_database import AdsorptionDatabase
+from ._async_adsorption_database import AsyncAdsorptionDatabase
+
+__all__ = ["AdsorptionDatabase", "AsyncAdsorptionDatabase"]
@@ -0,0 +1,243 @@
+import argparse
+from pathlib import Path
+from typing import List, Optional
+
+from adsorption_database.blob_store import (
+    get_deduplication_report,
+    prune_blobs,
+)
+from adsorption_database.catalog import Catalog, get_catalog_path
+from adsorption_database.handlers.ingest import ingest_manifests
+from adsorption_database.point_store import write_point_store
+from adsorption_database.storage_options import StorageOptions
+from adsorption_database.storage_provider import StorageProvider
+from adsorption_database.storage_tools import report_storage_options
+
+
+def get_storage_provider(path: Optional[str]) -> StorageProvider:
+    if path is not None:
+        return StorageProvider(file_path=Path(path).resolve())
+    return StorageProvider()
+
+
+def get_storage_path(path: Optional[str]) -> Path:
+    return get_storage_provider(path).get_file_path().resolve()
+
+
+def add_storage_options_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--compression", choices=["gzip", "lzf"])
+    parser.add_argument("--compression-level", type=int)
+    parser.add_argument("--shuffle", action="store_true")
+    parser.add_argument("--chunk-size", type=int)
+    parser.add_argument("--contiguous-threshold", type=int)
+    parser.add_argument("--deduplicate", action="store_true")
+
+
+def has_storage_options(args: argparse.Namespace) -> bool:
+    return (
+        args.shuffle
+        or args.deduplicate
+        or any(
+            value is not None
+            for value in [
+                args.compression,
+                args.compression_level,
+                args.chunk_size,
+                args.contiguous_threshold,
+            ]
+        )
+    )
+
+
+def get_storage_options(args: argparse.Namespace) -> StorageOptions:
+    storage_options = StorageOptions(
+        compression=args.compression,
+        compression_level=args.compression_level,
+        shuffle=args.shuffle,
+        deduplicate=args.deduplicate,
+    )
+    if args.chunk_size is not None:
+        storage_options.chunk_size_bytes = args.chunk_size
+    if args.contiguous_threshold is not None:
+        storage_options.contiguous_threshold_bytes = args.contiguous_threshold
+
+    return storage_options
+
+
+def report(args: argparse.Namespace) -> None:
+    path = get_storage_path(args.path)
+    result = report_storage_options(path, get_storage_options(args))
+
+    print(f"Storage file: {path}")
+    print(f"Size: {result.size_before} -> {result.size_after} bytes")
+    print(
+        f"Read time: {result.read_seconds_before * 1e3:.2f} -> {result.read_seconds_after * 1e3:.2f} ms"
+    )
+
+
+def compact(args: argparse.Namespace) -> None:
+    storage_options = None
+    if has_storage_options(args):
+        storage_options = get_storage_options(args)
+
+    provider = get_storage_provider(args.path)
+    result = provider.compact(storage_options)
+
+    print(f"Storage file: {provider.get_file_path().resolve()}")
+    print(f"Size: {result.size_before} -> {result.size_after} bytes")
+
+
+def points(args: argparse.Namespace) -> None:
+    storage_options = None
+    if has_storage_options(args):
+        storage_options = get_storage_options(args)
+
+    provider = get_storage_provider(args.path)
+    with provider.get_shadow_file() as f:
+        write_point_store(f, storage_options)
+
+    print(f"Storage file: {provider.get_file_path().resolve()}")
+    print("Point store written")
+
+
+def blobs(args: argparse.Namespace) -> None:
+    provider = get_storage_provider(args.path)
+    if args.prune:
+        with provider.get_shadow_file() as f:
+            pruned = prune_blobs(f)
+        print(f"Pruned blobs: {pruned}")
+
+    with provider.get_readable_file() as f:
+        result = get_deduplication_report(f)
+    provider.close()
+
+    print(f"Storage file: {provider.get_file_path().resolve()}")
+    print(f"Blobs: {result.blobs} ({result.links} links)")
+    print(f"Stored: {result.bytes_stored} bytes")
+    print(f"Saved: {result.bytes_saved} bytes")
+
+
+def ingest(args: argparse.Namespace) -> None:
+    storage_options = None
+    if has_storage_options(args):
+        storage_options = get_storage_options(args)
+
+    result = ingest_manifests(
+        [Path(path) for path in args.manifests],
+        args.force,
+        storage_options,
+        args.processes,
+        parse_cache_directory=args.parse_cache,
+    )
+    for path in result.built:
+        print(f"Built: {path}")
+    for error in result.errors:
+        source = error.path if error.file_name is None else error.file_name
+        print(f"Failed: {source}: {error.message}")
+
+    report = result.report
+    print(
+        f"{len(result.built)} built, {len(result.up_to_date)} up to date, {len(result.failed)} failed"
+    )
+    print(
+        f"Groups: {len(report.inserted)} inserted, {len(report.updated)} updated, {len(report.skipped)} skipped"
+    )
+    if result.failed:
+        raise SystemExit(1)
+
+
+def rebuild_index(args: argparse.Namespace) -> None:
+    provider = get_storage_provider(args.path)
+    path = provider.get_file_path().resolve()
+    catalog_path = get_catalog_path(path)
+    if catalog_path is None:
+        raise SystemExit(f"Can not write the catalog next to {path}")
+
+    catalog = Catalog(path, catalog_path)
+    signature = catalog.get_storage_signature()
+    with provider.get_readable_file() as f:
+        catalog.rebuild(f, signature)
+    provider.close()
+
+    print(f"Storage file: {path}")
+    print(f"Catalog: {catalog_path}")
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m adsorption_database")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    report_parser = subparsers.add_parser(
+        "report",
+        help="report the size and read time of the storage file with the given storage options",
+    )
+    report_parser.add_argument("path", nargs="?")
+    add_storage_options_arguments(report_parser)
+    report_parser.set_defaults(func=report)
+
+    compact_parser = subparsers.add_parser(
+        "compact",
+        help="rewrite the storage file into a fresh, tightly packed file",
+    )
+    compact_parser.add_argument("path", nargs="?")
+    add_storage_options_arguments(compact_parser)
+    compact_parser.set_defaults(func=compact)
+
+    points_parser = subparsers.add_parser(
+        "points",
+        help="create or refresh the consolidated point store of the storage file",
+    )
+    points_parser.add_argument("path", nargs="?")
+    add_storage_options_arguments(points_parser)
+    points_parser.set_defaults(func=points)
+
+    blobs_parser = subparsers.add_parser(
+        "blobs",
+        help="report the bytes saved by the deduplicated arrays of the storage file",
+    )
+    blobs_parser.add_argument("path", nargs="?")
+    blobs_parser.add_argument(
+        "--prune",
+        action="store_true",
+        help="delete the blobs no longer linked by any isotherm first",
+    )
+    blobs_parser.set_defaults(func=blobs)
+
+    ingest_parser = subparsers.add_parser(
+        "ingest",
+        help="register the experiments of the manifests changed since the last run",
+    )
+    ingest_parser.add_argument(
+        "manifests", nargs="+", help="manifest files or folders"
+    )
+    ingest_parser.add_argument(
+        "--force",
+        action="store_true",
+        help="rebuild every manifest, changed or not",
+    )
+    ingest_parser.add_argument(
+        "--processes",
+        type=int,
+        help="parse the isotherm files in this many worker processes",
+    )
+    ingest_parser.add_argument(
+        "--parse-cache",
+        type=Path,
+        help="cache parsed isotherm files in this folder, for later runs",
+    )
+    add_storage_options_arguments(ingest_parser)
+    ingest_parser.set_defaults(func=ingest)
+
+    rebuild_index_parser = subparsers.add_parser(
+        "rebuild-index",
+        help="rebuild the metadata catalog of the storage file",
+    )
+    rebuild_index_parser.add_argument("path", nargs="?")
+    rebuild_index_parser.set_defaults(func=rebuild_index)
+
+    args = parser.parse_args(argv)
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,42 +1,267 @@
-from typing import Any, List, Optional
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+from adsorption_database.cache import CacheInfo, ObjectCache
+from adsorption_database.catalog import Catalog, Range, get_catalog_path
 from adsorption_database.models.adsorbate import Adsorbate
-from adsorption_database.models.adsorbent import Adsorbent
+from adsorption_database.models.adsorbent import Adsorbent, AdsorbentType
+from adsorption_database.models.isotherm_handle import IsothermHandle
+from adsorption_database.models.isotherms import (
+    IsothermType,
+    MixIsotherm,
+    MonoIsotherm,
+)
 from adsorption_database.serializers.attrs_serializer import AttrOnlySerializer
 from adsorption_database.serializers.experiment_serializer import (
     ExperimentSerializer,
 )
-from adsorption_database.storage_provider import StorageProvider
+from adsorption_database.serializers.load_context import LoadContext
+from adsorption_database.serializers.mix_isotherm_serializer import (
+    MixIsothermSerializer,
+)
+from adsorption_database.serializers.mono_isotherm_serializer import (
+    MonoIsothermSerializer,
+)
+from adsorption_database.storage_provider import (
+    FileSignature,
+    StorageProvider,
+    get_file_signature,
+)
 from adsorption_database.defaults import EXPERIMENTS, ADSORBATES, ADSORBENTS, MIXTURE_ISOTHERMS, MONO_ISOTHERMS
 from adsorption_database.models.experiment import Experiment
-from h5py import Group
+from adsorption_database.models.points import (
+    MixturePointTable,
+    PurePointTable,
+)
+from adsorption_database.point_store import (
+    iter_point_tables,
+    read_mixture_point_table,
+    read_pure_point_table,
+)
 
 
 class GroupNotFound(Exception):
     """"""
 
 
+def _read_experiments(
+    provider: StorageProvider,
+    names: Optional[Iterable[str]],
+    memory_map: bool = False,
+    lazy: bool = False,
+) -> Dict[str, Experiment]:
+    serializer = ExperimentSerializer()
+
+    experiments: Dict[str, Experiment] = {}
+    with provider.get_readable_file() as f:
+        context = LoadContext(f, memory_map, lazy)
+        experiments_group = f[EXPERIMENTS]
+        if names is None:
+            names = list(experiments_group)
+
+        for name in names:
+            experiment_group = experiments_group.get(name)
+            if experiment_group is None:
+                raise GroupNotFound(f"Experiment {name} not found")
+            experiments[name] = serializer.load(experiment_group, context)
+
+    return experiments
+
+
+def _read_experiments_in_worker(
+    file_path: Path, names: List[str]
+) -> Dict[str, Experiment]:
+    # Runs in a worker process, which keeps its pooled handle for the next tasks
+    return _read_experiments(StorageProvider(file_path=file_path), names)
+
+
 class AdsorptionDatabase:
     """
     The AdsorptionDatabase class provides methods to access and retrieve adsorption data from the adsorption database.
+
+    Read handles to the storage file are kept open and shared with every other `AdsorptionDatabase` instance of the
+    process. Use `close` (or the instance as a context manager) to release them.
+
+    With `memory_map`, the isotherm arrays of loaded experiments are read-only memory maps of the storage file
+    instead of copies, whenever their layout allows it (contiguous, unfiltered datasets). Loading then costs page
+    faults instead of allocations, and processes of the same host share the page cache. Maps are not snapshots: they
+    keep seeing a file replaced by an atomic commit or a compaction, but datasets overwritten in place by a handler
+    change under them, including the arrays of experiments held by the object cache.
+
+    Listing and filtering are answered by the metadata catalog of the storage file (see `Catalog`), a `sqlite3`
+    sidecar kept up to date by the handlers. A missing or stale catalog is rebuilt on the first query, in memory if
+    the storage folder is not writable.
+
+    An instance can be shared by threads: the catalog and its connection are lock-protected, and with
+    `thread_local` each thread reads through its own pooled handle of the storage file. h5py runs every call behind a
+    global lock, though, so threads do not load experiments any faster than a single one. With `processes`,
+    `get_experiments` splits the experiments over a pool of worker processes instead, which pays off when many large
+    experiments are loaded at once.
+
+    With `cache_size`, experiments, adsorbates and adsorbents are kept in an `ObjectCache` of that many bytes, so
+    repeated queries return the same objects without reading the storage file. Cached objects have read-only arrays,
+    and the cache is cleared whenever the storage file changes on disk. Lazy experiments are never cached.
     """
-    
-    def __init__(self):
-        self._provider = StorageProvider()
 
-    def _list_group_childs(
-        self, child_name: str, parent_group: Optional[Group] = None
-    ) -> List[str]:
+    def __init__(
+        self,
+        memory_map: bool = False,
+        thread_local: bool = False,
+        processes: Optional[int] = None,
+        cache_size: Optional[int] = None,
+    ):
+        """
+        :param memory_map: Whether isotherm arrays are memory maps of the storage file instead of copies.
+        :type memory_map: bool
+        :param thread_local: Whether each thread reads through its own handle of the storage file.
+        :type thread_local: bool
+        :param processes: The number of worker processes used by `get_experiments`. Defaults to None, in which case
+            experiments are loaded in the calling thread. Can not be combined with `memory_map`, since memory maps are
+            copied when they are sent back from the workers.
+        :type processes: Optional[int]
+        :param cache_size: The budget of the object cache, in bytes. Defaults to None, in which case nothing is
+            cached.
+        :type cache_size: Optional[int]
+        :raises ValueError: If both `memory_map` and `processes` are given.
+        """
+        if memory_map and processes is not None:
+            raise ValueError(
+                "memory_map and processes can not be combined: memory maps"
+                " can not be sent back from worker processes"
+            )
+
+        self._provider = StorageProvider(thread_local=thread_local)
+        self._memory_map = memory_map
+        self._processes = processes
+        self._catalog: Optional[Catalog] = None
+        self._catalog_lock = threading.Lock()
+        self._process_pool: Optional[ProcessPoolExecutor] = None
+        self._process_pool_lock = threading.Lock()
+        self._cache = (
+            ObjectCache(cache_size) if cache_size is not None else None
+        )
+
+    def __enter__(self) -> "AdsorptionDatabase":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Close the read handle to the storage file, the catalog connections and stop the worker processes. They are
+        reopened on the next query.
+        """
+        self._provider.close()
+
+        with self._catalog_lock:
+            if self._catalog is not None:
+                self._catalog.close()
 
-        if parent_group is not None:
-            return list(parent_group[child_name])
+        with self._process_pool_lock:
+            if self._process_pool is not None:
+                self._process_pool.shutdown()
+                self._process_pool = None
 
+    def get_cache_info(self) -> Optional[CacheInfo]:
+        """
+        Get the hit and miss counters and the size of the object cache.
+
+        :return: The cache counters, or None if the database has no cache.
+        :rtype: Optional[CacheInfo]
+        """
+        return self._cache.get_info() if self._cache is not None else None
+
+    def clear_cache(self) -> None:
+        """
+        Drop every object of the object cache, if any.
+        """
+        if self._cache is not None:
+            self._cache.clear()
+
+    def _get_storage_signature(self) -> FileSignature:
+        return get_file_signature(self._provider.get_file_path().resolve())
+
+    def _get_cached(self, key: Tuple[str, str], load: Callable[[], Any]) -> Any:
+        if self._cache is None:
+            return load()
+
+        signature = self._get_storage_signature()
+        value = self._cache.get(key, signature)
+        if value is None:
+            value = self._cache.put(key, load(), signature)
+        return value
+
+    def _get_process_pool(self) -> ProcessPoolExecutor:
+        with self._process_pool_lock:
+            if self._process_pool is None:
+                # Forked workers would inherit the open HDF5 handles of the parent
+                self._process_pool = ProcessPoolExecutor(
+                    self._processes,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            return self._process_pool
+
+    def _get_catalog(self) -> Catalog:
+        storage_path = self._provider.get_file_path().resolve()
+
+        with self._catalog_lock:
+            if (
+                self._catalog is None
+                or self._catalog.storage_path != storage_path
+            ):
+                if self._catalog is not None:
+                    self._catalog.close()
+                self._catalog = Catalog(
+                    storage_path, get_catalog_path(storage_path)
+                )
+
+            if not self._catalog.is_fresh():
+                self._rebuild_catalog(self._catalog)
+
+        return self._catalog
+
+    def _rebuild_catalog(self, catalog: Catalog) -> None:
+        signature = catalog.get_storage_signature()
         with self._provider.get_readable_file() as f:
-            childs = list(f[child_name])
-        return childs
+            catalog.rebuild(f, signature)
+
+    def rebuild_index(self) -> None:
+        """
+        Rebuild the metadata catalog from the storage file.
+
+        The catalog is rebuilt automatically when it does not match the storage file, so this is only needed to
+        force it, e.g. after upgrading the package.
+        """
+        catalog = self._get_catalog()
+        with self._catalog_lock:
+            self._rebuild_catalog(catalog)
 
     def _get_attr_only_obj(
         self, name: str, parent_group_name: str, model_class: Any
     ) -> Optional[Any]:
+        return self._get_cached(
+            (parent_group_name, name),
+            lambda: self._load_attr_only_obj(
+                name, parent_group_name, model_class
+            ),
+        )
+
+    def _load_attr_only_obj(
+        self, name: str, parent_group_name: str, model_class: Any
+    ) -> Optional[Any]:
 
         with self._provider.get_readable_file() as f:
             obj_group = f[parent_group_name].get(name)
@@ -48,20 +273,63 @@ class AdsorptionDatabase:
 
         return obj
 
-    def list_pure_isotherms(self, experiment_name:str)->List[str]:
-        self._list_group_childs(f"{EXPERIMENTS}/{experiment_name}/{MONO_ISOTHERMS}")
+    def list_pure_isotherms(self, experiment_name: str) -> List[str]:
+        """
+        Retrieve the stored names of the pure isotherms of an experiment.
+
+        :param experiment_name: The name of the experiment.
+        :type experiment_name: str
+        :return: The stored names of the pure isotherms of the experiment.
+        :rtype: List[str]
+        """
+        return self._get_catalog().list_isotherms(
+            experiment_name, MONO_ISOTHERMS
+        )
 
-    def list_mixture_isotherms(self, experiment_name:str)->List[str]:
-        self._list_group_childs(f"{EXPERIMENTS}/{experiment_name}/{MIXTURE_ISOTHERMS}")
+    def list_mixture_isotherms(self, experiment_name: str) -> List[str]:
+        """
+        Retrieve the stored names of the mixture isotherms of an experiment.
 
-    def list_experiments(self) -> List[str]:
+        :param experiment_name: The name of the experiment.
+        :type experiment_name: str
+        :return: The stored names of the mixture isotherms of the experiment.
+        :rtype: List[str]
+        """
+        return self._get_catalog().list_isotherms(
+            experiment_name, MIXTURE_ISOTHERMS
+        )
+
+    def list_experiments(
+        self,
+        adsorbate: Optional[str] = None,
+        adsorbent: Optional[str] = None,
+        temperature: Optional[float] = None,
+        temperature_tolerance: float = 0.5,
+    ) -> List[str]:
         """
         Retrieve the unique experiments present in the adsorption database as a list of strings.
 
+        Experiments can be filtered by the contents of their isotherms: only experiments with at least one isotherm
+        matching every given filter are returned.
+
+        :param adsorbate: The name or chemical formula of an adsorbate of the isotherm.
+        :type adsorbate: Optional[str]
+        :param adsorbent: The name of the adsorbent of the experiment.
+        :type adsorbent: Optional[str]
+        :param temperature: The temperature of the isotherm.
+        :type temperature: Optional[float]
+        :param temperature_tolerance: The maximum distance to `temperature`.
+        :type temperature_tolerance: float
         :return: The unique experiments as a list of strings.
         :rtype: List[str]
         """
-        return self._list_group_childs(EXPERIMENTS)
+        catalog = self._get_catalog()
+        if adsorbate is None and adsorbent is None and temperature is None:
+            return catalog.list_names("experiments")
+
+        return catalog.find_experiments(
+            adsorbate, adsorbent, temperature, temperature_tolerance
+        )
 
     def list_adsorbates(self) -> List[str]:
         """
@@ -71,7 +339,7 @@ class AdsorptionDatabase:
         :rtype: List[str]
 
         """
-        return self._list_group_childs(ADSORBATES)
+        return self._get_catalog().list_names("adsorbates")
 
     def list_adsorbents(self) -> List[str]:
         """
@@ -80,33 +348,284 @@ class AdsorptionDatabase:
         :return: The unique adsorbent materials as a list of strings.
         :rtype: List[str]
         """
-        return self._list_group_childs(ADSORBENTS)
+        return self._get_catalog().list_names("adsorbents")
 
-    def get_experiment(self, experiment_name: str) -> Optional[Experiment]:
+    def get_experiment(
+        self, experiment_name: str, lazy: bool = False
+    ) -> Optional[Experiment]:
         """
         Retrieve an experiment with the given name from the adsorption database.
 
         This method reads the experiment data from the adsorption database and returns an instance of the `Experiment`
         class, which represents the experiment data.
 
+        With `lazy`, isotherm metadata (names, temperatures, adsorbates) is loaded right away, but the isotherm arrays
+        are `LazyDataset` proxies, read through the shared handle of the storage file on first access.
+
         :param experiment_name: The name of the experiment to retrieve.
         :type experiment_name: str
+        :param lazy: Whether to defer reading the isotherm arrays until they are accessed.
+        :type lazy: bool
         :return: An instance of the `Experiment` class representing the retrieved experiment data, or None if the experiment
                  with the given name is not found.
         :rtype: Optional[Experiment]
         :raises GroupNotFound: If the experiment with the given name is not found in the adsorption database.
         """
+        if lazy:
+            return self._load_experiment(experiment_name, lazy)
 
+        experiment: Experiment = self._get_cached(
+            (EXPERIMENTS, experiment_name),
+            lambda: self._load_experiment(experiment_name),
+        )
+        return experiment
+
+    def _load_experiment(
+        self, experiment_name: str, lazy: bool = False
+    ) -> Experiment:
         with self._provider.get_readable_file() as f:
             experiment_group = f[EXPERIMENTS].get(experiment_name)
 
             if experiment_group is None:
                 raise GroupNotFound(f"Experiment {experiment_name} not found")
 
-            experiment = ExperimentSerializer().load(experiment_group)
+            experiment: Experiment = ExperimentSerializer().load(
+                experiment_group, LoadContext(f, self._memory_map, lazy)
+            )
 
         return experiment
 
+    def get_experiments(
+        self, names: Optional[Iterable[str]] = None, lazy: bool = False
+    ) -> Dict[str, Experiment]:
+        """
+        Retrieve many experiments from the adsorption database in a single pass over the storage file.
+
+        Adsorbates and adsorbents are deserialized once and shared by every experiment and isotherm referencing
+        them, so the returned experiments hold the same `Adsorbate` and `Adsorbent` instances.
+
+        If the database was created with `processes`, the experiments are split in contiguous chunks loaded by the
+        worker processes, and only experiments of the same chunk share instances. Lazy experiments are always loaded
+        in the calling thread, since their arrays are read from the storage file on access.
+
+        :param names: The names of the experiments to retrieve. Defaults to None, in which case every experiment is
+            retrieved.
+        :type names: Optional[Iterable[str]]
+        :param lazy: Whether to defer reading the isotherm arrays until they are accessed.
+        :type lazy: bool
+        :return: The experiments, by name, in the order of `names`.
+        :rtype: Dict[str, Experiment]
+        :raises GroupNotFound: If an experiment is not found in the adsorption database.
+        """
+        if self._cache is None or lazy:
+            return self._load_experiments(names, lazy)
+
+        if names is None:
+            names = self._list_experiment_groups()
+        names = list(names)
+
+        signature = self._get_storage_signature()
+        experiments: Dict[str, Experiment] = {}
+        missing: List[str] = []
+        for name in names:
+            experiment = self._cache.get((EXPERIMENTS, name), signature)
+            if experiment is None:
+                missing.append(name)
+            else:
+                experiments[name] = experiment
+
+        if missing:
+            for name, experiment in self._load_experiments(missing).items():
+                experiments[name] = self._cache.put(
+                    (EXPERIMENTS, name), experiment, signature
+                )
+
+        return {name: experiments[name] for name in names}
+
+    def _list_experiment_groups(self) -> List[str]:
+        with self._provider.get_readable_file() as f:
+            return list(f[EXPERIMENTS])
+
+    def _load_experiments(
+        self, names: Optional[Iterable[str]], lazy: bool = False
+    ) -> Dict[str, Experiment]:
+        if self._processes is None or lazy:
+            return _read_experiments(
+                self._provider, names, self._memory_map, lazy
+            )
+
+        if names is None:
+            names = self._list_experiment_groups()
+        names = list(names)
+        if not names:
+            return {}
+
+        chunk_size = -(-len(names) // self._processes)
+        file_path = self._provider.get_file_path().resolve()
+        pool = self._get_process_pool()
+        futures = []
+        for start in range(0, len(names), chunk_size):
+            stop = start + chunk_size
+            futures.append(
+                pool.submit(
+                    _read_experiments_in_worker, file_path, names[start:stop]
+                )
+            )
+
+        experiments: Dict[str, Experiment] = {}
+        for future in futures:
+            experiments.update(future.result())
+        return experiments
+
+    def find_isotherms(
+        self,
+        adsorbate: Optional[str] = None,
+        mixture: Optional[bool] = None,
+        isotherm_type: Optional[IsothermType] = None,
+        temperature_range: Optional[Range] = None,
+        pressure_range: Optional[Range] = None,
+        adsorbent_type: Optional[AdsorbentType] = None,
+        adsorbent_properties: Optional[Dict[str, Range]] = None,
+    ) -> List[IsothermHandle]:
+        """
+        Find the isotherms matching every given filter.
+
+        The query runs against the metadata catalog, so no isotherm is read from the storage file. The returned
+        handles are loaded with `load_isotherms`. Ranges are `(minimum, maximum)` tuples, inclusive, and either bound
+        may be None.
+
+        Example:
+            >>> handles = database.find_isotherms(
+            ...     adsorbate="CO2",
+            ...     temperature_range=(290, 310),
+            ...     adsorbent_type=AdsorbentType.ZEOLITE,
+            ...     adsorbent_properties={"si_al_ratio": (1.0, None)},
+            ... )
+            >>> isotherms = database.load_isotherms(handles)
+
+        :param adsorbate: The name or chemical formula of an adsorbate of the isotherm.
+        :type adsorbate: Optional[str]
+        :param mixture: True for mixture isotherms only, False for pure isotherms only.
+        :type mixture: Optional[bool]
+        :param isotherm_type: The isotherm type.
+        :type isotherm_type: Optional[IsothermType]
+        :param temperature_range: The range of the isotherm temperature.
+        :type temperature_range: Optional[Range]
+        :param pressure_range: The pressure range the isotherm points must cover.
+        :type pressure_range: Optional[Range]
+        :param adsorbent_type: The type of the experiment adsorbent.
+        :type adsorbent_type: Optional[AdsorbentType]
+        :param adsorbent_properties: The ranges of numeric adsorbent properties (`void_volume`, `density`,
+            `si_al_ratio`, `pellet_size`, `binder_content`), by name.
+        :type adsorbent_properties: Optional[Dict[str, Range]]
+        :return: The handles of the matching isotherms.
+        :rtype: List[IsothermHandle]
+        :raises ValueError: If an adsorbent property is unknown.
+        """
+        return self._get_catalog().find_isotherms(
+            adsorbate,
+            mixture,
+            isotherm_type,
+            temperature_range,
+            pressure_range,
+            adsorbent_type,
+            adsorbent_properties,
+        )
+
+    def load_isotherms(
+        self, handles: Iterable[IsothermHandle], lazy: bool = False
+    ) -> List[Union[MonoIsotherm, MixIsotherm]]:
+        """
+        Load the isotherms of the given handles, reading the storage file once.
+
+        :param handles: The isotherm handles, as returned by `find_isotherms`.
+        :type handles: Iterable[IsothermHandle]
+        :param lazy: Whether to defer reading the isotherm arrays until they are accessed.
+        :type lazy: bool
+        :return: The isotherms, in the order of the handles.
+        :rtype: List[Union[MonoIsotherm, MixIsotherm]]
+        :raises GroupNotFound: If an isotherm is no longer in the storage file.
+        """
+        return list(self._iter_loaded_isotherms(handles, lazy))
+
+    def iter_isotherms(
+        self,
+        kind: Optional[str] = None,
+        filter: Optional[Callable[[IsothermHandle], bool]] = None,
+        lazy: bool = False,
+    ) -> Iterator[Union[MonoIsotherm, MixIsotherm]]:
+        """
+        Iterate over the isotherms of the adsorption database, loading one at a time from a single open handle.
+
+        Only the catalog handles are listed up front; each isotherm is loaded when the iteration reaches it and can
+        be released as soon as the caller drops it, so memory stays bounded regardless of the database size. The
+        filter runs on the handles, so skipped isotherms are never read.
+
+        Example:
+            >>> for isotherm in database.iter_isotherms(
+            ...     MONO_ISOTHERMS, filter=lambda handle: handle.temperature > 300
+            ... ):
+            ...     process(isotherm)
+
+        :param kind: `MONO_ISOTHERMS` or `MIXTURE_ISOTHERMS`. Defaults to None, in which case both are iterated.
+        :type kind: Optional[str]
+        :param filter: A predicate on the isotherm handles, selecting the isotherms to load.
+        :type filter: Optional[Callable[[IsothermHandle], bool]]
+        :param lazy: Whether to defer reading the isotherm arrays until they are accessed.
+        :type lazy: bool
+        :return: The isotherms, in storage order.
+        :rtype: Iterator[Union[MonoIsotherm, MixIsotherm]]
+        :raises ValueError: If the kind is unknown.
+        """
+        if kind not in [None, MONO_ISOTHERMS, MIXTURE_ISOTHERMS]:
+            raise ValueError(f"Unknown isotherm kind {kind}")
+
+        handles = self.find_isotherms(
+            mixture=None if kind is None else kind == MIXTURE_ISOTHERMS
+        )
+        if filter is not None:
+            handles = [handle for handle in handles if filter(handle)]
+
+        yield from self._iter_loaded_isotherms(handles, lazy)
+
+    def iter_points(
+        self, kind: str = MONO_ISOTHERMS, batch_size: int = 65536
+    ) -> Iterator[Union[PurePointTable, MixturePointTable]]:
+        """
+        Iterate over the points of every isotherm of a kind, in point tables of about `batch_size` points.
+
+        Each batch holds whole isotherms and is read from a single open handle, sliced from the point store if the
+        storage file has an up to date one. Memory stays bounded by the batch size regardless of the database size.
+
+        :param kind: `MONO_ISOTHERMS` or `MIXTURE_ISOTHERMS`.
+        :type kind: str
+        :param batch_size: The minimum number of points of each batch, except the last one.
+        :type batch_size: int
+        :return: The point table of each batch.
+        :rtype: Iterator[Union[PurePointTable, MixturePointTable]]
+        :raises ValueError: If the kind is unknown or the batch size is not positive.
+        """
+        with self._provider.get_readable_file() as f:
+            yield from iter_point_tables(f, kind, batch_size)
+
+    def _iter_loaded_isotherms(
+        self, handles: Iterable[IsothermHandle], lazy: bool = False
+    ) -> Iterator[Union[MonoIsotherm, MixIsotherm]]:
+        mono_serializer = MonoIsothermSerializer()
+        mix_serializer = MixIsothermSerializer()
+
+        with self._provider.get_readable_file() as f:
+            context = LoadContext(f, self._memory_map, lazy)
+            for handle in handles:
+                isotherm_group = f.get(handle.route)
+                if isotherm_group is None:
+                    raise GroupNotFound(f"Isotherm {handle.route} not found")
+
+                serializer = (
+                    mix_serializer if handle.is_mixture else mono_serializer
+                )
+                yield serializer.load(isotherm_group, context)
+
     def get_adsorbate(self, name: str) -> Optional[Adsorbate]:
         """
         Retrieve an adsorbate with the given name from the adsorption database.
@@ -136,3 +655,31 @@ class AdsorptionDatabase:
         :rtype: Optional[Adsorbent]
         """
         return self._get_attr_only_obj(name, ADSORBENTS, Adsorbent)
+
+    def get_pure_points(self) -> PurePointTable:
+        """
+        Retrieve the points of every pure isotherm of the adsorption database as a single table.
+
+        The table is read in a few bulk reads from the consolidated point store, if the storage file has an up to
+        date one (see `point_store.is_point_store_fresh`), and built from the isotherm groups otherwise. With `memory_map`, the table
+        arrays are memory maps of the storage file.
+
+        :return: The pure isotherm points, concatenated, with the route of each isotherm and its offsets.
+        :rtype: PurePointTable
+        """
+        with self._provider.get_readable_file() as f:
+            return read_pure_point_table(f, self._memory_map)
+
+    def get_mixture_points(self) -> MixturePointTable:
+        """
+        Retrieve the points of every mixture isotherm of the adsorption database as a single table.
+
+        The table is read in a few bulk reads from the consolidated point store, if the storage file has an up to
+        date one (see `point_store.is_point_store_fresh`), and built from the isotherm groups otherwise. With `memory_map`, the table
+        arrays are memory maps of the storage file.
+
+        :return: The mixture isotherm points, concatenated, with the route of each isotherm and its offsets.
+        :rtype: MixturePointTable
+        """
+        with self._provider.get_readable_file() as f:
+            return read_mixture_point_table(f, self._memory_map)
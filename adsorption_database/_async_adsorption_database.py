@@ -0,0 +1,288 @@
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    TypeVar,
+    Union,
+)
+
+from adsorption_database._adsorption_database import AdsorptionDatabase
+from adsorption_database.catalog import Range
+from adsorption_database.defaults import MIXTURE_ISOTHERMS, MONO_ISOTHERMS
+from adsorption_database.models.adsorbate import Adsorbate
+from adsorption_database.models.adsorbent import Adsorbent, AdsorbentType
+from adsorption_database.models.experiment import Experiment
+from adsorption_database.models.isotherm_handle import IsothermHandle
+from adsorption_database.models.isotherms import (
+    IsothermType,
+    MixIsotherm,
+    MonoIsotherm,
+)
+from adsorption_database.models.points import (
+    MixturePointTable,
+    PurePointTable,
+)
+
+_T = TypeVar("_T")
+
+_NOT_SET: Any = object()
+
+
+class AsyncAdsorptionDatabase:
+    """
+    Asyncio front-end of `AdsorptionDatabase`, mirroring its public API as coroutines.
+
+    Every call runs the blocking h5py reads of a shared `AdsorptionDatabase` on a bounded thread pool, so the event
+    loop keeps serving other tasks. Calls share the pooled read handle of the storage file instead of reopening it.
+
+    At most `max_pending` calls are submitted to the pool at once; the others wait in the event loop, where they can
+    be cancelled for free. Each call is awaited for at most `timeout` seconds (or its own `timeout` argument), after
+    which `asyncio.TimeoutError` is raised. A call cancelled or timed out before a worker picks it up never runs; one
+    already running completes in the background, since threads can not be interrupted, and its result is dropped.
+
+    Example:
+        >>> async with AsyncAdsorptionDatabase(timeout=5) as database:
+        ...     experiment = await database.get_experiment("HEFTI-13x")
+    """
+
+    def __init__(
+        self,
+        database: Optional[AdsorptionDatabase] = None,
+        max_workers: int = 4,
+        max_pending: Optional[int] = None,
+        timeout: Optional[float] = None,
+    ) -> None:
+        """
+        Args:
+            database (Optional[AdsorptionDatabase]): The database the calls are dispatched to. Defaults to None, in
+                which case a new one is created.
+            max_workers (int): The number of worker threads. Defaults to 4.
+            max_pending (Optional[int]): The maximum number of calls submitted to the workers at once. Defaults to
+                None, in which case it is twice `max_workers`.
+            timeout (Optional[float]): The default timeout of each call, in seconds. Defaults to None (no timeout).
+        """
+        self._database = (
+            database if database is not None else AdsorptionDatabase()
+        )
+        self._executor = ThreadPoolExecutor(
+            max_workers, thread_name_prefix="adsorption-database"
+        )
+        self._max_pending = (
+            max_pending if max_pending is not None else 2 * max_workers
+        )
+        self._timeout = timeout
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._semaphore_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    async def __aenter__(self) -> "AsyncAdsorptionDatabase":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.close()
+
+    @property
+    def database(self) -> AdsorptionDatabase:
+        return self._database
+
+    async def close(self) -> None:
+        """
+        Wait for the running calls, then stop the workers and close the read handle to the storage file.
+        """
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(
+            None, functools.partial(self._executor.shutdown, wait=True)
+        )
+        self._database.close()
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        # Semaphores are bound to the event loop they are first used in
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._semaphore_loop is not loop:
+            self._semaphore = asyncio.Semaphore(self._max_pending)
+            self._semaphore_loop = loop
+        return self._semaphore
+
+    async def _run(
+        self,
+        function: Callable[..., _T],
+        *args: Any,
+        timeout: Optional[float] = _NOT_SET,
+        **kwargs: Any,
+    ) -> _T:
+        if timeout is _NOT_SET:
+            timeout = self._timeout
+
+        loop = asyncio.get_running_loop()
+        async with self._get_semaphore():
+            future = loop.run_in_executor(
+                self._executor, functools.partial(function, *args, **kwargs)
+            )
+            return await asyncio.wait_for(future, timeout)
+
+    async def list_experiments(
+        self,
+        adsorbate: Optional[str] = None,
+        adsorbent: Optional[str] = None,
+        temperature: Optional[float] = None,
+        temperature_tolerance: float = 0.5,
+        timeout: Optional[float] = _NOT_SET,
+    ) -> List[str]:
+        return await self._run(
+            self._database.list_experiments,
+            adsorbate,
+            adsorbent,
+            temperature,
+            temperature_tolerance,
+            timeout=timeout,
+        )
+
+    async def list_adsorbates(
+        self, timeout: Optional[float] = _NOT_SET
+    ) -> List[str]:
+        return await self._run(self._database.list_adsorbates, timeout=timeout)
+
+    async def list_adsorbents(
+        self, timeout: Optional[float] = _NOT_SET
+    ) -> List[str]:
+        return await self._run(self._database.list_adsorbents, timeout=timeout)
+
+    async def list_pure_isotherms(
+        self, experiment_name: str, timeout: Optional[float] = _NOT_SET
+    ) -> List[str]:
+        return await self._run(
+            self._database.list_pure_isotherms,
+            experiment_name,
+            timeout=timeout,
+        )
+
+    async def list_mixture_isotherms(
+        self, experiment_name: str, timeout: Optional[float] = _NOT_SET
+    ) -> List[str]:
+        return await self._run(
+            self._database.list_mixture_isotherms,
+            experiment_name,
+            timeout=timeout,
+        )
+
+    async def rebuild_index(self, timeout: Optional[float] = _NOT_SET) -> None:
+        await self._run(self._database.rebuild_index, timeout=timeout)
+
+    async def get_experiment(
+        self,
+        experiment_name: str,
+        lazy: bool = False,
+        timeout: Optional[float] = _NOT_SET,
+    ) -> Optional[Experiment]:
+        return await self._run(
+            self._database.get_experiment,
+            experiment_name,
+            lazy,
+            timeout=timeout,
+        )
+
+    async def get_experiments(
+        self,
+        names: Optional[Iterable[str]] = None,
+        lazy: bool = False,
+        timeout: Optional[float] = _NOT_SET,
+    ) -> Dict[str, Experiment]:
+        return await self._run(
+            self._database.get_experiments, names, lazy, timeout=timeout
+        )
+
+    async def get_adsorbate(
+        self, name: str, timeout: Optional[float] = _NOT_SET
+    ) -> Optional[Adsorbate]:
+        return await self._run(
+            self._database.get_adsorbate, name, timeout=timeout
+        )
+
+    async def get_adsorbent(
+        self, name: str, timeout: Optional[float] = _NOT_SET
+    ) -> Optional[Adsorbent]:
+        return await self._run(
+            self._database.get_adsorbent, name, timeout=timeout
+        )
+
+    async def find_isotherms(
+        self,
+        adsorbate: Optional[str] = None,
+        mixture: Optional[bool] = None,
+        isotherm_type: Optional[IsothermType] = None,
+        temperature_range: Optional[Range] = None,
+        pressure_range: Optional[Range] = None,
+        adsorbent_type: Optional[AdsorbentType] = None,
+        adsorbent_properties: Optional[Dict[str, Range]] = None,
+        timeout: Optional[float] = _NOT_SET,
+    ) -> List[IsothermHandle]:
+        return await self._run(
+            self._database.find_isotherms,
+            adsorbate,
+            mixture,
+            isotherm_type,
+            temperature_range,
+            pressure_range,
+            adsorbent_type,
+            adsorbent_properties,
+            timeout=timeout,
+        )
+
+    async def load_isotherms(
+        self,
+        handles: Iterable[IsothermHandle],
+        lazy: bool = False,
+        timeout: Optional[float] = _NOT_SET,
+    ) -> List[Union[MonoIsotherm, MixIsotherm]]:
+        return await self._run(
+            self._database.load_isotherms,
+            list(handles),
+            lazy,
+            timeout=timeout,
+        )
+
+    async def iter_isotherms(
+        self,
+        kind: Optional[str] = None,
+        filter: Optional[Callable[[IsothermHandle], bool]] = None,
+        lazy: bool = False,
+        timeout: Optional[float] = _NOT_SET,
+    ) -> AsyncIterator[Union[MonoIsotherm, MixIsotherm]]:
+        """
+        Iterate over the isotherms of the adsorption database, loading each one on the workers.
+
+        The timeout applies to the loading of each isotherm.
+        """
+        if kind not in [None, MONO_ISOTHERMS, MIXTURE_ISOTHERMS]:
+            raise ValueError(f"Unknown isotherm kind {kind}")
+
+        handles = await self.find_isotherms(
+            mixture=None if kind is None else kind == MIXTURE_ISOTHERMS,
+            timeout=timeout,
+        )
+        if filter is not None:
+            handles = [handle for handle in handles if filter(handle)]
+
+        for handle in handles:
+            isotherms = await self.load_isotherms(
+                [handle], lazy, timeout=timeout
+            )
+            yield isotherms[0]
+
+    async def get_pure_points(
+        self, timeout: Optional[float] = _NOT_SET
+    ) -> PurePointTable:
+        return await self._run(self._database.get_pure_points, timeout=timeout)
+
+    async def get_mixture_points(
+        self, timeout: Optional[float] = _NOT_SET
+    ) -> MixturePointTable:
+        return await self._run(
+            self._database.get_mixture_points, timeout=timeout
+        )
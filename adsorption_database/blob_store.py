@@ -0,0 +1,140 @@
+from typing import Any, Dict, Tuple
+
+import numpy as np
+import numpy.typing as npt
+from attr import define
+from h5py import Dataset, Group, h5o
+
+from adsorption_database.content_hash import get_content_hash
+from adsorption_database.defaults import BLOBS
+
+
+@define
+class DeduplicationReport:
+    """
+    The content-addressed datasets of a storage file and the space they save.
+
+    Attributes:
+        blobs (int): The datasets stored under the `Blobs` group.
+        links (int): The links to blobs from outside the `Blobs` group.
+        bytes_stored (int): The bytes of array data held by the blobs.
+        bytes_saved (int): The bytes that would be stored again if every link held its own copy.
+    """
+
+    blobs: int = 0
+    links: int = 0
+    bytes_stored: int = 0
+    bytes_saved: int = 0
+
+
+def get_link_count(dataset: Dataset) -> int:
+    """
+    Get the number of hard links to a dataset.
+
+    Args:
+        dataset (Dataset): The dataset.
+
+    Returns:
+        int: The number of hard links, including the one it was opened from.
+    """
+    return int(h5o.get_info(dataset.id).rc)
+
+
+def is_shared(dataset: Dataset) -> bool:
+    """
+    Check whether a dataset is reachable through more than one hard link, so writing to it changes every link.
+
+    Args:
+        dataset (Dataset): The dataset.
+
+    Returns:
+        bool: True if the dataset has several hard links.
+    """
+    return get_link_count(dataset) > 1
+
+
+def get_blob_name(values: npt.NDArray[Any]) -> str:
+    """
+    Get the name of the blob holding an array: the content hash of its dtype, shape and data.
+
+    Args:
+        values (np.ndarray): The array.
+
+    Returns:
+        str: The blob name.
+    """
+    return get_content_hash(np.asarray(values))
+
+
+def require_blob(
+    file: Group, values: npt.NDArray[Any], kwargs: Dict[str, Any]
+) -> Tuple[Dataset, bool]:
+    """
+    Get the blob holding an array, creating it if no blob holds the same content.
+
+    Args:
+        file (Group): The storage file.
+        values (np.ndarray): The array.
+        kwargs (Dict[str, Any]): The `h5py.Group.create_dataset` layout arguments of a new blob.
+
+    Returns:
+        Tuple[Dataset, bool]: The blob, and whether it was created.
+    """
+    blobs = file.require_group(BLOBS)
+    name = get_blob_name(values)
+
+    blob = blobs.get(name)
+    if blob is not None:
+        return blob, False
+
+    return blobs.create_dataset(name, data=values, **kwargs), True
+
+
+def get_deduplication_report(file: Group) -> DeduplicationReport:
+    """
+    Report the blobs of a storage file and the bytes saved by linking them instead of storing copies.
+
+    Args:
+        file (Group): The storage file.
+
+    Returns:
+        DeduplicationReport: The blob, link and byte counts.
+    """
+    report = DeduplicationReport()
+    blobs = file.get(BLOBS)
+    if blobs is None:
+        return report
+
+    for blob in blobs.values():
+        links = get_link_count(blob) - 1
+        report.blobs += 1
+        report.links += links
+        report.bytes_stored += blob.nbytes
+        report.bytes_saved += max(links - 1, 0) * blob.nbytes
+
+    return report
+
+
+def prune_blobs(file: Group) -> int:
+    """
+    Delete the blobs no longer linked from outside the `Blobs` group.
+
+    As with any deleted dataset, their space is only reclaimed by `StorageProvider.compact`.
+
+    Args:
+        file (Group): The storage file, open for writing.
+
+    Returns:
+        int: The number of blobs deleted.
+    """
+    blobs = file.get(BLOBS)
+    if blobs is None:
+        return 0
+
+    orphans = [
+        name for name, blob in blobs.items() if get_link_count(blob) <= 1
+    ]
+    for name in orphans:
+        del blobs[name]
+
+    return len(orphans)
@@ -0,0 +1,189 @@
+import sys
+import threading
+from collections import OrderedDict
+from typing import Any, Hashable, Iterator, Optional, Set, Tuple
+
+import attr
+import numpy as np
+from attrs import define
+
+from adsorption_database.datasets import LazyDataset
+from adsorption_database.storage_provider import FileSignature
+
+DEFAULT_CACHE_SIZE = 256 * 1024**2
+
+
+@define(frozen=True)
+class CacheInfo:
+    hits: int
+    misses: int
+    entries: int
+    size: int
+    max_size: int
+
+
+def _iter_values(value: Any, seen: Set[int]) -> Iterator[Any]:
+    if id(value) in seen:
+        return
+    seen.add(id(value))
+    yield value
+
+    if attr.has(type(value)):
+        for field in attr.fields(type(value)):
+            yield from _iter_values(getattr(value, field.name), seen)
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            yield from _iter_values(item, seen)
+
+
+def freeze(value: Any) -> Any:
+    """
+    Make every array of a loaded object read-only, in place.
+
+    Args:
+        value (Any): A model instance, or a list of them.
+
+    Returns:
+        Any: The same value.
+    """
+    for item in _iter_values(value, set()):
+        if isinstance(item, np.ndarray):
+            item.flags.writeable = False
+    return value
+
+
+def get_size(value: Any) -> int:
+    """
+    Estimate the memory held by a loaded object, as the size of every object reachable from it.
+
+    Objects shared by several parts of the value (e.g. the adsorbate of many isotherms) are counted once.
+
+    Args:
+        value (Any): A model instance, or a list of them.
+
+    Returns:
+        int: The estimated size, in bytes.
+    """
+    # The size of arrays includes their data, unless they are views or memory maps
+    return sum(sys.getsizeof(item) for item in _iter_values(value, set()))
+
+
+class ObjectCache:
+    """
+    A thread-safe LRU cache of loaded objects with a budget in bytes.
+
+    Entries belong to a version of the storage file, identified by its signature (see `get_file_signature`). Every
+    lookup passes the current signature, and the whole cache is cleared when it changed, so objects loaded before a
+    write (through the handlers or by any other process) are never returned afterwards.
+
+    Cached objects are shared by every caller: their arrays are made read-only when they are stored.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_CACHE_SIZE) -> None:
+        """
+        Args:
+            max_size (int): The maximum estimated size of the cached objects, in bytes. Objects larger than it are
+                never cached. Defaults to 256 MiB.
+        """
+        self._max_size = max_size
+        self._entries: "OrderedDict[Hashable, Tuple[Any, int]]" = OrderedDict()
+        self._size = 0
+        self._signature: Optional[FileSignature] = None
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable, signature: FileSignature) -> Optional[Any]:
+        """
+        Get a cached object, clearing the cache first if the storage file changed.
+
+        Args:
+            key (Hashable): The object key.
+            signature (FileSignature): The current signature of the storage file.
+
+        Returns:
+            Optional[Any]: The cached object, or None if it is not cached.
+        """
+        with self._lock:
+            if signature != self._signature:
+                self._clear()
+                self._signature = signature
+
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry[0]
+
+    def put(self, key: Hashable, value: Any, signature: FileSignature) -> Any:
+        """
+        Cache an object loaded from the given version of the storage file, evicting the least recently used ones.
+
+        Objects holding lazy datasets are not cached, since their arrays are read on access.
+
+        Args:
+            key (Hashable): The object key.
+            value (Any): The loaded object.
+            signature (FileSignature): The signature of the storage file, taken before loading the object.
+
+        Returns:
+            Any: The value, with read-only arrays if it was cached. Values left out of the cache are unchanged.
+        """
+        if any(
+            isinstance(item, LazyDataset)
+            for item in _iter_values(value, set())
+        ):
+            return value
+
+        size = get_size(value)
+        with self._lock:
+            if signature != self._signature or size > self._max_size:
+                return value
+
+            freeze(value)
+            self._discard(key)
+            self._entries[key] = (value, size)
+            self._size += size
+
+            while self._size > self._max_size:
+                self._discard(next(iter(self._entries)))
+
+        return value
+
+    def clear(self) -> None:
+        """
+        Drop every cached object. Counters are kept.
+        """
+        with self._lock:
+            self._clear()
+
+    def get_info(self) -> CacheInfo:
+        """
+        Get the cache counters.
+
+        Returns:
+            CacheInfo: The hits, misses, number of entries, size and maximum size of the cache.
+        """
+        with self._lock:
+            return CacheInfo(
+                self._hits,
+                self._misses,
+                len(self._entries),
+                self._size,
+                self._max_size,
+            )
+
+    def _clear(self) -> None:
+        self._entries.clear()
+        self._size = 0
+
+    def _discard(self, key: Hashable) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._size -= entry[1]
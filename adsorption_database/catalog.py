@@ -0,0 +1,726 @@
+import json
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+from h5py import Group
+
+from adsorption_database.datasets import LazyDataset
+from adsorption_database.defaults import (
+    ADSORBATES,
+    ADSORBENTS,
+    EXPERIMENTS,
+    MIXTURE_ISOTHERMS,
+    MONO_ISOTHERMS,
+)
+from adsorption_database.models.adsorbate import Adsorbate
+from adsorption_database.models.adsorbent import Adsorbent, AdsorbentType
+from adsorption_database.models.experiment import Experiment
+from adsorption_database.models.isotherm_handle import IsothermHandle
+from adsorption_database.models.isotherms import Isotherm, IsothermType
+from adsorption_database.serializers.attrs_serializer import AttrOnlySerializer
+from adsorption_database.serializers.experiment_serializer import (
+    ExperimentSerializer,
+)
+from adsorption_database.serializers.load_context import LoadContext
+from adsorption_database.shared import get_isotherm_store_name
+from adsorption_database.storage_provider import get_file_signature
+
+CATALOG_VERSION = 2
+
+CATALOG_SUFFIX = ".catalog.sqlite"
+
+_TABLES = [
+    "meta",
+    "adsorbates",
+    "adsorbents",
+    "experiments",
+    "isotherms",
+    "isotherm_adsorbates",
+]
+
+ADSORBENT_PROPERTIES = [
+    "void_volume",
+    "density",
+    "si_al_ratio",
+    "pellet_size",
+    "binder_content",
+]
+
+Range = Tuple[Optional[float], Optional[float]]
+
+_SEPARATOR = "\x1f"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS adsorbates (
+    name TEXT PRIMARY KEY,
+    chemical_formula TEXT
+);
+CREATE TABLE IF NOT EXISTS adsorbents (
+    name TEXT PRIMARY KEY,
+    type TEXT,
+    manufacturer TEXT,
+    void_volume REAL,
+    density REAL,
+    si_al_ratio REAL,
+    pellet_size REAL,
+    binder_content REAL
+);
+CREATE TABLE IF NOT EXISTS experiments (
+    name TEXT PRIMARY KEY,
+    adsorbent TEXT,
+    experiment_type TEXT,
+    year TEXT
+);
+CREATE TABLE IF NOT EXISTS isotherms (
+    route TEXT PRIMARY KEY,
+    experiment TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    store_name TEXT NOT NULL,
+    name TEXT NOT NULL,
+    isotherm_type TEXT,
+    temperature REAL,
+    points INTEGER NOT NULL,
+    min_pressure REAL,
+    max_pressure REAL
+);
+CREATE INDEX IF NOT EXISTS isotherms_experiment
+    ON isotherms (experiment, kind);
+CREATE TABLE IF NOT EXISTS isotherm_adsorbates (
+    route TEXT NOT NULL,
+    adsorbate TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    PRIMARY KEY (route, adsorbate)
+);
+CREATE INDEX IF NOT EXISTS isotherm_adsorbates_adsorbate
+    ON isotherm_adsorbates (adsorbate);
+"""
+
+
+def _create_schema(connection: sqlite3.Connection) -> None:
+    for statement in _SCHEMA.split(";"):
+        if statement.strip():
+            connection.execute(statement)
+
+
+@contextmanager
+def _transaction(
+    connection: sqlite3.Connection,
+) -> Iterator[sqlite3.Connection]:
+    # Connections are opened in autocommit mode, so schema changes are part of the explicit transaction
+    connection.execute("BEGIN")
+    try:
+        yield connection
+    except BaseException:
+        connection.execute("ROLLBACK")
+        raise
+    connection.execute("COMMIT")
+
+
+def get_catalog_path(storage_path: Path) -> Optional[Path]:
+    """
+    Get the path of the catalog sidecar of a storage file.
+
+    Args:
+        storage_path (Path): The storage file path.
+
+    Returns:
+        Optional[Path]: The sidecar path, next to the storage file, or None if its folder is not writable.
+    """
+    if not os.access(storage_path.parent, os.W_OK):
+        return None
+    return storage_path.with_name(storage_path.name + CATALOG_SUFFIX)
+
+
+def get_isotherm_route(
+    experiment_name: str, kind: str, store_name: str
+) -> str:
+    return f"/{EXPERIMENTS}/{experiment_name}/{kind}/{store_name}"
+
+
+def _get_value(value: Any) -> Any:
+    return getattr(value, "value", value)
+
+
+def _add_range_conditions(
+    column: str,
+    value_range: Range,
+    conditions: List[str],
+    parameters: List[Any],
+) -> None:
+    minimum, maximum = value_range
+    if minimum is not None:
+        conditions.append(f"{column} >= ?")
+        parameters.append(minimum)
+    if maximum is not None:
+        conditions.append(f"{column} <= ?")
+        parameters.append(maximum)
+
+
+def _add_condition(
+    condition: str,
+    values: List[Any],
+    conditions: List[str],
+    parameters: List[Any],
+) -> None:
+    conditions.append(condition)
+    parameters.extend(values)
+
+
+def _add_pressure_coverage_conditions(
+    pressure_range: Range, conditions: List[str], parameters: List[Any]
+) -> None:
+    # The points must cover the range, so each bound is compared with the opposite pressure extreme
+    minimum, maximum = pressure_range
+    if minimum is not None:
+        _add_condition(
+            "isotherms.min_pressure <= ?", [minimum], conditions, parameters
+        )
+    if maximum is not None:
+        _add_condition(
+            "isotherms.max_pressure >= ?", [maximum], conditions, parameters
+        )
+
+
+def _add_adsorbent_property_conditions(
+    adsorbent_properties: Dict[str, Range],
+    conditions: List[str],
+    parameters: List[Any],
+) -> None:
+    for name, value_range in adsorbent_properties.items():
+        if name not in ADSORBENT_PROPERTIES:
+            raise ValueError(f"Unknown adsorbent property {name}")
+        _add_range_conditions(
+            f"adsorbents.{name}", value_range, conditions, parameters
+        )
+
+
+def _get_pressure_range(
+    pressures: Any, file: Optional[Group] = None
+) -> Tuple[int, Optional[float], Optional[float]]:
+    # Lazy pressures are read from the open storage file, rather than through a read handle of their own
+    if isinstance(pressures, LazyDataset) and file is not None:
+        pressures = file[pressures.route][()]
+    pressures = np.asarray(pressures, dtype=np.float64)
+    if pressures.size == 0 or np.isnan(pressures).all():
+        return pressures.size, None, None
+    return (
+        pressures.size,
+        float(np.nanmin(pressures)),
+        float(np.nanmax(pressures)),
+    )
+
+
+class Catalog:
+    """
+    Metadata catalog of a storage file, kept in a `sqlite3` sidecar next to it.
+
+    The catalog holds one row per experiment, isotherm, adsorbate and adsorbent, with the isotherm temperature,
+    point count and pressure range, so listing and filtering never open isotherm groups. It records the signature of
+    the storage file it describes: a catalog whose signature does not match the file on disk (written by an older
+    version, or by code that bypassed the handlers) is stale and must be rebuilt.
+
+    Without a sidecar path, the catalog lives in memory for the lifetime of the object.
+
+    Connections are opened on first use and kept until `close`: one per thread for a sidecar, a single shared one in
+    memory. The schema is created by the first connection only.
+    """
+
+    def __init__(
+        self, storage_path: Path, catalog_path: Optional[Path] = None
+    ) -> None:
+        self.storage_path = storage_path
+        self.catalog_path = catalog_path
+        self._lock = threading.RLock()
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._memory_connection: Optional[sqlite3.Connection] = None
+        self._has_schema = False
+
+    @contextmanager
+    def connect(self) -> Iterator[sqlite3.Connection]:
+        """
+        Get the connection of the current thread to the catalog, within a transaction committed on exit and rolled
+        back on errors.
+
+        Returns:
+            sqlite3.Connection: The connection.
+        """
+        with self._lock:
+            with _transaction(self._get_connection()) as connection:
+                yield connection
+
+    def close(self) -> None:
+        """
+        Close every connection to the catalog. New ones are opened on the next query.
+        """
+        with self._lock:
+            for connection in self._connections:
+                connection.close()
+            self._connections = []
+            self._local = threading.local()
+            self._memory_connection = None
+            self._has_schema = False
+
+    def _get_connection(self) -> sqlite3.Connection:
+        if self.catalog_path is None:
+            if self._memory_connection is None:
+                self._memory_connection = self._open_connection(":memory:")
+            return self._memory_connection
+
+        connection: Optional[sqlite3.Connection] = getattr(
+            self._local, "connection", None
+        )
+        if connection is None:
+            connection = self._open_connection(str(self.catalog_path))
+            self._local.connection = connection
+        return connection
+
+    def _open_connection(self, database: str) -> sqlite3.Connection:
+        # Connections are only used by the thread that opened them, but may be closed by any thread
+        connection = sqlite3.connect(
+            database, isolation_level=None, check_same_thread=False
+        )
+        self._connections.append(connection)
+
+        if not self._has_schema:
+            with _transaction(connection):
+                _create_schema(connection)
+            self._has_schema = True
+        return connection
+
+    def get_storage_signature(self) -> str:
+        if not self.storage_path.exists():
+            return ""
+        return json.dumps(
+            [CATALOG_VERSION, *get_file_signature(self.storage_path)]
+        )
+
+    def is_fresh(self) -> bool:
+        """
+        Check whether the catalog describes the storage file as it is on disk.
+
+        Returns:
+            bool: True if the catalog signature matches the storage file.
+        """
+        with self.connect() as connection:
+            row = connection.execute(
+                "SELECT value FROM meta WHERE key = 'signature'"
+            ).fetchone()
+        return row is not None and row[0] == self.get_storage_signature()
+
+    def rebuild(self, file: Group, signature: Optional[str] = None) -> None:
+        """
+        Rebuild the catalog from the storage file.
+
+        Experiments are loaded lazily: only attributes, dataset shapes and the pressures of every isotherm, for its
+        pressure range, are read.
+
+        Args:
+            file (Group): The storage file, open for reading.
+            signature (Optional[str]): The storage signature taken before the file was opened. Defaults to the
+                current signature.
+        """
+        if signature is None:
+            signature = self.get_storage_signature()
+
+        adsorbate_serializer = AttrOnlySerializer(Adsorbate)
+        adsorbent_serializer = AttrOnlySerializer(Adsorbent)
+        experiment_serializer = ExperimentSerializer()
+        context = LoadContext(file, lazy=True)
+
+        with self.connect() as connection:
+            # Drop rather than empty the tables, since the catalog may have been written with an older schema
+            for table in _TABLES:
+                connection.execute(f"DROP TABLE IF EXISTS {table}")
+            _create_schema(connection)
+
+            for name in file.get(ADSORBATES, {}):
+                self._add_adsorbate(
+                    connection,
+                    adsorbate_serializer.load(file[ADSORBATES][name]),
+                )
+            for name in file.get(ADSORBENTS, {}):
+                self._add_adsorbent(
+                    connection,
+                    adsorbent_serializer.load(file[ADSORBENTS][name]),
+                )
+            for name in file.get(EXPERIMENTS, {}):
+                try:
+                    experiment = experiment_serializer.load(
+                        file[EXPERIMENTS][name], context
+                    )
+                except (KeyError, TypeError, ValueError):
+                    # Incomplete experiments are still listed, like their groups are, but have no isotherms
+                    connection.execute(
+                        "INSERT OR REPLACE INTO experiments (name) VALUES (?)",
+                        (name,),
+                    )
+                    continue
+                self._add_experiment(connection, experiment, file)
+
+            self._set_signature(connection, signature)
+
+    def update(
+        self,
+        experiments: Iterable[Experiment] = (),
+        adsorbates: Iterable[Adsorbate] = (),
+        adsorbents: Iterable[Adsorbent] = (),
+    ) -> None:
+        """
+        Upsert registered objects in the catalog, and record the current signature of the storage file.
+
+        Only call this on a fresh catalog, right after the objects were written: the catalog is assumed to describe
+        the rest of the file.
+
+        Args:
+            experiments (Iterable[Experiment]): The registered experiments.
+            adsorbates (Iterable[Adsorbate]): The registered adsorbates.
+            adsorbents (Iterable[Adsorbent]): The registered adsorbents.
+        """
+        with self.connect() as connection:
+            for adsorbate in adsorbates:
+                self._add_adsorbate(connection, adsorbate)
+            for adsorbent in adsorbents:
+                self._add_adsorbent(connection, adsorbent)
+            for experiment in experiments:
+                self._add_experiment(connection, experiment)
+
+            self._set_signature(connection, self.get_storage_signature())
+
+    def list_names(self, table: str) -> List[str]:
+        """
+        List the names of the rows of a table, sorted by name.
+
+        Args:
+            table (str): One of `experiments`, `adsorbates` or `adsorbents`.
+
+        Returns:
+            List[str]: The names.
+        """
+        if table not in ["experiments", "adsorbates", "adsorbents"]:
+            raise ValueError(f"Unknown catalog table {table}")
+
+        with self.connect() as connection:
+            rows = connection.execute(
+                f"SELECT name FROM {table} ORDER BY name"
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def list_isotherms(self, experiment_name: str, kind: str) -> List[str]:
+        """
+        List the stored names of the isotherms of an experiment.
+
+        Args:
+            experiment_name (str): The experiment name.
+            kind (str): `MONO_ISOTHERMS` or `MIXTURE_ISOTHERMS`.
+
+        Returns:
+            List[str]: The stored isotherm names.
+        """
+        with self.connect() as connection:
+            rows = connection.execute(
+                "SELECT store_name FROM isotherms"
+                " WHERE experiment = ? AND kind = ? ORDER BY store_name",
+                (experiment_name, kind),
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def find_experiments(
+        self,
+        adsorbate: Optional[str] = None,
+        adsorbent: Optional[str] = None,
+        temperature: Optional[float] = None,
+        temperature_tolerance: float = 0.5,
+    ) -> List[str]:
+        """
+        List the experiments with at least one isotherm matching every given filter.
+
+        Args:
+            adsorbate (Optional[str]): The name or chemical formula of an adsorbate of the isotherm.
+            adsorbent (Optional[str]): The adsorbent name of the experiment.
+            temperature (Optional[float]): The isotherm temperature.
+            temperature_tolerance (float): The maximum distance to `temperature`. Defaults to 0.5.
+
+        Returns:
+            List[str]: The experiment names.
+        """
+        query = (
+            "SELECT DISTINCT experiments.name FROM experiments"
+            " LEFT JOIN isotherms ON isotherms.experiment = experiments.name"
+        )
+        conditions: List[str] = []
+        parameters: List[Any] = []
+
+        if adsorbate is not None:
+            conditions.append(
+                "isotherms.route IN (SELECT route FROM isotherm_adsorbates"
+                " JOIN adsorbates ON adsorbates.name = adsorbate"
+                " WHERE adsorbate = ? OR chemical_formula = ?)"
+            )
+            parameters.extend([adsorbate, adsorbate])
+        if adsorbent is not None:
+            conditions.append("experiments.adsorbent = ?")
+            parameters.append(adsorbent)
+        if temperature is not None:
+            conditions.append("isotherms.temperature BETWEEN ? AND ?")
+            parameters.extend(
+                [
+                    temperature - temperature_tolerance,
+                    temperature + temperature_tolerance,
+                ]
+            )
+
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += " ORDER BY experiments.name"
+
+        with self.connect() as connection:
+            rows = connection.execute(query, parameters).fetchall()
+        return [row[0] for row in rows]
+
+    def find_isotherms(
+        self,
+        adsorbate: Optional[str] = None,
+        mixture: Optional[bool] = None,
+        isotherm_type: Optional[IsothermType] = None,
+        temperature_range: Optional[Range] = None,
+        pressure_range: Optional[Range] = None,
+        adsorbent_type: Optional[AdsorbentType] = None,
+        adsorbent_properties: Optional[Dict[str, Range]] = None,
+    ) -> List[IsothermHandle]:
+        """
+        Find the isotherms matching every given filter.
+
+        Ranges are inclusive, and either of their bounds may be None.
+
+        Args:
+            adsorbate (Optional[str]): The name or chemical formula of an adsorbate of the isotherm.
+            mixture (Optional[bool]): True for mixture isotherms only, False for pure isotherms only.
+            isotherm_type (Optional[IsothermType]): The isotherm type.
+            temperature_range (Optional[Range]): The range of the isotherm temperature.
+            pressure_range (Optional[Range]): The pressure range the isotherm points must cover.
+            adsorbent_type (Optional[AdsorbentType]): The type of the experiment adsorbent.
+            adsorbent_properties (Optional[Dict[str, Range]]): The ranges of numeric adsorbent properties, by name
+                (one of `ADSORBENT_PROPERTIES`). Adsorbents without the property do not match.
+
+        Returns:
+            List[IsothermHandle]: The handles of the matching isotherms, ordered by route.
+
+        Raises:
+            ValueError: If an adsorbent property is unknown.
+        """
+        conditions: List[str] = []
+        parameters: List[Any] = []
+
+        if adsorbate is not None:
+            _add_condition(
+                "isotherms.route IN (SELECT route FROM isotherm_adsorbates"
+                " JOIN adsorbates ON adsorbates.name = adsorbate"
+                " WHERE adsorbate = ? OR chemical_formula = ?)",
+                [adsorbate, adsorbate],
+                conditions,
+                parameters,
+            )
+        if mixture is not None:
+            kind = MIXTURE_ISOTHERMS if mixture else MONO_ISOTHERMS
+            _add_condition(
+                "isotherms.kind = ?", [kind], conditions, parameters
+            )
+        if isotherm_type is not None:
+            _add_condition(
+                "isotherms.isotherm_type = ?",
+                [isotherm_type.value],
+                conditions,
+                parameters,
+            )
+        if temperature_range is not None:
+            _add_range_conditions(
+                "isotherms.temperature",
+                temperature_range,
+                conditions,
+                parameters,
+            )
+        if pressure_range is not None:
+            _add_pressure_coverage_conditions(
+                pressure_range, conditions, parameters
+            )
+        if adsorbent_type is not None:
+            _add_condition(
+                "adsorbents.type = ?",
+                [adsorbent_type.value],
+                conditions,
+                parameters,
+            )
+        _add_adsorbent_property_conditions(
+            adsorbent_properties or {}, conditions, parameters
+        )
+
+        query = (
+            "SELECT isotherms.route, isotherms.experiment, isotherms.kind,"
+            " isotherms.name, isotherms.isotherm_type, isotherms.temperature,"
+            " isotherms.points, isotherms.min_pressure, isotherms.max_pressure,"
+            " (SELECT group_concat(adsorbate, ?) FROM ("
+            "  SELECT adsorbate FROM isotherm_adsorbates"
+            "  WHERE isotherm_adsorbates.route = isotherms.route"
+            "  ORDER BY position))"
+            " FROM isotherms"
+            " JOIN experiments ON experiments.name = isotherms.experiment"
+            " LEFT JOIN adsorbents ON adsorbents.name = experiments.adsorbent"
+        )
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += " ORDER BY isotherms.route"
+
+        with self.connect() as connection:
+            rows = connection.execute(
+                query, [_SEPARATOR, *parameters]
+            ).fetchall()
+
+        return [
+            IsothermHandle(
+                route=route,
+                experiment=experiment,
+                kind=kind,
+                name=name,
+                isotherm_type=IsothermType(isotherm_type),
+                temperature=temperature,
+                adsorbates=(
+                    tuple(adsorbates.split(_SEPARATOR)) if adsorbates else ()
+                ),
+                points=points,
+                min_pressure=min_pressure,
+                max_pressure=max_pressure,
+            )
+            for (
+                route,
+                experiment,
+                kind,
+                name,
+                isotherm_type,
+                temperature,
+                points,
+                min_pressure,
+                max_pressure,
+                adsorbates,
+            ) in rows
+        ]
+
+    def _set_signature(
+        self, connection: sqlite3.Connection, signature: str
+    ) -> None:
+        connection.execute(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES ('signature', ?)",
+            (signature,),
+        )
+
+    def _add_adsorbate(
+        self, connection: sqlite3.Connection, adsorbate: Adsorbate
+    ) -> None:
+        connection.execute(
+            "INSERT OR REPLACE INTO adsorbates VALUES (?, ?)",
+            (adsorbate.name, adsorbate.chemical_formula),
+        )
+
+    def _add_adsorbent(
+        self, connection: sqlite3.Connection, adsorbent: Adsorbent
+    ) -> None:
+        connection.execute(
+            "INSERT OR REPLACE INTO adsorbents VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                adsorbent.name,
+                _get_value(adsorbent.type),
+                adsorbent.manufacturer,
+                adsorbent.void_volume,
+                adsorbent.density,
+                adsorbent.si_al_ratio,
+                adsorbent.pellet_size,
+                adsorbent.binder_content,
+            ),
+        )
+
+    def _add_experiment(
+        self,
+        connection: sqlite3.Connection,
+        experiment: Experiment,
+        file: Optional[Group] = None,
+    ) -> None:
+        # Experiments whose adsorbent group is missing are loaded without adsorbent
+        connection.execute(
+            "INSERT OR REPLACE INTO experiments VALUES (?, ?, ?, ?)",
+            (
+                experiment.name,
+                getattr(experiment.adsorbent, "name", None),
+                _get_value(experiment.experiment_type),
+                experiment.year,
+            ),
+        )
+
+        for mono_isotherm in experiment.monocomponent_isotherms:
+            self._add_isotherm(
+                connection,
+                experiment.name,
+                MONO_ISOTHERMS,
+                mono_isotherm,
+                [mono_isotherm.adsorbate],
+                file,
+            )
+        for mix_isotherm in experiment.mixture_isotherms:
+            self._add_isotherm(
+                connection,
+                experiment.name,
+                MIXTURE_ISOTHERMS,
+                mix_isotherm,
+                mix_isotherm.adsorbates,
+                file,
+            )
+
+    def _add_isotherm(
+        self,
+        connection: sqlite3.Connection,
+        experiment_name: str,
+        kind: str,
+        isotherm: Isotherm,
+        adsorbates: List[Adsorbate],
+        file: Optional[Group] = None,
+    ) -> None:
+        store_name = get_isotherm_store_name(isotherm)
+        route = get_isotherm_route(experiment_name, kind, store_name)
+        points, min_pressure, max_pressure = _get_pressure_range(
+            getattr(isotherm, "pressures"), file
+        )
+
+        connection.execute(
+            "INSERT OR REPLACE INTO isotherms"
+            " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                route,
+                experiment_name,
+                kind,
+                store_name,
+                isotherm.name,
+                _get_value(isotherm.isotherm_type),
+                isotherm.temperature,
+                points,
+                min_pressure,
+                max_pressure,
+            ),
+        )
+        connection.execute(
+            "DELETE FROM isotherm_adsorbates WHERE route = ?", (route,)
+        )
+        connection.executemany(
+            "INSERT OR IGNORE INTO isotherm_adsorbates VALUES (?, ?, ?)",
+            [
+                (route, adsorbate.name, position)
+                for position, adsorbate in enumerate(adsorbates)
+            ],
+        )
@@ -0,0 +1,55 @@
+import enum
+import hashlib
+from typing import Any
+
+import attr
+import numpy as np
+
+# Bump when the encoding changes, so every stored hash is treated as stale
+_CONTENT_HASH_VERSION = b"1"
+
+
+def _update(digest: Any, value: Any) -> None:
+    if value is None:
+        digest.update(b"N")
+    elif attr.has(type(value)):
+        digest.update(b"O" + type(value).__name__.encode())
+        for field in attr.fields(type(value)):
+            digest.update(b"F" + field.name.encode())
+            _update(digest, getattr(value, field.name))
+    elif isinstance(value, enum.Enum):
+        digest.update(b"E")
+        _update(digest, value.value)
+    elif isinstance(value, str):
+        data = value.encode()
+        digest.update(b"S%d:" % len(data) + data)
+    elif isinstance(value, (list, tuple)):
+        digest.update(b"L%d:" % len(value))
+        for item in value:
+            _update(digest, item)
+    elif isinstance(value, (np.ndarray, np.generic)):
+        array = np.ascontiguousarray(value)
+        digest.update(
+            b"A" + array.dtype.str.encode() + repr(array.shape).encode()
+        )
+        digest.update(array.tobytes())
+    else:
+        digest.update(b"R" + repr(value).encode())
+
+
+def get_content_hash(obj: Any) -> str:
+    """
+    Get a hash of the content of a model object: its metadata, its arrays and every object it references.
+
+    Equal objects always get the same hash, so a stored hash tells whether an object must be written again. An
+    experiment hash covers its adsorbent and its isotherms, with their adsorbates and points.
+
+    Args:
+        obj (Any): The model object.
+
+    Returns:
+        str: The hexadecimal SHA-256 digest.
+    """
+    digest = hashlib.sha256(_CONTENT_HASH_VERSION)
+    _update(digest, obj)
+    return digest.hexdigest()
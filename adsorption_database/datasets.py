@@ -0,0 +1,178 @@
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+import numpy as np
+import numpy.typing as npt
+from h5py import Dataset
+from numpy.lib.mixins import NDArrayOperatorsMixin
+
+from adsorption_database.storage_provider import StorageProvider
+
+
+def get_memory_map(dataset: Dataset) -> Optional[npt.NDArray[Any]]:
+    """
+    Get a read-only memory map of a dataset's data, if its layout allows it.
+
+    Only contiguous datasets (which can not be filtered) of files opened with the default driver are stored as a
+    single block at a known offset of the file. The map shares the operating system page cache with every other
+    process mapping the same file, and data is only read from disk on first access.
+
+    The map is read-only for its holder, not a snapshot: a handler overwriting the dataset in place (see
+    `AbstractSerializer.upsert_dataset`) changes the mapped values too. Copy the map to keep the current values.
+
+    Args:
+        dataset (Dataset): The dataset.
+
+    Returns:
+        Optional[np.ndarray]: The read-only memory map, or None if the dataset can not be mapped.
+    """
+    if (
+        dataset.chunks is not None
+        or dataset.external is not None
+        or dataset.file.driver != "sec2"
+        or dataset.dtype.hasobject
+        or dataset.size == 0
+    ):
+        return None
+
+    offset = dataset.id.get_offset()
+    if offset is None:
+        return None
+
+    return np.memmap(
+        dataset.file.filename,
+        mode="r",
+        dtype=dataset.dtype,
+        shape=dataset.shape,
+        offset=offset,
+    )
+
+
+def read_dataset(
+    dataset: Dataset, memory_map: bool = False
+) -> npt.NDArray[Any]:
+    """
+    Read the values of a dataset.
+
+    Args:
+        dataset (Dataset): The dataset.
+        memory_map (bool): Whether to return a read-only memory map instead of a copy, if the dataset can be mapped.
+            Defaults to False.
+
+    Returns:
+        np.ndarray: The dataset values.
+    """
+    if memory_map:
+        values = get_memory_map(dataset)
+        if values is not None:
+            return values
+
+    return np.array(dataset)
+
+
+def _unwrap(value: Any) -> Any:
+    if isinstance(value, LazyDataset):
+        return value.values
+    if isinstance(value, (list, tuple)):
+        return type(value)(_unwrap(item) for item in value)
+    return value
+
+
+def _unwrap_kwargs(kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    return {name: _unwrap(value) for name, value in kwargs.items()}
+
+
+class LazyDataset(NDArrayOperatorsMixin):
+    """
+    Array proxy of a stored dataset, read on first access.
+
+    Shape and dtype come from the dataset metadata and are available without reading. Indexing, iteration, numpy
+    functions and operators read the values once, through the shared read handle of the storage file, and keep
+    them. Anything else not defined here is forwarded to the values, so the proxy can be used where the models expect
+    arrays.
+
+    Values are read from the storage file as it is at the time of the first access.
+    """
+
+    def __init__(self, dataset: Dataset, memory_map: bool = False) -> None:
+        self._file_path = Path(dataset.file.filename)
+        self._route: str = dataset.name
+        self._shape: Tuple[int, ...] = dataset.shape
+        self._dtype: np.dtype = dataset.dtype
+        self._memory_map = memory_map
+        self._values: Optional[npt.NDArray[Any]] = None
+
+    @property
+    def route(self) -> str:
+        return self._route
+
+    @property
+    def shape(self) -> Tuple[int, ...]:
+        return self._shape
+
+    @property
+    def dtype(self) -> np.dtype:
+        return self._dtype
+
+    @property
+    def ndim(self) -> int:
+        return len(self._shape)
+
+    @property
+    def size(self) -> int:
+        return int(np.prod(self._shape))
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._values is not None
+
+    @property
+    def values(self) -> npt.NDArray[Any]:
+        """
+        Get the dataset values, reading them on the first call.
+
+        Returns:
+            np.ndarray: The dataset values.
+        """
+        if self._values is None:
+            provider = StorageProvider(file_path=self._file_path)
+            with provider.get_readable_file() as f:
+                self._values = read_dataset(f[self._route], self._memory_map)
+
+        return self._values
+
+    def __array__(self, dtype: Any = None, copy: Any = None) -> Any:
+        if dtype is None:
+            return self.values
+        return self.values.astype(dtype, copy=False)
+
+    def __array_ufunc__(
+        self, ufunc: Any, method: str, *inputs: Any, **kwargs: Any
+    ) -> Any:
+        return getattr(ufunc, method)(
+            *_unwrap(inputs), **_unwrap_kwargs(kwargs)
+        )
+
+    def __array_function__(
+        self, func: Any, types: Any, args: Any, kwargs: Any
+    ) -> Any:
+        return func(*_unwrap(args), **_unwrap_kwargs(kwargs))
+
+    def __getitem__(self, key: Any) -> Any:
+        return self.values[key]
+
+    def __len__(self) -> int:
+        return self._shape[0]
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self.values)
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self.values, name)
+
+    def __repr__(self) -> str:
+        if self._values is None:
+            return f"LazyDataset({self._route}, shape={self._shape}, dtype={self._dtype})"
+        return f"LazyDataset({self._route}, {self._values!r})"
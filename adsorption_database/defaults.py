@@ -8,3 +8,7 @@ MIXTURE_ISOTHERMS = "Mixture"
 EXPERIMENTS = "Experiments"
 ADSORBATES = "Adsorbates"
 ADSORBENTS = "Adsorbents"
+POINTS = "Points"
+GENERATION = "generation"
+CONTENT_HASH = "content_hash"
+BLOBS = "Blobs"
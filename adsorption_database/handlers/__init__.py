@@ -1,2 +1,4 @@
 from .abstract_handler import AbstractHandler
 from .text_file_hander import TextFileHandler
+from .manifest import Manifest, load_manifest
+from .ingest import ingest_manifests
@@ -1,23 +1,56 @@
 from abc import abstractmethod
-from typing import Generic, Optional, Tuple, TypeVar
-from h5py import Group
+from contextlib import ExitStack, contextmanager
+from typing import (
+    Generic,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    TypeVar,
+    Union,
+)
+from h5py import File, Group
 import numpy as np
 import numpy.typing as npt
+from adsorption_database.catalog import (
+    Catalog,
+    get_catalog_path,
+    get_isotherm_route,
+)
+from adsorption_database.content_hash import get_content_hash
 from adsorption_database.defaults import (
     ADSORBATES,
     ADSORBENTS,
+    CONTENT_HASH,
+    EXPERIMENTS,
+    MIXTURE_ISOTHERMS,
+    MONO_ISOTHERMS,
 )
+from adsorption_database.handlers.ingest_report import IngestReport
+from adsorption_database.handlers.write_session import WriteSession
 
 from adsorption_database.models.adsorbent import Adsorbent
 from adsorption_database.models.experiment import Experiment
 from adsorption_database.models.adsorbate import Adsorbate
+from adsorption_database.point_store import (
+    has_point_store,
+    update_point_store,
+)
 from adsorption_database.models.isotherms import (
+    Isotherm,
     MixIsothermFileData,
     MonoIsothermFileData,
     MixIsotherm,
     MonoIsotherm,
     IsothermType,
 )
+from adsorption_database.serializers.abstract_serializer import (
+    UpsertStats,
+    mark_point_store_stale,
+    set_attribute,
+)
 from adsorption_database.serializers.attrs_serializer import AttrOnlySerializer
 from adsorption_database.serializers.experiment_serializer import (
     ExperimentSerializer,
@@ -35,6 +68,7 @@ from adsorption_database.shared import (
     get_mono_isotherm_group,
 )
 
+from adsorption_database.storage_options import StorageOptions
 from adsorption_database.storage_provider import StorageProvider
 
 
@@ -43,8 +77,174 @@ _MixFileData = TypeVar("_MixFileData", bound=MixIsothermFileData)
 
 
 class AbstractHandler(Generic[_MonoFileData, _MixFileData]):
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        storage_options: Optional[StorageOptions] = None,
+        point_store: bool = False,
+        incremental: bool = False,
+    ) -> None:
+        """
+        The handler accumulates the bytes written and reused by its isotherm dataset writes in `upsert_stats`, and
+        the experiment and isotherm groups inserted, updated and skipped by its register calls in `ingest_report`.
+
+        Args:
+            storage_options (Optional[StorageOptions]): The layout and filters of the isotherm datasets written by the
+                handler. Defaults to None, in which case datasets are stored contiguously and uncompressed.
+            point_store (bool): Whether to create the consolidated point store (see `point_store.write_point_store`)
+                when isotherms are registered. Once a storage file has a point store, every handler keeps it up to
+                date. Defaults to False.
+            incremental (bool): Whether to store a content hash (see `content_hash.get_content_hash`) with every
+                experiment and isotherm written, and skip the experiments and isotherms whose stored hash matches.
+                Re-registering unchanged objects then leaves the storage file untouched. Defaults to False.
+        """
         self._storage_provider = StorageProvider()
+        self._storage_options = storage_options
+        self._point_store = point_store
+        self._incremental = incremental
+        self.upsert_stats = UpsertStats()
+        self.ingest_report = IngestReport()
+        self._session: Optional[WriteSession] = None
+        self._catalog: Optional[Catalog] = None
+
+    @contextmanager
+    def write_session(self, atomic: bool = False) -> Iterator[WriteSession]:
+        """
+        Open the HDF5 file for writing once for a batch of register calls.
+
+        Every register call made inside the context reuses the same editable handle, and adsorbates and adsorbents
+        are written only once per session. If isotherms were registered, their rows of the point store are refreshed
+        (see `point_store.update_point_store`) when the outermost session is exited, then the file is flushed and
+        closed; nested sessions reuse the outer one. The file is only opened once a register call needs to write, so a
+        session that skips every object (see the `incremental` option) does not touch the storage file.
+
+        Args:
+            atomic (bool): Whether to write into a shadow copy of the storage file that replaces it only when the
+                session exits without errors (see `StorageProvider.get_shadow_file`). Ignored by nested sessions.
+                Defaults to False.
+
+        Returns:
+            WriteSession: The active write session.
+
+        Example:
+            >>> with handler.write_session():
+            ...     handler.register_adsorbate(co2)
+            ...     handler.register_experiment(experiment)
+        """
+        if self._session is not None:
+            yield self._session
+            return
+
+        catalog = self._get_catalog()
+        catalog_was_fresh = catalog is not None and catalog.is_fresh()
+
+        with ExitStack() as stack:
+
+            def open_file() -> File:
+                if atomic:
+                    file_context = self._storage_provider.get_shadow_file()
+                else:
+                    file_context = self._storage_provider.get_editable_file()
+                return stack.enter_context(file_context)
+
+            session = WriteSession(open_file)
+            self._session = session
+            try:
+                yield session
+                if session.is_open:
+                    file = session.file
+                    if session.isotherms_changed and (
+                        self._point_store or has_point_store(file)
+                    ):
+                        update_point_store(
+                            file,
+                            session.registered_isotherm_routes,
+                            self._storage_options,
+                            self.upsert_stats,
+                        )
+                    file.flush()
+            finally:
+                self._session = None
+
+        if catalog is not None and session.is_open:
+            self._update_catalog(catalog, catalog_was_fresh, session)
+
+    def _get_catalog(self) -> Optional[Catalog]:
+        storage_path = self._storage_provider.get_file_path().resolve()
+        catalog_path = get_catalog_path(storage_path)
+        if catalog_path is None:
+            return None
+        if self._catalog is None or self._catalog.catalog_path != catalog_path:
+            if self._catalog is not None:
+                self._catalog.close()
+            self._catalog = Catalog(storage_path, catalog_path)
+        return self._catalog
+
+    def _update_catalog(
+        self, catalog: Catalog, was_fresh: bool, session: WriteSession
+    ) -> None:
+        """
+        Record the objects written in a session in the catalog.
+
+        The catalog is updated in place only if it described the file before the session and every isotherm group
+        written belongs to a registered experiment. Otherwise, it is rebuilt from the file.
+        """
+        experiment_routes: Set[str] = set()
+        for experiment in session.registered_experiments:
+            isotherms_by_kind: List[Tuple[str, Sequence[Isotherm]]] = [
+                (MONO_ISOTHERMS, experiment.monocomponent_isotherms),
+                (MIXTURE_ISOTHERMS, experiment.mixture_isotherms),
+            ]
+            for kind, isotherms in isotherms_by_kind:
+                experiment_routes.update(
+                    get_isotherm_route(experiment.name, kind, store_name)
+                    for store_name in map(get_isotherm_store_name, isotherms)
+                )
+
+        if was_fresh and session.registered_isotherm_routes.issubset(
+            experiment_routes
+        ):
+            catalog.update(
+                session.registered_experiments,
+                session.registered_adsorbates.values(),
+                session.registered_adsorbents.values(),
+            )
+            return
+
+        signature = catalog.get_storage_signature()
+        with self._storage_provider.get_readable_file() as f:
+            catalog.rebuild(f, signature)
+
+    def _get_stored_content_hash(
+        self, session: WriteSession, route: str
+    ) -> Optional[str]:
+        """
+        Get the content hash stored in a group, reading through the session file only if it is already open.
+        """
+        if session.is_open:
+            group = session.file.get(route)
+        else:
+            if not self._storage_provider.get_file_path().exists():
+                return None
+            with self._storage_provider.get_readable_file() as f:
+                return self._get_stored_content_hash_from(f.get(route))
+        return self._get_stored_content_hash_from(group)
+
+    @staticmethod
+    def _get_stored_content_hash_from(group: Optional[Group]) -> Optional[str]:
+        if group is None:
+            return None
+        try:
+            return str(group.attrs[CONTENT_HASH])
+        except KeyError:
+            return None
+
+    def _record(
+        self, report: Optional[IngestReport], outcome: str, route: str
+    ) -> None:
+        for target in (report, self.ingest_report):
+            if target is not None:
+                routes: List[str] = getattr(target, outcome)
+                routes.append(route)
 
     def register_adsorbate(self, adsorbate: Adsorbate) -> None:
         """
@@ -52,6 +252,7 @@ class AbstractHandler(Generic[_MonoFileData, _MixFileData]):
 
         This method registers an `Adsorbate` object in the HDF5 file, storing its information as attributes
         in a group within the 'adsorbates' group in the file. The group is created if it does not already exist.
+        Within a write session, an adsorbate already registered in the session is not written again.
 
         Args:
             adsorbate (Adsorbate): The adsorbate object to register.
@@ -60,10 +261,14 @@ class AbstractHandler(Generic[_MonoFileData, _MixFileData]):
             None
         """
 
-        with self._storage_provider.get_editable_file() as file:
-            adsorbates_group = file.require_group(ADSORBATES)
+        with self.write_session() as session:
+            if session.registered_adsorbates.get(adsorbate.name) == adsorbate:
+                return
+
+            adsorbates_group = session.file.require_group(ADSORBATES)
             group = adsorbates_group.require_group(adsorbate.name)
             AttrOnlySerializer(Adsorbate).dump(adsorbate, group)
+            session.registered_adsorbates[adsorbate.name] = adsorbate
 
     def register_adsorbent(self, adsorbent: Adsorbent) -> None:
         """
@@ -71,6 +276,7 @@ class AbstractHandler(Generic[_MonoFileData, _MixFileData]):
 
         This method registers an `Adsorbent` object in the HDF5 file, storing its information as attributes
         in a group within the 'Adsorbents' group in the file. The group is created if it does not already exist.
+        Within a write session, an adsorbent already registered in the session is not written again.
 
         Args:
             adsorbent (Adsorbent): The Adsorbent object to register.
@@ -79,50 +285,75 @@ class AbstractHandler(Generic[_MonoFileData, _MixFileData]):
             None
         """
 
-        with self._storage_provider.get_editable_file() as file:
-            adsorbents_group = file.require_group(ADSORBENTS)
+        with self.write_session() as session:
+            if session.registered_adsorbents.get(adsorbent.name) == adsorbent:
+                return
+
+            adsorbents_group = session.file.require_group(ADSORBENTS)
             group = adsorbents_group.require_group(adsorbent.name)
             AttrOnlySerializer(Adsorbent).dump(adsorbent, group)
+            session.registered_adsorbents[adsorbent.name] = adsorbent
 
-    def register_experiment(self, experiment: Experiment):
+    def register_experiment(
+        self, experiment: Experiment, atomic: bool = False
+    ) -> IngestReport:
         """
         Register an experiment and associated data in the HDF5 file.
 
         This method registers an experiment object and associated data, including attributes and datasets,
         in the HDF5 file. The experiment data is stored in an experiment group within the HDF5 file.
 
+        The whole experiment is written within a single write session: the file is opened and flushed once, and
+        each adsorbate and the adsorbent are registered once regardless of the number of isotherms.
+
+        With the `incremental` option, an experiment whose stored content hash matches is skipped without opening the
+        file for writing. Otherwise, only its isotherms whose content hash changed are written again.
+
         Args:
             experiment (Experiment): The experiment object to be registered in the HDF5 file.
+            atomic (bool): Whether to commit the experiment atomically through a shadow copy of the storage file, so
+                a failure never leaves a half-written experiment behind. Defaults to False.
 
         Returns:
-            None
+            IngestReport: The routes of the experiment and isotherm groups inserted, updated and skipped.
         """
-
-        with self._storage_provider.get_editable_file() as file:
-
-            experiments_group = get_experiments_group(file)
+        report = IngestReport()
+        route = f"/{EXPERIMENTS}/{experiment.name}"
+
+        with self.write_session(atomic) as session:
+            content_hash = None
+            if self._incremental:
+                content_hash = get_content_hash(experiment)
+                stored_hash = self._get_stored_content_hash(session, route)
+                if stored_hash == content_hash:
+                    self._record(report, "skipped", route)
+                    return report
+
+            experiments_group = get_experiments_group(session.file)
+            existed = experiment.name in experiments_group
             group = experiments_group.require_group(experiment.name)
 
             self.register_adsorbent(experiment.adsorbent)
 
-            # register isotherms
-            isotherm_names = []
             for pure_isotherm in experiment.monocomponent_isotherms:
-                isotherm_names.append(
-                    self.register_mono_isotherm(pure_isotherm, group)
-                )
+                self.register_mono_isotherm(pure_isotherm, group, report)
 
-            isotherm_names = []
             for mix_isotherm in experiment.mixture_isotherms:
-                isotherm_names.append(
-                    self.register_mix_isotherm(mix_isotherm, group)
-                )
+                self.register_mix_isotherm(mix_isotherm, group, report)
 
             ExperimentSerializer().dump(experiment, group)
+            self._store_content_hash(group, content_hash)
+            self._record(report, "updated" if existed else "inserted", route)
+            session.registered_experiments.append(experiment)
+
+        return report
 
     def register_mono_isotherm(
-        self, isotherm: MonoIsotherm, experiment_group: Group
-    ):
+        self,
+        isotherm: MonoIsotherm,
+        experiment_group: Group,
+        report: Optional[IngestReport] = None,
+    ) -> str:
         """
         Register a monocomponent isotherm and associated data in the HDF5 file.
 
@@ -133,26 +364,42 @@ class AbstractHandler(Generic[_MonoFileData, _MixFileData]):
         Args:
             isotherm (MonoIsotherm): The monocomponent isotherm object to be registered in the HDF5 file.
             experiment_group (Group): The experiment group to which the monocomponent isotherm belongs.
+            report (Optional[IngestReport]): A report to record the outcome in, besides the handler `ingest_report`.
+                Defaults to None.
 
         Returns:
-            None
+            str: The name of the isotherm group.
         """
 
         pure_isotherms_group = get_mono_isotherm_group(experiment_group)
         stored_isotherm_name = get_isotherm_store_name(isotherm)
 
+        must_write, content_hash = self._check_isotherm(
+            isotherm, pure_isotherms_group, stored_isotherm_name, report
+        )
+        if not must_write:
+            return stored_isotherm_name
+
         self.register_adsorbate(isotherm.adsorbate)
 
         isotherm_group = pure_isotherms_group.require_group(
             stored_isotherm_name
         )
+        self._add_isotherm_route(isotherm_group)
 
-        MonoIsothermSerializer().dump(isotherm, isotherm_group)
+        serializer = MonoIsothermSerializer(
+            self._storage_options, self.upsert_stats
+        )
+        serializer.dump(isotherm, isotherm_group)
+        self._store_content_hash(isotherm_group, content_hash)
         return stored_isotherm_name
 
     def register_mix_isotherm(
-        self, isotherm: MixIsotherm, experiment_group: Group
-    ):
+        self,
+        isotherm: MixIsotherm,
+        experiment_group: Group,
+        report: Optional[IngestReport] = None,
+    ) -> str:
         """
         Register a multicomponent isotherm and associated data in the HDF5 file.
 
@@ -163,25 +410,83 @@ class AbstractHandler(Generic[_MonoFileData, _MixFileData]):
         Args:
             isotherm (MixIsotherm): The multicomponent isotherm object to be registered in the HDF5 file.
             experiment_group (Group): The experiment group to which the multicomponent isotherm belongs.
+            report (Optional[IngestReport]): A report to record the outcome in, besides the handler `ingest_report`.
+                Defaults to None.
 
         Returns:
-            None
+            str: The name of the isotherm group.
         """
 
         mixture_isotherms_group = get_mix_isotherm_group(experiment_group)
         stored_isotherm_name = get_isotherm_store_name(isotherm)
 
+        must_write, content_hash = self._check_isotherm(
+            isotherm, mixture_isotherms_group, stored_isotherm_name, report
+        )
+        if not must_write:
+            return stored_isotherm_name
+
         for adsorbate in isotherm.adsorbates:
             self.register_adsorbate(adsorbate)
 
         isotherm_group = mixture_isotherms_group.require_group(
             stored_isotherm_name
         )
+        self._add_isotherm_route(isotherm_group)
 
-        MixIsothermSerializer().dump(isotherm, isotherm_group)
+        serializer = MixIsothermSerializer(
+            self._storage_options, self.upsert_stats
+        )
+        serializer.dump(isotherm, isotherm_group)
+        self._store_content_hash(isotherm_group, content_hash)
 
         return stored_isotherm_name
 
+    def _check_isotherm(
+        self,
+        isotherm: Union[MonoIsotherm, MixIsotherm],
+        isotherms_group: Group,
+        stored_isotherm_name: str,
+        report: Optional[IngestReport],
+    ) -> Tuple[bool, Optional[str]]:
+        """
+        Check whether an isotherm must be written, and record the outcome.
+
+        Returns:
+            Tuple[bool, Optional[str]]: Whether the isotherm must be written, and the content hash to store with it
+            if the handler is incremental.
+        """
+        group = isotherms_group.get(stored_isotherm_name)
+        route = f"{isotherms_group.name}/{stored_isotherm_name}"
+
+        content_hash = None
+        if self._incremental:
+            content_hash = get_content_hash(isotherm)
+            if self._get_stored_content_hash_from(group) == content_hash:
+                self._record(report, "skipped", route)
+                return False, None
+
+        self._record(report, "inserted" if group is None else "updated", route)
+        return True, content_hash
+
+    @staticmethod
+    def _store_content_hash(group: Group, content_hash: Optional[str]) -> None:
+        """
+        Store the content hash of a group just written, or drop its stored hash if the handler is not incremental,
+        so a later incremental write never skips data the stored hash no longer describes.
+        """
+        if content_hash is not None:
+            set_attribute(group, CONTENT_HASH, content_hash)
+        elif CONTENT_HASH in group.attrs:
+            del group.attrs[CONTENT_HASH]
+
+    def _add_isotherm_route(self, isotherm_group: Group) -> None:
+        if self._session is not None:
+            self._session.registered_isotherm_routes.add(isotherm_group.name)
+        else:
+            # Written to a file opened by the caller, so no session refreshes the point store
+            mark_point_store_stale(isotherm_group)
+
     @abstractmethod
     def get_mono_data(
         self, file_data: _MonoFileData
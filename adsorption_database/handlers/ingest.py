@@ -0,0 +1,464 @@
+import json
+import multiprocessing
+import os
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    wait,
+)
+from pathlib import Path
+from typing import (
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
+
+import numpy as np
+from attr import Factory, define
+
+from adsorption_database.defaults import EXPERIMENTS
+from adsorption_database.handlers.ingest_report import IngestReport
+from adsorption_database.handlers.parse_cache import ParseCache
+from adsorption_database.handlers.manifest import (
+    InvalidManifest,
+    IsothermSpec,
+    Manifest,
+    find_manifests,
+    load_manifest,
+)
+from adsorption_database.handlers.text_file_hander import TextFileHandler
+from adsorption_database.models.isotherms import Isotherm
+from adsorption_database.storage_options import StorageOptions
+from adsorption_database.storage_provider import StorageProvider
+
+INGEST_STATE_SUFFIX = ".ingest-state"
+
+# The folder the isotherm file is read from, and the isotherm
+ParseTask = Tuple[Path, IsothermSpec]
+ParseOutcome = Union[Isotherm, Exception]
+
+# The parse caches of the process, by cache folder
+_parse_caches: Dict[Optional[Path], ParseCache] = {}
+
+
+@define
+class IngestError:
+    """
+    A manifest, or one of its isotherm files, that could not be ingested.
+
+    Attributes:
+        path (Path): The manifest path.
+        file_name (Optional[str]): The isotherm file that failed, or None if the manifest itself is invalid.
+        message (str): The error.
+    """
+
+    path: Path
+    file_name: Optional[str]
+    message: str
+
+
+@define
+class IngestResult:
+    """
+    The outcome of `ingest_manifests`.
+
+    Attributes:
+        built (List[Path]): The manifests read and registered again.
+        up_to_date (List[Path]): The manifests skipped because neither them nor their source files changed.
+        failed (List[Path]): The manifests not registered because they, or one of their files, are invalid.
+        errors (List[IngestError]): The errors of the failed manifests.
+        report (IngestReport): The experiment and isotherm groups inserted, updated and skipped.
+    """
+
+    built: List[Path] = Factory(list)
+    up_to_date: List[Path] = Factory(list)
+    failed: List[Path] = Factory(list)
+    errors: List[IngestError] = Factory(list)
+    report: IngestReport = Factory(IngestReport)
+
+
+def validate_isotherm(isotherm: Isotherm) -> None:
+    """
+    Check that the arrays read for an isotherm are not empty and hold finite values only.
+
+    Args:
+        isotherm (Isotherm): The isotherm.
+
+    Raises:
+        ValueError: If an array is empty or holds NaN or infinite values.
+    """
+    for name in [
+        "pressures",
+        "loadings",
+        "bulk_composition",
+        "heats_of_adsorption",
+    ]:
+        values = getattr(isotherm, name, None)
+        if values is None:
+            continue
+        if np.size(values) == 0:
+            raise ValueError(f"{isotherm.name} has no {name}")
+        if not np.all(np.isfinite(values)):
+            raise ValueError(f"{isotherm.name} has non-finite {name}")
+
+
+def get_parse_cache(directory: Optional[Path] = None) -> ParseCache:
+    """
+    Get the parse cache of the process for a cache folder, so files read by several isotherms are parsed once per
+    process.
+
+    Args:
+        directory (Optional[Path]): The folder of the cached `.npy` files. Defaults to None, in which case files are
+            only cached in memory.
+
+    Returns:
+        ParseCache: The parse cache.
+    """
+    cache = _parse_caches.get(directory)
+    if cache is None:
+        cache = _parse_caches[directory] = ParseCache(directory)
+    return cache
+
+
+def parse_isotherm(
+    folder: Path, spec: IsothermSpec, parse_cache: Optional[ParseCache] = None
+) -> Isotherm:
+    """
+    Read and validate the isotherm file of a manifest isotherm.
+
+    Args:
+        folder (Path): The folder of the isotherm file.
+        spec (IsothermSpec): The isotherm.
+        parse_cache (Optional[ParseCache]): The cache of parsed files. Defaults to None.
+
+    Returns:
+        Isotherm: The isotherm.
+    """
+    isotherm = spec.create(TextFileHandler(folder, parse_cache=parse_cache))
+    validate_isotherm(isotherm)
+    return isotherm
+
+
+def _try_parse_isotherm(
+    folder: Path, spec: IsothermSpec, parse_cache_directory: Optional[Path]
+) -> ParseOutcome:
+    # Errors are returned rather than raised, so a bad file is reported with its task
+    try:
+        return parse_isotherm(
+            folder, spec, get_parse_cache(parse_cache_directory)
+        )
+    except Exception as error:
+        return error
+
+
+def _get_outcome(future: "Future[ParseOutcome]") -> ParseOutcome:
+    error = future.exception()
+    if error is not None:
+        return error if isinstance(error, Exception) else RuntimeError(error)
+    return future.result()
+
+
+def parse_isotherms(
+    tasks: Iterable[ParseTask],
+    processes: Optional[int] = None,
+    max_pending: Optional[int] = None,
+    parse_cache_directory: Optional[Path] = None,
+) -> Iterator[Tuple[int, ParseOutcome]]:
+    """
+    Parse isotherm files, in a pool of worker processes if `processes` is given.
+
+    Outcomes are yielded as soon as each file is parsed, so in completion order, along with the index of their task.
+    At most `max_pending` files are parsed or waiting to be consumed at any time: new tasks are only submitted as
+    the caller consumes outcomes, so a slow consumer (such as the single writer of `ingest_manifests`) holds the
+    parsers back instead of letting parsed arrays pile up. A file that can not be read or fails
+    `validate_isotherm` yields its exception instead of an isotherm, and the other files are parsed anyway.
+
+    Each process parses a file once, however many isotherms read it (see `get_parse_cache`). With
+    `parse_cache_directory`, parsed files are also shared by the processes, and by later runs, as `.npy` files.
+
+    Args:
+        tasks (Iterable[ParseTask]): The folder and spec of every isotherm.
+        processes (Optional[int]): The number of worker processes. Defaults to None, in which case files are parsed
+            one by one in the calling process.
+        max_pending (Optional[int]): The maximum number of tasks in flight. Defaults to None, in which case it is
+            twice the number of processes.
+        parse_cache_directory (Optional[Path]): The folder of the cached `.npy` files. Defaults to None, in which
+            case parsed files are only cached in memory.
+
+    Returns:
+        Iterator[Tuple[int, ParseOutcome]]: The task index, and the isotherm or the error of every task.
+    """
+    if not processes:
+        for index, (folder, spec) in enumerate(tasks):
+            yield index, _try_parse_isotherm(
+                folder, spec, parse_cache_directory
+            )
+        return
+
+    if max_pending is None:
+        max_pending = 2 * processes
+
+    # Workers are spawned, so they never inherit the open HDF5 handles of the writer
+    with ProcessPoolExecutor(
+        processes, mp_context=multiprocessing.get_context("spawn")
+    ) as pool:
+        pending: Dict["Future[ParseOutcome]", int] = {}
+        for index, (folder, spec) in enumerate(tasks):
+            if len(pending) >= max_pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield pending.pop(future), _get_outcome(future)
+            future = pool.submit(
+                _try_parse_isotherm, folder, spec, parse_cache_directory
+            )
+            pending[future] = index
+
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield pending.pop(future), _get_outcome(future)
+
+
+def get_ingest_state_path(storage_path: Path) -> Path:
+    """
+    Get the path of the file recording the fingerprint of every manifest ingested into a storage file.
+
+    Args:
+        storage_path (Path): The storage file path.
+
+    Returns:
+        Path: The state file path, next to the storage file.
+    """
+    return storage_path.with_name(storage_path.name + INGEST_STATE_SUFFIX)
+
+
+def _read_state(path: Path) -> Dict[str, str]:
+    try:
+        with open(path) as file:
+            state = json.load(file)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+    return state if isinstance(state, dict) else {}
+
+
+def _write_state(path: Path, state: Dict[str, str]) -> None:
+    temp_path = path.with_name(path.name + ".tmp")
+    with open(temp_path, "w") as file:
+        json.dump(state, file, indent=2, sort_keys=True)
+    os.replace(temp_path, path)
+
+
+def _list_stored_experiments(provider: StorageProvider) -> List[str]:
+    if not provider.get_file_path().exists():
+        return []
+    with provider.get_readable_file() as f:
+        return list(f.get(EXPERIMENTS, {}))
+
+
+@define
+class _PendingExperiment:
+    manifest: Manifest
+    fingerprint: str
+    specs: Sequence[IsothermSpec]
+    isotherms: List[Optional[Isotherm]]
+    remaining: int
+    failed: bool = False
+
+
+def _load_manifests(
+    paths: Iterable[Path], result: IngestResult
+) -> List[Manifest]:
+    manifests: List[Manifest] = []
+    for path in find_manifests(paths):
+        try:
+            manifests.append(load_manifest(path))
+        except InvalidManifest as error:
+            result.failed.append(Path(path).resolve())
+            result.errors.append(
+                IngestError(Path(path).resolve(), None, str(error))
+            )
+    return manifests
+
+
+def _plan_experiment(
+    manifest: Manifest,
+    force: bool,
+    state: Dict[str, str],
+    stored_experiments: Set[str],
+    result: IngestResult,
+) -> Optional[_PendingExperiment]:
+    # None if the manifest is up to date or invalid, as recorded in the result
+    try:
+        fingerprint = manifest.get_fingerprint()
+        if (
+            not force
+            and state.get(str(manifest.path)) == fingerprint
+            and manifest.experiment_name in stored_experiments
+        ):
+            result.up_to_date.append(manifest.path)
+            return None
+        specs = manifest.get_isotherm_specs()
+    except InvalidManifest as error:
+        result.failed.append(manifest.path)
+        result.errors.append(IngestError(manifest.path, None, str(error)))
+        return None
+
+    return _PendingExperiment(
+        manifest, fingerprint, specs, [None] * len(specs), len(specs)
+    )
+
+
+def _register_experiment(
+    writer: TextFileHandler,
+    experiment: _PendingExperiment,
+    state: Dict[str, str],
+    result: IngestResult,
+) -> None:
+    manifest = experiment.manifest
+    if experiment.failed:
+        result.failed.append(manifest.path)
+        return
+
+    try:
+        isotherms = [
+            isotherm
+            for isotherm in experiment.isotherms
+            if isotherm is not None
+        ]
+        report = writer.register_experiment(
+            manifest.create_experiment(isotherms)
+        )
+    except InvalidManifest as error:
+        result.failed.append(manifest.path)
+        result.errors.append(IngestError(manifest.path, None, str(error)))
+        return
+
+    result.report.extend(report)
+    result.built.append(manifest.path)
+    state[str(manifest.path)] = experiment.fingerprint
+
+
+def _ingest_experiments(
+    writer: TextFileHandler,
+    experiments: List[_PendingExperiment],
+    state: Dict[str, str],
+    result: IngestResult,
+    processes: Optional[int],
+    max_pending: Optional[int],
+    parse_cache_directory: Optional[Path],
+) -> None:
+    # Each experiment is registered as soon as its last isotherm file is parsed
+    tasks: List[ParseTask] = []
+    owners: List[Tuple[_PendingExperiment, int]] = []
+    for experiment in experiments:
+        if experiment.remaining == 0:
+            _register_experiment(writer, experiment, state, result)
+        for position, spec in enumerate(experiment.specs):
+            tasks.append((experiment.manifest.folder, spec))
+            owners.append((experiment, position))
+
+    for index, outcome in parse_isotherms(
+        tasks, processes, max_pending, parse_cache_directory
+    ):
+        experiment, position = owners[index]
+        if isinstance(outcome, Exception):
+            experiment.failed = True
+            result.errors.append(
+                IngestError(
+                    experiment.manifest.path,
+                    experiment.specs[position].file_data.file_name,
+                    repr(outcome),
+                )
+            )
+        else:
+            experiment.isotherms[position] = outcome
+
+        experiment.remaining -= 1
+        if experiment.remaining == 0:
+            _register_experiment(writer, experiment, state, result)
+
+
+def ingest_manifests(
+    paths: Iterable[Path],
+    force: bool = False,
+    storage_options: Optional[StorageOptions] = None,
+    processes: Optional[int] = None,
+    max_pending: Optional[int] = None,
+    parse_cache_directory: Optional[Path] = None,
+) -> IngestResult:
+    """
+    Register the experiments described by manifests, rebuilding only the manifests that changed since the last run.
+
+    A manifest is rebuilt if its fingerprint (see `Manifest.get_fingerprint`) differs from the one recorded by the
+    last run, or if its experiment is missing from the storage file. The isotherm files of the rebuilt manifests are
+    parsed by `parse_isotherms`, in worker processes if `processes` is given, and streamed to the calling process,
+    the single writer, which registers each experiment as soon as all of its isotherms are parsed. Experiments are
+    registered in a single atomic write session (see `AbstractHandler.write_session`) by an incremental handler, so
+    isotherms whose content did not change are not written again, readers keep seeing the previous storage file until
+    the run is committed, and a run interrupted by an error leaves it untouched.
+
+    An invalid manifest, or a manifest with an isotherm file that can not be parsed, is reported in the result and
+    not registered; the other manifests are registered anyway. Once the session is committed, the fingerprints of
+    the registered manifests are recorded next to the storage file (see `get_ingest_state_path`), so failed manifests
+    are retried on the next run.
+
+    Args:
+        paths (Iterable[Path]): Manifest files or folders of manifests.
+        force (bool): Whether to rebuild every manifest. Defaults to False.
+        storage_options (Optional[StorageOptions]): The layout and filters of the isotherm datasets written.
+            Defaults to None.
+        processes (Optional[int]): The number of processes parsing isotherm files. Defaults to None, in which case
+            files are parsed by the writer.
+        max_pending (Optional[int]): The maximum number of isotherm files parsed ahead of the writer. Defaults to
+            None, in which case it is twice the number of processes.
+        parse_cache_directory (Optional[Path]): The folder where parsed isotherm files are cached as `.npy` files, so
+            later runs do not parse unchanged files again. Defaults to None, in which case parsed files are only
+            cached in memory, for the run.
+
+    Returns:
+        IngestResult: The manifests built, skipped and failed, and the groups written.
+
+    Example:
+        >>> result = ingest_manifests([Path("manifests")], processes=4)
+        >>> print(f"{len(result.built)} built, {len(result.up_to_date)} up to date")
+    """
+    result = IngestResult()
+    manifests = _load_manifests(paths, result)
+
+    provider = StorageProvider()
+    state_path = get_ingest_state_path(provider.get_file_path().resolve())
+    state = _read_state(state_path)
+    stored_experiments = set(_list_stored_experiments(provider))
+
+    experiments: List[_PendingExperiment] = []
+    for manifest in manifests:
+        experiment = _plan_experiment(
+            manifest, force, state, stored_experiments, result
+        )
+        if experiment is not None:
+            experiments.append(experiment)
+
+    if not experiments:
+        return result
+
+    writer = TextFileHandler(Path("."), storage_options, incremental=True)
+    with writer.write_session(atomic=True):
+        _ingest_experiments(
+            writer,
+            experiments,
+            state,
+            result,
+            processes,
+            max_pending,
+            parse_cache_directory,
+        )
+    _write_state(state_path, state)
+
+    return result
@@ -0,0 +1,28 @@
+from typing import List
+
+from attr import Factory, define
+
+
+@define
+class IngestReport:
+    """
+    The routes of the experiment and isotherm groups handled by register calls, by outcome.
+
+    Attributes:
+        inserted (List[str]): Groups that did not exist.
+        updated (List[str]): Existing groups written again, because their content changed or was not hashed.
+        skipped (List[str]): Existing groups left untouched, because their content hash did not change.
+    """
+
+    inserted: List[str] = Factory(list)
+    updated: List[str] = Factory(list)
+    skipped: List[str] = Factory(list)
+
+    @property
+    def changed(self) -> bool:
+        return len(self.inserted) > 0 or len(self.updated) > 0
+
+    def extend(self, other: "IngestReport") -> None:
+        self.inserted.extend(other.inserted)
+        self.updated.extend(other.updated)
+        self.skipped.extend(other.skipped)
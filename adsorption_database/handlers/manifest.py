@@ -0,0 +1,365 @@
+import hashlib
+import json
+import os
+from contextlib import contextmanager
+from pathlib import Path
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from attr import define
+
+from adsorption_database.handlers.text_file_hander import (
+    GetLoadingsFromAdsorbed,
+    MixIsothermTextFileData,
+    MonoIsothermTextFileData,
+    TextFileHandler,
+)
+from adsorption_database.models.adsorbate import Adsorbate
+from adsorption_database.models.adsorbent import Adsorbent, AdsorbentType
+from adsorption_database.models.experiment import Experiment, ExperimentType
+from adsorption_database.models.isotherms import (
+    Isotherm,
+    IsothermType,
+    MixIsotherm,
+    MonoIsotherm,
+)
+
+MONOCOMPONENT = "monocomponent"
+MIXTURE = "mixture"
+
+_ISOTHERM_KEYS = {
+    MONOCOMPONENT: "monocomponent_isotherms",
+    MIXTURE: "mixture_isotherms",
+}
+
+
+class InvalidManifest(Exception):
+    pass
+
+
+@define
+class IsothermSpec:
+    """
+    An isotherm described by a manifest, before its text file is read.
+
+    Attributes:
+        name (str): The isotherm name.
+        temperature (float): The isotherm temperature.
+        isotherm_type (IsothermType): The isotherm type.
+        comments (Optional[str]): The isotherm comments.
+        file_data (Union[MonoIsothermTextFileData, MixIsothermTextFileData]): The file and columns to read.
+    """
+
+    name: str
+    temperature: float
+    isotherm_type: IsothermType
+    comments: Optional[str]
+    file_data: Union[MonoIsothermTextFileData, MixIsothermTextFileData]
+
+    def create(self, handler: TextFileHandler) -> Isotherm:
+        """
+        Read the isotherm file and create the isotherm.
+
+        Args:
+            handler (TextFileHandler): The handler reading the file.
+
+        Returns:
+            Isotherm: The monocomponent or mixture isotherm.
+        """
+        if isinstance(self.file_data, MonoIsothermTextFileData):
+            return handler.create_mono_isotherm(
+                self.name,
+                self.temperature,
+                self.isotherm_type,
+                self.file_data,
+                comments=self.comments,
+            )
+        return handler.create_mix_isotherm(
+            self.name,
+            self.temperature,
+            self.isotherm_type,
+            self.file_data,
+            comments=self.comments,
+        )
+
+
+@define
+class Manifest:
+    """
+    A JSON description of an experiment and of the text files its isotherms are read from.
+
+    The manifest holds the `experiment` fields, its `adsorbent`, the `adsorbates` referenced by the isotherms (by
+    key), and the `monocomponent_isotherms` and `mixture_isotherms`. Each isotherm entry has a `name`, a
+    `temperature`, an optional `isotherm_type` (defaults to "Excess") and `comments`, and the fields of
+    `MonoIsothermTextFileData` or `MixIsothermTextFileData`. The optional `defaults` object holds the fields shared by
+    every `monocomponent` or `mixture` isotherm. Files are read from `folder`, relative to the manifest.
+
+    Example:
+        {
+            "folder": "../temp",
+            "experiment": {"name": "Sudi-calgon", "experiment_type": "Volumetric", "paper_doi": ["..."]},
+            "adsorbent": {"type": "Activated Carbon", "name": "Calgon-F400"},
+            "adsorbates": {"CO2": {"name": "Carbon Dioxide", "chemical_formula": "CO2"}},
+            "defaults": {"monocomponent": {"pressure_conversion_factor_to_Pa": 1e6}},
+            "monocomponent_isotherms": [
+                {
+                    "name": "CO2-01", "temperature": 318.2, "file_name": "SUDI_co2.txt", "adsorbate": "CO2",
+                    "pressures_col": 0, "loadings_col": 1
+                }
+            ]
+        }
+
+    Attributes:
+        path (Path): The manifest path.
+        spec (Dict[str, Any]): The parsed manifest.
+    """
+
+    path: Path
+    spec: Dict[str, Any]
+
+    @property
+    def experiment_name(self) -> str:
+        return str(self.spec["experiment"]["name"])
+
+    @property
+    def folder(self) -> Path:
+        folder = str(self.spec.get("folder", "."))
+        return (self.path.parent / folder).resolve()
+
+    def get_isotherm_entries(self, kind: str) -> List[Dict[str, Any]]:
+        """
+        Get the isotherm entries of a kind, merged with their defaults.
+
+        Args:
+            kind (str): `MONOCOMPONENT` or `MIXTURE`.
+
+        Returns:
+            List[Dict[str, Any]]: The isotherm entries.
+        """
+        defaults = self.spec.get("defaults", {}).get(kind, {})
+        return [
+            {**defaults, **entry}
+            for entry in self.spec.get(_ISOTHERM_KEYS[kind], [])
+        ]
+
+    def get_source_paths(self) -> List[Path]:
+        """
+        Get the text files read by the manifest isotherms.
+
+        Returns:
+            List[Path]: The sorted file paths.
+        """
+        with self._spec_errors():
+            file_names = {
+                entry["file_name"]
+                for kind in _ISOTHERM_KEYS
+                for entry in self.get_isotherm_entries(kind)
+            }
+        return sorted(self.folder / file_name for file_name in file_names)
+
+    def get_fingerprint(self) -> str:
+        """
+        Get a fingerprint of the manifest and of its source files.
+
+        Like make, source files are compared by size and modification time, so the fingerprint changes whenever the
+        manifest or any of its source files is edited.
+
+        Returns:
+            str: The hexadecimal SHA-256 digest.
+        """
+        digest = hashlib.sha256(json.dumps(self.spec, sort_keys=True).encode())
+        for path in self.get_source_paths():
+            try:
+                stat = os.stat(path)
+                state = f"{path}:{stat.st_size}:{stat.st_mtime_ns}"
+            except FileNotFoundError:
+                state = f"{path}:missing"
+            digest.update(state.encode())
+        return digest.hexdigest()
+
+    def get_isotherm_specs(self) -> List["IsothermSpec"]:
+        """
+        Get the isotherms of the manifest, monocomponent ones first, without reading their files.
+
+        Returns:
+            List[IsothermSpec]: The isotherm specs.
+
+        Raises:
+            InvalidManifest: If an isotherm misses a field or holds an unknown one.
+        """
+        with self._spec_errors():
+            adsorbates = {
+                key: Adsorbate(**fields)
+                for key, fields in self.spec.get("adsorbates", {}).items()
+            }
+            return [
+                self._get_mono_spec(entry, adsorbates)
+                for entry in self.get_isotherm_entries(MONOCOMPONENT)
+            ] + [
+                self._get_mix_spec(entry, adsorbates)
+                for entry in self.get_isotherm_entries(MIXTURE)
+            ]
+
+    def create_experiment(self, isotherms: Sequence[Isotherm]) -> Experiment:
+        """
+        Create the experiment of the manifest from its isotherms.
+
+        Args:
+            isotherms (Sequence[Isotherm]): The isotherms created from `get_isotherm_specs`, in the same order.
+
+        Returns:
+            Experiment: The experiment.
+
+        Raises:
+            InvalidManifest: If the experiment or the adsorbent misses a field or holds an unknown one.
+        """
+        with self._spec_errors():
+            adsorbent_fields = dict(self.spec["adsorbent"])
+            adsorbent = Adsorbent(
+                type=AdsorbentType(adsorbent_fields.pop("type")),
+                **adsorbent_fields,
+            )
+            experiment_fields = dict(self.spec["experiment"])
+            experiment_type = ExperimentType(
+                experiment_fields.pop("experiment_type")
+            )
+            return Experiment(
+                adsorbent=adsorbent,
+                experiment_type=experiment_type,
+                monocomponent_isotherms=[
+                    isotherm
+                    for isotherm in isotherms
+                    if isinstance(isotherm, MonoIsotherm)
+                ],
+                mixture_isotherms=[
+                    isotherm
+                    for isotherm in isotherms
+                    if isinstance(isotherm, MixIsotherm)
+                ],
+                **experiment_fields,
+            )
+
+    def build_experiment(self, handler: TextFileHandler) -> Experiment:
+        """
+        Read the isotherms of the manifest and build its experiment.
+
+        Args:
+            handler (TextFileHandler): The handler reading the isotherm files, from the manifest `folder`.
+
+        Returns:
+            Experiment: The experiment.
+
+        Raises:
+            InvalidManifest: If the manifest misses a field or holds an unknown one.
+        """
+        return self.create_experiment(
+            [spec.create(handler) for spec in self.get_isotherm_specs()]
+        )
+
+    @staticmethod
+    def _pop_isotherm_fields(
+        entry: Dict[str, Any],
+    ) -> Tuple[str, float, IsothermType, Optional[str]]:
+        return (
+            entry.pop("name"),
+            entry.pop("temperature"),
+            IsothermType(
+                entry.pop("isotherm_type", IsothermType.EXCESS.value)
+            ),
+            entry.pop("comments", None),
+        )
+
+    def _get_mono_spec(
+        self, entry: Dict[str, Any], adsorbates: Dict[str, Adsorbate]
+    ) -> "IsothermSpec":
+        entry = dict(entry)
+        fields = self._pop_isotherm_fields(entry)
+        adsorbate = adsorbates[entry.pop("adsorbate")]
+        return IsothermSpec(
+            *fields, MonoIsothermTextFileData(adsorbate=adsorbate, **entry)
+        )
+
+    def _get_mix_spec(
+        self, entry: Dict[str, Any], adsorbates: Dict[str, Adsorbate]
+    ) -> "IsothermSpec":
+        entry = dict(entry)
+        fields = self._pop_isotherm_fields(entry)
+        mixture = [adsorbates[key] for key in entry.pop("adsorbates")]
+        get_loadings = entry.pop("get_loadings_from_adsorbed", None)
+        if get_loadings is not None:
+            get_loadings = GetLoadingsFromAdsorbed(**get_loadings)
+        return IsothermSpec(
+            *fields,
+            MixIsothermTextFileData(
+                adsorbates=mixture,
+                get_loadings_from_adsorbed=get_loadings,
+                **entry,
+            ),
+        )
+
+    @contextmanager
+    def _spec_errors(self) -> Iterator[None]:
+        try:
+            yield
+        except (KeyError, TypeError, ValueError) as error:
+            raise InvalidManifest(
+                f"{self.path} is not a valid manifest: {error!r}"
+            ) from error
+
+
+def load_manifest(path: Path) -> Manifest:
+    """
+    Load a JSON manifest.
+
+    Args:
+        path (Path): The manifest path.
+
+    Returns:
+        Manifest: The manifest.
+
+    Raises:
+        InvalidManifest: If the file is not a JSON object with `experiment` and `adsorbent` fields.
+    """
+    path = Path(path).resolve()
+    try:
+        with open(path) as file:
+            spec = json.load(file)
+    except json.JSONDecodeError as error:
+        raise InvalidManifest(f"{path} is not valid JSON: {error}") from error
+
+    if not isinstance(spec, dict) or not {"experiment", "adsorbent"} <= set(
+        spec
+    ):
+        raise InvalidManifest(
+            f"{path} is not a valid manifest: it needs experiment and adsorbent fields"
+        )
+
+    return Manifest(path, spec)
+
+
+def find_manifests(paths: Iterable[Path]) -> List[Path]:
+    """
+    Get the manifests to ingest: the given files and the JSON files in the given folders.
+
+    Args:
+        paths (Iterable[Path]): Manifest files or folders.
+
+    Returns:
+        List[Path]: The manifest paths.
+    """
+    manifests: List[Path] = []
+    for path in map(Path, paths):
+        if path.is_dir():
+            manifests.extend(sorted(path.glob("*.json")))
+        else:
+            manifests.append(path)
+    return manifests
@@ -0,0 +1,202 @@
+import hashlib
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Iterable, Optional, Tuple
+
+import numpy as np
+import numpy.typing as npt
+
+from adsorption_database.cache import CacheInfo
+from adsorption_database.handlers.text_parser import (
+    COMMENTS,
+    FAST,
+    TextTable,
+    get_used_columns,
+    read_text_table,
+)
+
+DEFAULT_PARSE_CACHE_SIZE = 64 * 1024**2
+
+# The resolved path, size and modification time of a file, and the engine and comment character it is parsed with
+_ParseKey = Tuple[str, int, int, str, Optional[str]]
+
+
+class ParseCache:
+    """
+    A thread-safe LRU cache of parsed text files, in memory and optionally in a folder of `.npy` files.
+
+    Entries are keyed by the resolved file path, its size and modification time, and the parse options, so an edited
+    file is parsed again. On a miss every column of the file is parsed, so reading other columns of the same file
+    (such as the isotherm of another temperature) is a hit. Callers get copies of the columns they ask for, so the
+    cached arrays are never modified.
+
+    With `directory`, parsed files are also saved there as `.npy` files named after their key, and loaded from there
+    on a memory miss, by later runs too. The files of edited sources are never read again; `clear` removes them.
+    """
+
+    def __init__(
+        self,
+        directory: Optional[Path] = None,
+        max_size: int = DEFAULT_PARSE_CACHE_SIZE,
+    ) -> None:
+        """
+        Args:
+            directory (Optional[Path]): The folder of the `.npy` files, created if needed. Defaults to None, in which
+                case files are only cached in memory.
+            max_size (int): The maximum size of the arrays cached in memory, in bytes. Defaults to 64 MiB.
+        """
+        self._directory = directory
+        self._max_size = max_size
+        self._entries: "OrderedDict[_ParseKey, npt.NDArray[np.float64]]" = (
+            OrderedDict()
+        )
+        self._size = 0
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def directory(self) -> Optional[Path]:
+        return self._directory
+
+    def read(
+        self,
+        path: Path,
+        columns: Iterable[int],
+        engine: str = FAST,
+        comments: Optional[str] = COMMENTS,
+    ) -> TextTable:
+        """
+        Read columns of a text file, parsing it only if it is not cached.
+
+        Args:
+            path (Path): The file path.
+            columns (Iterable[int]): The column indices to read, negative indices counting from the last column.
+            engine (str): The parser engine (see `text_parser.read_text_table`). Defaults to `FAST`.
+            comments (Optional[str]): The character starting a comment. Defaults to "#".
+
+        Returns:
+            TextTable: The columns read.
+        """
+        path = Path(path).resolve()
+        stat = os.stat(path)
+        key = (str(path), stat.st_size, stat.st_mtime_ns, engine, comments)
+
+        with self._lock:
+            values = self._entries.get(key)
+            if values is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+
+        if values is None:
+            values = self._load(key)
+            if values is None:
+                values = self._parse(path, engine, comments)
+                self._save(key, values)
+                with self._lock:
+                    self._misses += 1
+            else:
+                with self._lock:
+                    self._hits += 1
+            self._put(key, values)
+
+        n_columns = values.shape[0]
+        return TextTable(
+            {
+                column: values[column].copy()
+                for column in get_used_columns(columns, n_columns)
+            },
+            n_columns,
+        )
+
+    def clear(self) -> None:
+        """
+        Drop every cached file, in memory and in the cache folder. Counters are kept.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+        if self._directory is not None and self._directory.exists():
+            for path in self._directory.glob("*.npy"):
+                path.unlink()
+
+    def get_info(self) -> CacheInfo:
+        """
+        Get the cache counters.
+
+        Returns:
+            CacheInfo: The hits, misses (files parsed), number of entries, size and maximum size of the memory cache.
+        """
+        with self._lock:
+            return CacheInfo(
+                self._hits,
+                self._misses,
+                len(self._entries),
+                self._size,
+                self._max_size,
+            )
+
+    @staticmethod
+    def _parse(
+        path: Path, engine: str, comments: Optional[str]
+    ) -> npt.NDArray[np.float64]:
+        table = read_text_table(path, None, engine, comments)
+        if table.n_columns == 0:
+            return np.empty((0, 0))
+        return np.stack([table[:, i] for i in range(table.n_columns)])
+
+    def _get_cache_path(self, key: _ParseKey) -> Optional[Path]:
+        if self._directory is None:
+            return None
+        digest = hashlib.sha256(repr(key).encode()).hexdigest()
+        return self._directory / f"{digest}.npy"
+
+    def _load(self, key: _ParseKey) -> Optional[npt.NDArray[np.float64]]:
+        path = self._get_cache_path(key)
+        if path is None:
+            return None
+        try:
+            values = np.load(path)
+        except (OSError, ValueError):
+            return None
+        return values if values.ndim == 2 else None
+
+    def _save(self, key: _ParseKey, values: npt.NDArray[np.float64]) -> None:
+        path = self._get_cache_path(key)
+        if path is None:
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Written to a unique file and renamed, so concurrent writers, in any process or thread, never share a
+        # temporary file, and concurrent readers never load a partial file
+        fd, temp_path = tempfile.mkstemp(
+            suffix=".tmp", prefix=f"{path.stem}.", dir=path.parent
+        )
+        try:
+            with os.fdopen(fd, "wb") as file:
+                np.save(file, values)
+            os.replace(temp_path, path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+
+    def _put(self, key: _ParseKey, values: npt.NDArray[np.float64]) -> None:
+        with self._lock:
+            if values.nbytes > self._max_size:
+                return
+
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= previous.nbytes
+            self._entries[key] = values
+            self._size += values.nbytes
+
+            while self._size > self._max_size:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= evicted.nbytes
@@ -1,11 +1,20 @@
 from pathlib import Path
 from typing import Tuple
 import numpy as np
+from adsorption_database.catalog import Catalog, get_catalog_path
+from adsorption_database.defaults import ADSORBATES, ADSORBENTS, CONTENT_HASH
 from adsorption_database.handlers.abstract_handler import AbstractHandler
 import pytest
+from pytest_mock import MockerFixture
 from adsorption_database.models.adsorbate import Adsorbate
 from adsorption_database.models.adsorbent import Adsorbent, AdsorbentType
 from adsorption_database.models.experiment import Experiment, ExperimentType
+from adsorption_database.point_store import (
+    build_pure_point_table,
+    read_mixture_point_table,
+    read_pure_point_table,
+)
+from adsorption_database.serializers.attrs_serializer import AttrOnlySerializer
 from adsorption_database.shared import (
     get_experiments_group,
     get_isotherm_store_name,
@@ -28,16 +37,14 @@ class TestAbstractHandler(
     def get_mono_data(
         self, file_data: MonoIsothermFileData
     ) -> Tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
-        return super().get_mono_data(file_data)  # type:ignore[safe-super]
+        return super().get_mono_data(file_data)  # type: ignore[safe-super]
 
-    def get_mix_data(
-        self, file_data: MixIsothermFileData
-    ) -> Tuple[
+    def get_mix_data(self, file_data: MixIsothermFileData) -> Tuple[
         npt.NDArray[np.float64],
         npt.NDArray[np.float64],
         npt.NDArray[np.float64],
     ]:
-        return super().get_mix_data(file_data)  # type:ignore[safe-super]
+        return super().get_mix_data(file_data)  # type: ignore[safe-super]
 
 
 def test_get_isotherm_store_name(mono_isotherm: MonoIsotherm) -> None:
@@ -199,3 +206,279 @@ def test_not_implemented_mix(co2_adsorbate: Adsorbate) -> None:
 
     with pytest.raises(NotImplementedError):
         handler.get_mix_data(file)
+
+
+def test_register_experiment_opens_file_once(
+    mono_isotherm: MonoIsotherm,
+    mix_isotherm: MixIsotherm,
+    mocker: MockerFixture,
+) -> None:
+
+    handler = TestAbstractHandler()
+
+    z01x = Adsorbent(name="z01x", type=AdsorbentType.ZEOLITE)
+
+    experiment = Experiment(
+        name="Sudi",
+        adsorbent=z01x,
+        experiment_type=ExperimentType.VOLUMETRIC,
+        monocomponent_isotherms=[mono_isotherm, mono_isotherm],
+        mixture_isotherms=[mix_isotherm],
+    )
+
+    open_spy = mocker.spy(StorageProvider, "get_editable_file")
+    dump_spy = mocker.spy(AttrOnlySerializer, "dump")
+
+    handler.register_experiment(experiment)
+
+    assert open_spy.call_count == 1
+    # one adsorbent and two adsorbates
+    assert dump_spy.call_count == 3
+
+    with StorageProvider().get_readable_file() as f:
+        assert list(f[ADSORBATES]) == ["Carbon Dioxide", "Methane"]
+        assert list(f[ADSORBENTS]) == ["z01x"]
+
+
+def test_nested_write_sessions(co2_adsorbate: Adsorbate) -> None:
+
+    handler = TestAbstractHandler()
+
+    with handler.write_session() as session:
+        with handler.write_session() as nested_session:
+            assert nested_session is session
+        handler.register_adsorbate(co2_adsorbate)
+        assert session.registered_adsorbates == {
+            co2_adsorbate.name: co2_adsorbate
+        }
+
+    with handler.write_session() as session:
+        assert session.registered_adsorbates == {}
+
+
+def test_register_experiment_atomic(
+    mono_isotherm: MonoIsotherm,
+    mix_isotherm: MixIsotherm,
+    setup_storage: Path,
+    mocker: MockerFixture,
+) -> None:
+
+    handler = TestAbstractHandler()
+
+    z01x = Adsorbent(name="z01x", type=AdsorbentType.ZEOLITE)
+
+    experiment = Experiment(
+        name="Sudi",
+        adsorbent=z01x,
+        experiment_type=ExperimentType.VOLUMETRIC,
+        monocomponent_isotherms=[mono_isotherm],
+        mixture_isotherms=[mix_isotherm],
+    )
+
+    handler.register_experiment(experiment, atomic=True)
+
+    mocker.patch.object(
+        TestAbstractHandler,
+        "register_mix_isotherm",
+        side_effect=RuntimeError("failed"),
+    )
+    experiment.name = "Broken"
+
+    with pytest.raises(RuntimeError):
+        handler.register_experiment(experiment, atomic=True)
+
+    with StorageProvider().get_readable_file() as f:
+        assert list(get_experiments_group(f)) == ["Sudi"]
+
+    assert not list(setup_storage.parent.glob("*.shadow"))
+
+
+def test_register_experiment_twice_reuses_datasets(
+    mono_isotherm: MonoIsotherm,
+    mix_isotherm: MixIsotherm,
+    setup_storage: Path,
+) -> None:
+
+    handler = TestAbstractHandler()
+
+    experiment = Experiment(
+        name="Sudi",
+        adsorbent=Adsorbent(name="z01x", type=AdsorbentType.ZEOLITE),
+        experiment_type=ExperimentType.VOLUMETRIC,
+        monocomponent_isotherms=[mono_isotherm],
+        mixture_isotherms=[mix_isotherm],
+    )
+
+    handler.register_experiment(experiment)
+    written_bytes = handler.upsert_stats.bytes_written
+    size = setup_storage.stat().st_size
+
+    handler.register_experiment(experiment)
+
+    assert handler.upsert_stats.bytes_written == written_bytes
+    assert handler.upsert_stats.bytes_reused == written_bytes
+    assert setup_storage.stat().st_size == size
+
+
+def test_register_experiment_incremental(
+    mono_isotherm: MonoIsotherm,
+    mix_isotherm: MixIsotherm,
+    setup_storage: Path,
+    mocker: MockerFixture,
+) -> None:
+
+    handler = TestAbstractHandler(incremental=True)
+
+    experiment = Experiment(
+        name="Sudi",
+        adsorbent=Adsorbent(name="z01x", type=AdsorbentType.ZEOLITE),
+        experiment_type=ExperimentType.VOLUMETRIC,
+        monocomponent_isotherms=[mono_isotherm],
+        mixture_isotherms=[mix_isotherm],
+    )
+    experiment_route = "/Experiments/Sudi"
+    mono_route = "/Experiments/Sudi/Pure/Mono Isotherm-Excess"
+    mix_route = "/Experiments/Sudi/Mixture/Mix Isotherm-Excess"
+
+    report = handler.register_experiment(experiment)
+    assert report.inserted == [mono_route, mix_route, experiment_route]
+    assert report.updated == report.skipped == []
+
+    signature = setup_storage.stat().st_mtime_ns, setup_storage.stat().st_size
+    open_spy = mocker.spy(StorageProvider, "get_editable_file")
+
+    report = handler.register_experiment(experiment)
+    assert report.skipped == [experiment_route]
+    assert not report.changed
+    assert open_spy.call_count == 0
+    assert (
+        setup_storage.stat().st_mtime_ns,
+        setup_storage.stat().st_size,
+    ) == signature
+
+    mono_isotherm.loadings = mono_isotherm.loadings * 2
+    report = handler.register_experiment(experiment)
+    assert report.inserted == []
+    assert report.updated == [mono_route, experiment_route]
+    assert report.skipped == [mix_route]
+
+    assert handler.ingest_report.skipped == [experiment_route, mix_route]
+
+    with StorageProvider().get_readable_file() as f:
+        np.testing.assert_array_equal(
+            f[mono_route]["loadings"][()], mono_isotherm.loadings
+        )
+
+
+def test_register_experiment_plain_write_drops_content_hash(
+    mono_isotherm: MonoIsotherm,
+    mix_isotherm: MixIsotherm,
+    setup_storage: Path,
+) -> None:
+
+    experiment = Experiment(
+        name="Sudi",
+        adsorbent=Adsorbent(name="z01x", type=AdsorbentType.ZEOLITE),
+        experiment_type=ExperimentType.VOLUMETRIC,
+        monocomponent_isotherms=[mono_isotherm],
+        mixture_isotherms=[mix_isotherm],
+    )
+    experiment_route = "/Experiments/Sudi"
+    mono_route = "/Experiments/Sudi/Pure/Mono Isotherm-Excess"
+    mix_route = "/Experiments/Sudi/Mixture/Mix Isotherm-Excess"
+    loadings = mono_isotherm.loadings
+
+    TestAbstractHandler(incremental=True).register_experiment(experiment)
+
+    mono_isotherm.loadings = loadings * 2
+    TestAbstractHandler().register_experiment(experiment)
+
+    with StorageProvider().get_readable_file() as f:
+        for route in [experiment_route, mono_route, mix_route]:
+            assert CONTENT_HASH not in f[route].attrs
+
+    mono_isotherm.loadings = loadings
+    report = TestAbstractHandler(incremental=True).register_experiment(
+        experiment
+    )
+    assert report.updated == [mono_route, mix_route, experiment_route]
+    assert report.skipped == []
+
+    with StorageProvider().get_readable_file() as f:
+        np.testing.assert_array_equal(f[mono_route]["loadings"][()], loadings)
+
+
+def test_register_experiment_point_store(
+    mono_isotherm: MonoIsotherm,
+    mix_isotherm: MixIsotherm,
+) -> None:
+
+    experiment = Experiment(
+        name="Sudi",
+        adsorbent=Adsorbent(name="z01x", type=AdsorbentType.ZEOLITE),
+        experiment_type=ExperimentType.VOLUMETRIC,
+        monocomponent_isotherms=[mono_isotherm],
+        mixture_isotherms=[mix_isotherm],
+    )
+
+    TestAbstractHandler(point_store=True).register_experiment(experiment)
+
+    experiment.name = "Sudi-2"
+    TestAbstractHandler().register_experiment(experiment)
+
+    with StorageProvider().get_readable_file() as f:
+        pure_points = read_pure_point_table(f)
+        mixture_points = read_mixture_point_table(f)
+        built_points = build_pure_point_table(f)
+
+    assert pure_points.routes == built_points.routes
+    np.testing.assert_array_equal(pure_points.offsets, built_points.offsets)
+    np.testing.assert_array_equal(
+        pure_points.heats_of_adsorption, built_points.heats_of_adsorption
+    )
+
+    assert built_points.routes == [
+        "/Experiments/Sudi/Pure/Mono Isotherm-Excess",
+        "/Experiments/Sudi-2/Pure/Mono Isotherm-Excess",
+    ]
+    assert pure_points.pressures.shape == (2 * len(mono_isotherm.pressures),)
+    assert mixture_points.loadings.shape == (
+        2,
+        2 * len(mix_isotherm.pressures),
+    )
+
+
+def test_register_experiment_updates_catalog(
+    mono_isotherm: MonoIsotherm,
+    mix_isotherm: MixIsotherm,
+    setup_storage: Path,
+    mocker: MockerFixture,
+) -> None:
+
+    handler = TestAbstractHandler()
+
+    experiment = Experiment(
+        name="Sudi",
+        adsorbent=Adsorbent(name="z01x", type=AdsorbentType.ZEOLITE),
+        experiment_type=ExperimentType.VOLUMETRIC,
+        monocomponent_isotherms=[mono_isotherm],
+        mixture_isotherms=[mix_isotherm],
+    )
+
+    handler.register_experiment(experiment)
+
+    catalog = Catalog(setup_storage, get_catalog_path(setup_storage))
+    assert catalog.is_fresh()
+
+    rebuild = mocker.spy(Catalog, "rebuild")
+    experiment.name = "Sudi-2"
+    handler.register_experiment(experiment)
+
+    rebuild.assert_not_called()
+    assert catalog.is_fresh()
+    assert catalog.list_names("experiments") == ["Sudi", "Sudi-2"]
+    assert catalog.list_isotherms("Sudi-2", "Pure") == ["Mono Isotherm-Excess"]
+    assert catalog.find_experiments(
+        adsorbate=mix_isotherm.adsorbates[1].name,
+        temperature=mix_isotherm.temperature,
+    ) == ["Sudi", "Sudi-2"]
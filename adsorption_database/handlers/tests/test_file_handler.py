@@ -183,6 +183,37 @@ def test_mix_file_handler_raise_index_error(datadir: Path) -> None:
         handler.get_mix_data(mixture_data)
 
 
+def test_file_handler_engines(datadir: Path) -> None:
+    fast = TextFileHandler(datadir)
+    loadtxt = TextFileHandler(datadir, engine="loadtxt")
+
+    adsorbate1 = Adsorbate("adsorbate 1 name", "adsorbate_1_formula")
+    adsorbate2 = Adsorbate("adsorbate 2 name", "adsorbate_2_formula")
+    adsorbate3 = Adsorbate("adsorbate 3 name", "adsorbate_3_formula")
+
+    pure_data = MonoIsothermTextFileData("pure_example.txt", adsorbate1, 0, 2)
+    for fast_values, values in zip(
+        fast.get_mono_data(pure_data), loadtxt.get_mono_data(pure_data)
+    ):
+        np.testing.assert_array_equal(fast_values, values)
+
+    mixture_data = MixIsothermTextFileData(
+        "mixture_tree_components_example.txt",
+        [adsorbate1, adsorbate2, adsorbate3],
+        0,
+        [4, 5, 6],
+        [1, 2],
+        load_missing_composition_from_equilibrium=True,
+    )
+    for fast_values, values in zip(
+        fast.get_mix_data(mixture_data), loadtxt.get_mix_data(mixture_data)
+    ):
+        np.testing.assert_array_equal(fast_values, values)
+
+    with pytest.raises(ValueError):
+        TextFileHandler(datadir, engine="pandas")
+
+
 def test_create_mono_isotherm(
     datadir: Path, data_regression, helpers: Helpers
 ) -> None:
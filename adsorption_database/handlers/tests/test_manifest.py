@@ -0,0 +1,217 @@
+import json
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pytest
+from pytest import CaptureFixture
+
+from adsorption_database.__main__ import main
+from adsorption_database.handlers.ingest import (
+    get_ingest_state_path,
+    get_parse_cache,
+    ingest_manifests,
+)
+from adsorption_database.handlers.manifest import (
+    InvalidManifest,
+    load_manifest,
+)
+from adsorption_database.handlers.ingest_report import IngestReport
+from adsorption_database.handlers.text_file_hander import TextFileHandler
+from adsorption_database.models.adsorbent import AdsorbentType
+from adsorption_database.models.isotherms import IsothermType
+
+
+def test_build_experiment(datadir: Path) -> None:
+    manifest = load_manifest(datadir / "manifest.json")
+
+    assert manifest.folder == datadir.resolve()
+    assert manifest.get_source_paths() == [
+        datadir.resolve() / "mixture_two_components_example.txt",
+        datadir.resolve() / "pure_example.txt",
+    ]
+
+    experiment = manifest.build_experiment(TextFileHandler(manifest.folder))
+
+    assert experiment.name == "Example"
+    assert experiment.authors == ["a", "b"]
+    assert experiment.adsorbent.type is AdsorbentType.ACTIVATED_CARBON
+    assert [
+        isotherm.name for isotherm in experiment.monocomponent_isotherms
+    ] == ["CO2-01", "CH4-01"]
+
+    co2, ch4 = experiment.monocomponent_isotherms
+    assert co2.isotherm_type is IsothermType.EXCESS
+    assert co2.temperature == 298
+    assert ch4.adsorbate.name == "Methane"
+    np.testing.assert_allclose(co2.pressures, ch4.pressures)
+    assert co2.pressures[0] == pytest.approx(0.55e6)
+
+    (mixture,) = experiment.mixture_isotherms
+    assert [adsorbate.name for adsorbate in mixture.adsorbates] == [
+        "Methane",
+        "Carbon Dioxide",
+    ]
+    np.testing.assert_allclose(mixture.bulk_composition.sum(axis=0), 1.0)
+
+
+def test_ingest_manifests(datadir: Path, setup_storage: Path) -> None:
+    manifest_path = (datadir / "manifest.json").resolve()
+
+    result = ingest_manifests([datadir])
+    assert result.built == [manifest_path]
+    assert len(result.report.inserted) == 4
+    assert get_ingest_state_path(setup_storage).exists()
+
+    signature = setup_storage.stat().st_mtime_ns
+    result = ingest_manifests([datadir])
+    assert result.built == []
+    assert result.up_to_date == [manifest_path]
+    assert setup_storage.stat().st_mtime_ns == signature
+
+    # an edited spec rebuilds the manifest, but only the changed groups are written
+    spec = json.loads(manifest_path.read_text())
+    spec["experiment"]["comments"] = "Edited"
+    manifest_path.write_text(json.dumps(spec))
+
+    result = ingest_manifests([manifest_path])
+    assert result.built == [manifest_path]
+    assert result.report.updated == ["/Experiments/Example"]
+    assert len(result.report.skipped) == 3
+
+    # an edited source file rebuilds the isotherms read from it
+    source_path = datadir / "pure_example.txt"
+    source_path.write_text(source_path.read_text() + "\n30.0\t4.0\t4.5\n")
+
+    result = ingest_manifests([manifest_path])
+    assert sorted(result.report.updated) == [
+        "/Experiments/Example",
+        "/Experiments/Example/Pure/CH4-01-Excess",
+        "/Experiments/Example/Pure/CO2-01-Excess",
+    ]
+
+    assert ingest_manifests([manifest_path]).built == []
+    assert ingest_manifests([manifest_path], force=True).built == [
+        manifest_path
+    ]
+
+
+def test_ingest_manifests_atomic(
+    datadir: Path, setup_storage: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    register_experiment = TextFileHandler.register_experiment
+
+    def failing_register_experiment(
+        self: TextFileHandler, *args: Any, **kwargs: Any
+    ) -> IngestReport:
+        register_experiment(self, *args, **kwargs)
+        raise RuntimeError("Interrupted")
+
+    # an interrupted run leaves the storage file and the ingest state untouched
+    monkeypatch.setattr(
+        TextFileHandler, "register_experiment", failing_register_experiment
+    )
+    with pytest.raises(RuntimeError):
+        ingest_manifests([datadir])
+    assert not get_ingest_state_path(setup_storage).exists()
+
+    monkeypatch.undo()
+    result = ingest_manifests([datadir])
+    assert result.built == [(datadir / "manifest.json").resolve()]
+    assert len(result.report.inserted) == 4
+
+
+def test_invalid_manifest(datadir: Path) -> None:
+    manifest_path = datadir / "manifest.json"
+    spec = json.loads(manifest_path.read_text())
+
+    spec["monocomponent_isotherms"][0]["unknown"] = 1
+    manifest_path.write_text(json.dumps(spec))
+    manifest = load_manifest(manifest_path)
+    with pytest.raises(InvalidManifest, match="unknown"):
+        manifest.build_experiment(TextFileHandler(manifest.folder))
+
+    del spec["experiment"]
+    manifest_path.write_text(json.dumps(spec))
+    with pytest.raises(InvalidManifest):
+        load_manifest(manifest_path)
+
+
+def test_ingest_command(datadir: Path, capsys: CaptureFixture[str]) -> None:
+    main(["ingest", str(datadir)])
+    assert "1 built, 0 up to date, 0 failed" in capsys.readouterr().out
+
+    main(["ingest", str(datadir)])
+    assert "0 built, 1 up to date, 0 failed" in capsys.readouterr().out
+
+
+def test_ingest_manifests_errors(datadir: Path, setup_storage: Path) -> None:
+    manifest_path = (datadir / "manifest.json").resolve()
+    spec = json.loads(manifest_path.read_text())
+    spec["experiment"]["name"] = "Broken"
+    spec["monocomponent_isotherms"][1]["file_name"] = "missing.txt"
+    broken_path = (datadir / "broken.json").resolve()
+    broken_path.write_text(json.dumps(spec))
+
+    # a missing file fails its manifest only
+    result = ingest_manifests([datadir])
+    assert result.built == [manifest_path]
+    assert result.failed == [broken_path]
+    (error,) = result.errors
+    assert error.path == broken_path
+    assert error.file_name == "missing.txt"
+
+    # failed manifests are retried
+    result = ingest_manifests([datadir])
+    assert result.up_to_date == [manifest_path]
+    assert result.failed == [broken_path]
+
+    spec["monocomponent_isotherms"][1]["file_name"] = "pure_example.txt"
+    broken_path.write_text(json.dumps(spec))
+    result = ingest_manifests([datadir])
+    assert result.built == [broken_path]
+    assert result.errors == []
+
+
+def test_ingest_manifests_processes(
+    datadir: Path, setup_storage: Path
+) -> None:
+    source_path = datadir / "pure_example.txt"
+    source_path.write_text(source_path.read_text() + "\nnan\t4.0\t4.5\n")
+
+    result = ingest_manifests([datadir], processes=2, max_pending=1)
+    assert result.built == []
+    assert [error.file_name for error in result.errors] == [
+        "pure_example.txt",
+        "pure_example.txt",
+    ]
+    assert "non-finite pressures" in result.errors[0].message
+
+    source_path.write_text(source_path.read_text().replace("nan", "30.0"))
+    result = ingest_manifests([datadir], processes=2)
+    assert result.built == [(datadir / "manifest.json").resolve()]
+    assert len(result.report.inserted) == 4
+
+
+def test_ingest_manifests_parse_cache(
+    datadir: Path, setup_storage: Path, tmp_path: Path
+) -> None:
+    directory = tmp_path / "parse-cache"
+
+    # both monocomponent isotherms read the same file, which is parsed once
+    ingest_manifests([datadir], parse_cache_directory=directory)
+    info = get_parse_cache(directory).get_info()
+    assert (info.hits, info.misses) == (1, 2)
+    assert len(list(directory.glob("*.npy"))) == 2
+
+
+def test_ingest_command_errors(
+    datadir: Path, capsys: CaptureFixture[str]
+) -> None:
+    (datadir / "broken.json").write_text("{}")
+
+    with pytest.raises(SystemExit):
+        main(["ingest", str(datadir), "--processes", "1"])
+    out = capsys.readouterr().out
+    assert "Failed: " in out
+    assert "1 built, 0 up to date, 1 failed" in out
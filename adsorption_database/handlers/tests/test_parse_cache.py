@@ -0,0 +1,124 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pytest
+
+from adsorption_database.handlers.parse_cache import ParseCache
+from adsorption_database.handlers.text_file_hander import (
+    MonoIsothermTextFileData,
+    TextFileHandler,
+)
+from adsorption_database.models.adsorbate import Adsorbate
+
+
+@pytest.fixture
+def isotherm_path(tmp_path: Path) -> Path:
+    path = tmp_path / "isotherms.txt"
+    path.write_text("P\tn1\tn2\n1.0\t2.0\t3.0\n4.0\t5.0\t6.0\n")
+    return path
+
+
+def test_parse_cache(isotherm_path: Path) -> None:
+    cache = ParseCache()
+
+    table = cache.read(isotherm_path, [0, 1])
+    np.testing.assert_array_equal(table[:, 1], [2.0, 5.0])
+    with pytest.raises(IndexError):
+        table[:, 3]
+
+    # other columns of the same file are read from the cache
+    table[:, 0][:] = 0
+    table = cache.read(isotherm_path, [0, -1])
+    np.testing.assert_array_equal(table[:, 0], [1.0, 4.0])
+    np.testing.assert_array_equal(table[:, 2], [3.0, 6.0])
+    assert (cache.get_info().hits, cache.get_info().misses) == (1, 1)
+
+    # an edited file is parsed again
+    with open(isotherm_path, "a") as file:
+        file.write("7.0\t8.0\t9.0\n")
+    table = cache.read(isotherm_path, [0])
+    np.testing.assert_array_equal(table[:, 0], [1.0, 4.0, 7.0])
+    assert cache.get_info().misses == 2
+    assert cache.get_info().entries == 2
+
+    # parse options are part of the key
+    cache.read(isotherm_path, [0], engine="fast", comments="%")
+    assert cache.get_info().misses == 3
+
+
+def test_parse_cache_size(isotherm_path: Path, tmp_path: Path) -> None:
+    other_path = tmp_path / "other.txt"
+    other_path.write_text("1.0\t2.0\t3.0\n4.0\t5.0\t6.0\n")
+
+    cache = ParseCache(max_size=6 * 8)
+    cache.read(isotherm_path, [0])
+    cache.read(other_path, [0])
+    assert cache.get_info().entries == 1
+    assert cache.get_info().size == 48
+
+    cache.read(isotherm_path, [0])
+    assert cache.get_info().misses == 3
+
+
+def test_parse_cache_directory(isotherm_path: Path, tmp_path: Path) -> None:
+    directory = tmp_path / "parse-cache"
+
+    cache = ParseCache(directory)
+    cache.read(isotherm_path, [0])
+    assert len(list(directory.glob("*.npy"))) == 1
+
+    # a new cache, as in a later run, loads the parsed file
+    cache = ParseCache(directory)
+    table = cache.read(isotherm_path, [1])
+    np.testing.assert_array_equal(table[:, 1], [2.0, 5.0])
+    assert (cache.get_info().hits, cache.get_info().misses) == (1, 0)
+
+    cache.clear()
+    assert len(cache) == 0
+    assert list(directory.glob("*.npy")) == []
+
+
+def test_parse_cache_directory_threads(
+    isotherm_path: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    directory = tmp_path / "parse-cache"
+
+    # both threads write their temporary file at the same time
+    barrier = threading.Barrier(2, timeout=5)
+    save = np.save
+
+    def save_together(file: Any, values: np.ndarray) -> None:
+        barrier.wait()
+        save(file, values)
+
+    monkeypatch.setattr(np, "save", save_together)
+
+    def read(_: int) -> np.ndarray:
+        return ParseCache(directory).read(isotherm_path, [1])[:, 1]
+
+    with ThreadPoolExecutor(2) as pool:
+        for column in pool.map(read, range(2)):
+            np.testing.assert_array_equal(column, [2.0, 5.0])
+
+    assert [path.suffix for path in directory.iterdir()] == [".npy"]
+
+
+def test_parse_cache_handler(isotherm_path: Path) -> None:
+    cache = ParseCache()
+    handler = TextFileHandler(isotherm_path.parent, parse_cache=cache)
+    adsorbate = Adsorbate("adsorbate name", "adsorbate_formula")
+
+    for loadings_col in [1, 2]:
+        file_data = MonoIsothermTextFileData(
+            isotherm_path.name, adsorbate, 0, loadings_col
+        )
+        pressures, loadings = handler.get_mono_data(file_data)
+        np.testing.assert_array_equal(pressures, [1.0, 4.0])
+        np.testing.assert_array_equal(
+            loadings, [loadings_col + 1.0, loadings_col + 4.0]
+        )
+
+    assert (cache.get_info().hits, cache.get_info().misses) == (1, 1)
@@ -0,0 +1,86 @@
+from pathlib import Path
+from typing import List
+
+import numpy as np
+import pytest
+
+from adsorption_database.handlers.text_parser import (
+    LOADTXT,
+    TextDialect,
+    read_text_table,
+    sniff_dialect,
+)
+
+
+@pytest.mark.parametrize(
+    "lines, dialect",
+    [
+        (["1.0\t2.0\t3.0\n"], TextDialect("\t", 0, 3)),
+        (["# comment\n", "P, n\n", "1.0, 2.0\n"], TextDialect(",", 2, 2)),
+        (["\n", "P;n\n", "1.0;2.0 # comment\n"], TextDialect(";", 2, 2)),
+        (["1.0  2.0 \r\n"], TextDialect(None, 0, 2)),
+        (["1.0\n"], TextDialect(None, 0, 1)),
+        ([], TextDialect(None, 0, 0)),
+    ],
+)
+def test_sniff_dialect(lines: List[str], dialect: TextDialect) -> None:
+    assert sniff_dialect(lines) == dialect
+
+
+def test_sniff_dialect_without_numbers() -> None:
+    with pytest.raises(ValueError):
+        sniff_dialect(["P\tn\n", "1,5\t2,5\n"])
+
+
+def test_read_text_table(tmp_path: Path) -> None:
+    path = tmp_path / "isotherm.csv"
+    path.write_text(
+        "# exported isotherm\n"
+        "P (bar), n (mol/kg), T (K)\n"
+        "1.0, 2.0, 300\n"
+        "# a comment line\n"
+        "3.0, 4.0, 300\n"
+    )
+
+    table = read_text_table(path, [0, -2])
+    assert table.n_columns == 3
+    assert sorted(table.columns) == [0, 1]
+    np.testing.assert_array_equal(table[:, 0], [1.0, 3.0])
+    np.testing.assert_array_equal(table[:, 1], table[:, -2])
+    assert table[:, 0].dtype == np.float64
+    assert table[:, 0].flags.c_contiguous
+
+    with pytest.raises(IndexError):
+        table[:, 3]
+
+    # a column that exists but was not read
+    with pytest.raises(KeyError):
+        table[:, 2]
+
+
+def test_read_text_table_engines(tmp_path: Path) -> None:
+    path = tmp_path / "isotherm.txt"
+    values = np.random.default_rng(0).random((50, 4))
+    np.savetxt(path, values, header="pressure loading", delimiter="\t")
+
+    fast = read_text_table(path, [0, 2, 5])
+    loadtxt = read_text_table(path, [0, 2, 5], LOADTXT)
+
+    assert fast.n_columns == loadtxt.n_columns == 4
+    for column in [0, 2]:
+        np.testing.assert_array_equal(fast[:, column], values[:, column])
+        np.testing.assert_array_equal(loadtxt[:, column], values[:, column])
+
+    with pytest.raises(ValueError, match="Unknown text parser engine"):
+        read_text_table(path, [0], "pandas")
+
+
+def test_read_text_table_mixed_tabs_and_spaces(tmp_path: Path) -> None:
+    path = tmp_path / "isotherm.txt"
+    path.write_text("1.0\t2.0\n3.0 4.0\n5.0 \t 6.0\n")
+
+    table = read_text_table(path, [0, 1])
+
+    assert table.n_columns == 2
+    np.testing.assert_array_equal(table[:, 0], [1.0, 3.0, 5.0])
+    np.testing.assert_array_equal(table[:, 1], [2.0, 4.0, 6.0])
@@ -7,6 +7,14 @@ from adsorption_database.models import (
     MixIsothermFileData,
 )
 from adsorption_database.handlers.abstract_handler import AbstractHandler
+from adsorption_database.handlers.parse_cache import ParseCache
+from adsorption_database.handlers.text_parser import (
+    ENGINES,
+    FAST,
+    TextTable,
+    read_text_table,
+)
+from adsorption_database.storage_options import StorageOptions
 import numpy as np
 
 import numpy.typing as npt
@@ -49,19 +57,63 @@ class TextFileHandler(
     and multi-component isotherms.
     """
 
-    def __init__(self, folder: Path) -> None:
+    def __init__(
+        self,
+        folder: Path,
+        storage_options: Optional[StorageOptions] = None,
+        point_store: bool = False,
+        incremental: bool = False,
+        engine: str = FAST,
+        parse_cache: Optional[ParseCache] = None,
+    ) -> None:
         """
         Constructor to initialize the TextFileHandler object.
 
         Args:
             folder (Optional[Path]): The folder path where the text files are located. Defaults to None, in which case
             the default folder path will be used.
+            storage_options (Optional[StorageOptions]): The layout and filters of the isotherm datasets written by the
+            handler. Defaults to None, in which case datasets are stored contiguously and uncompressed.
+            point_store (bool): Whether to create the consolidated point store when isotherms are registered.
+            Defaults to False.
+            incremental (bool): Whether to skip the experiments and isotherms whose stored content hash is unchanged.
+            Defaults to False.
+            engine (str): The text parser engine, "fast" or "loadtxt" (see `text_parser.read_text_table`). Defaults
+            to "fast".
+            parse_cache (Optional[ParseCache]): The cache of parsed files, so a file read for several isotherms is
+            parsed once. It can be shared by handlers. Defaults to None, in which case files are parsed on every read.
 
         Returns:
             None
+
+        Raises:
+            ValueError: If the engine is unknown.
         """
-        super().__init__()
+        if engine not in ENGINES:
+            raise ValueError(
+                f"Unknown text parser engine {engine}, expected one of {ENGINES}"
+            )
+
+        super().__init__(storage_options, point_store, incremental)
         self._folder_path = folder
+        self._engine = engine
+        self._parse_cache = parse_cache
+
+    def read_table(self, file_name: str, columns: List[int]) -> TextTable:
+        """
+        Read columns of a text file of the handler folder.
+
+        Args:
+            file_name (str): The file name.
+            columns (List[int]): The column indices to read.
+
+        Returns:
+            TextTable: The columns read, looked up with `table[:, col]`.
+        """
+        file_path = self._folder_path / file_name
+        if self._parse_cache is not None:
+            return self._parse_cache.read(file_path, columns, self._engine)
+        return read_text_table(file_path, columns, self._engine)
 
     def get_mono_data(
         self, file_data: MonoIsothermTextFileData
@@ -76,9 +128,10 @@ class TextFileHandler(
         Returns:
             Tuple[List[float], List[float]]: A tuple containing two lists: pressures and loadings.
         """
-        file_path = self._folder_path / file_data.file_name
-
-        file = np.loadtxt(file_path)
+        file = self.read_table(
+            file_data.file_name,
+            [file_data.pressures_col, file_data.loadings_col],
+        )
         pressures = file[:, file_data.pressures_col]
         loadings = file[:, file_data.loadings_col]
 
@@ -110,6 +163,16 @@ class TextFileHandler(
 
         return pressures, loadings
 
+    @staticmethod
+    def _sum_components(
+        components: List[npt.NDArray[np.float64]], size: int
+    ) -> npt.NDArray[np.float64]:
+        # Summed component by component, in order, as the missing fraction always was
+        total = np.zeros(size)
+        for component in components:
+            total = total + component
+        return total
+
     def get_bulk_composition(
         self,
         file: Any,
@@ -122,13 +185,9 @@ class TextFileHandler(
                 component_compositions = file[:, file_data.composition_cols[index]]  # type: ignore[attr-defined]
             except IndexError:
                 if file_data.load_missing_composition_from_equilibrium:  # type: ignore[attr-defined]
-                    component_compositions = []
-
-                    for index in range(len(pressures)):
-                        x_sum = 0
-                        for comp in compositions_list:
-                            x_sum += list(comp)[index]
-                        component_compositions.append(1 - x_sum)
+                    component_compositions = 1 - self._sum_components(
+                        compositions_list, len(pressures)
+                    )
                 else:
                     raise
             compositions_list.append(np.array(component_compositions))
@@ -154,13 +213,9 @@ class TextFileHandler(
                 component_compositions = file[:, x_cols[index]]
             except IndexError:
                 if file_data.get_loadings_from_adsorbed.get_missing_x_from_eq:  # type: ignore[attr-defined]
-                    component_compositions = []
-
-                    for index in range(len(pressures)):
-                        x_sum = 0
-                        for comp in adsorbed_x_list:
-                            x_sum += list(comp)[index]
-                        component_compositions.append(1 - x_sum)
+                    component_compositions = 1 - self._sum_components(
+                        adsorbed_x_list, len(pressures)
+                    )
                 else:
                     raise
             adsorbed_x_list.append(np.array(component_compositions))
@@ -202,6 +257,24 @@ class TextFileHandler(
 
         return pressures, loadings_list
 
+    def get_mix_columns(self, file_data: MixIsothermTextFileData) -> List[int]:
+        """
+        Get the columns read for a multi-component isotherm.
+
+        Args:
+            file_data (MixIsothermTextFileData): The file data.
+
+        Returns:
+            List[int]: The pressure, loading (or adsorbed composition and total loading) and composition columns.
+        """
+        columns = [file_data.pressures_col, *file_data.composition_cols]
+        get_loadings = file_data.get_loadings_from_adsorbed
+        if get_loadings is not None:
+            columns.extend([*get_loadings.pos_x, get_loadings.pos_nt])
+        else:
+            columns.extend(file_data.loadings_cols)
+        return columns
+
     def get_mix_data(
         self, file_data: MixIsothermTextFileData
     ) -> Tuple[
@@ -220,9 +293,9 @@ class TextFileHandler(
             Tuple[np.array, np.ndarray, np.ndarray]: A tuple containing three lists: pressures,
             loadings, and compositions.
         """
-        file_path = self._folder_path / file_data.file_name
-
-        file = np.loadtxt(file_path)
+        file = self.read_table(
+            file_data.file_name, self.get_mix_columns(file_data)
+        )
         pressures = file[:, file_data.pressures_col]
         loadings_list = self.get_loading_list(file, file_data, pressures)
         compositions_list = self.get_bulk_composition(
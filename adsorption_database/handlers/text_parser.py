@@ -0,0 +1,221 @@
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+import numpy.typing as npt
+from attr import define
+
+FAST = "fast"
+LOADTXT = "loadtxt"
+ENGINES = (FAST, LOADTXT)
+
+COMMENTS = "#"
+
+# Tried in order on the first data line, None standing for any whitespace
+DELIMITERS = ("\t", ",", ";", None)
+
+
+@define
+class TextDialect:
+    """
+    The layout of a delimited text file, as detected by `sniff_dialect`.
+
+    Attributes:
+        delimiter (Optional[str]): The column delimiter, or None for any whitespace.
+        skip_rows (int): The number of header, comment and blank lines before the first data line.
+        n_columns (int): The number of columns of the first data line.
+    """
+
+    delimiter: Optional[str]
+    skip_rows: int
+    n_columns: int
+
+
+@define
+class TextTable:
+    """
+    The float64 columns read from a text file.
+
+    Columns are looked up as in a 2D array, with `table[:, col]`, so code written against `np.loadtxt` results keeps
+    working. Like an array, a column beyond the columns of the file raises IndexError.
+
+    Attributes:
+        columns (Dict[int, npt.NDArray[np.float64]]): The columns read, by index.
+        n_columns (int): The number of columns of the file.
+    """
+
+    columns: Dict[int, npt.NDArray[np.float64]]
+    n_columns: int
+
+    def __getitem__(self, key: Tuple[Any, int]) -> npt.NDArray[np.float64]:
+        rows, column = key
+        if rows != slice(None):
+            raise TypeError("Only whole columns can be read from a table")
+        return self.get_column(column)
+
+    def get_column(self, column: int) -> npt.NDArray[np.float64]:
+        """
+        Get a column of the table.
+
+        Args:
+            column (int): The column index, negative indices counting from the last column.
+
+        Returns:
+            npt.NDArray[np.float64]: The column values.
+
+        Raises:
+            IndexError: If the file has no such column.
+            KeyError: If the column exists but was not read.
+        """
+        if not -self.n_columns <= column < self.n_columns:
+            raise IndexError(
+                f"Column {column} is out of bounds for a file with {self.n_columns} columns"
+            )
+        return self.columns[column % self.n_columns]
+
+
+def _is_number_row(fields: Sequence[str]) -> bool:
+    try:
+        for field in fields:
+            float(field)
+    except ValueError:
+        return False
+    return True
+
+
+def sniff_dialect(
+    lines: Iterable[str], comments: Optional[str] = COMMENTS
+) -> TextDialect:
+    """
+    Detect the delimiter, the header lines and the number of columns of a text file.
+
+    The first line whose fields, split by one of `DELIMITERS`, are all numbers is the first data line. The lines
+    before it are headers, comments or blank, and are skipped.
+
+    Args:
+        lines (Iterable[str]): The file lines. Only the lines up to the first data line are read.
+        comments (Optional[str]): The character starting a comment. Defaults to "#".
+
+    Returns:
+        TextDialect: The dialect. An empty file has no columns.
+
+    Raises:
+        ValueError: If the file has text but no data line.
+    """
+    has_text = False
+    for index, line in enumerate(lines):
+        if comments:
+            line = line.split(comments, 1)[0]
+        line = line.strip()
+        if not line:
+            continue
+
+        has_text = True
+        for delimiter in DELIMITERS:
+            fields = line.split(delimiter)
+            if (delimiter is None or len(fields) > 1) and _is_number_row(
+                fields
+            ):
+                return TextDialect(delimiter, index, len(fields))
+
+    if has_text:
+        raise ValueError("No line of numbers found")
+
+    return TextDialect(None, 0, 0)
+
+
+def get_used_columns(
+    columns: Optional[Iterable[int]], n_columns: int
+) -> List[int]:
+    """
+    Get the columns of a file to read.
+
+    Args:
+        columns (Optional[Iterable[int]]): The requested column indices, negative indices counting from the last
+            column, or None for every column.
+        n_columns (int): The number of columns of the file.
+
+    Returns:
+        List[int]: The sorted, non-negative indices of the requested columns the file has.
+    """
+    if columns is None:
+        return list(range(n_columns))
+
+    return sorted(
+        {
+            column % n_columns
+            for column in columns
+            if -n_columns <= column < n_columns
+        }
+    )
+
+
+def read_text_table(
+    path: Path,
+    columns: Optional[Iterable[int]],
+    engine: str = FAST,
+    comments: Optional[str] = COMMENTS,
+) -> TextTable:
+    """
+    Read columns of numbers from a delimited text file.
+
+    The `fast` engine detects the dialect of the file (see `sniff_dialect`) and has the C reader of `np.loadtxt`
+    parse only the requested columns, with the detected delimiter. Every value of the file is still tokenized, but only
+    the requested columns are converted and stored, which roughly halves the read time of wide files. Comma and
+    semicolon delimited files and files with header lines are supported, and tab delimited files are split on any
+    whitespace, so lines mixing tabs and spaces are read as well. The `loadtxt` engine reads the whole file
+    with `np.loadtxt` and its defaults (whitespace delimited, no header), as the handlers used to.
+
+    Requested columns beyond the columns of the file are not read, and raise IndexError when looked up in the table.
+
+    Args:
+        path (Path): The file path.
+        columns (Optional[Iterable[int]]): The column indices to read, negative indices counting from the last
+            column, or None for every column.
+        engine (str): `FAST` or `LOADTXT`. Defaults to `FAST`.
+        comments (Optional[str]): The character starting a comment. Defaults to "#".
+
+    Returns:
+        TextTable: The columns read.
+
+    Raises:
+        ValueError: If the engine is unknown, or if a line can not be parsed.
+    """
+    if engine not in ENGINES:
+        raise ValueError(
+            f"Unknown text parser engine {engine}, expected one of {ENGINES}"
+        )
+
+    if engine == LOADTXT:
+        values = np.loadtxt(path, dtype=np.float64, comments=comments, ndmin=2)
+        n_columns = values.shape[1] if values.size else 0
+        used_columns = get_used_columns(columns, n_columns)
+        return TextTable(
+            {column: values[:, column] for column in used_columns}, n_columns
+        )
+
+    with open(path) as file:
+        dialect = sniff_dialect(file, comments)
+
+    n_columns = dialect.n_columns
+    used_columns = get_used_columns(columns, n_columns)
+    if not used_columns:
+        return TextTable({}, n_columns)
+
+    # Tab delimited files are split on any whitespace, as exports often mix tabs and spaces
+    delimiter = None if dialect.delimiter == "\t" else dialect.delimiter
+    values = np.loadtxt(
+        path,
+        dtype=np.float64,
+        comments=comments,
+        delimiter=delimiter,
+        skiprows=dialect.skip_rows,
+        usecols=used_columns,
+        ndmin=2,
+    )
+    # A single copy makes each column contiguous
+    values = np.ascontiguousarray(values.T)
+    return TextTable(
+        {column: values[i] for i, column in enumerate(used_columns)},
+        n_columns,
+    )
@@ -0,0 +1,44 @@
+from typing import Callable, Dict, List, Optional, Set
+
+from attr import Factory, define
+from h5py import File
+
+from adsorption_database.models.adsorbate import Adsorbate
+from adsorption_database.models.adsorbent import Adsorbent
+from adsorption_database.models.experiment import Experiment
+
+
+@define
+class WriteSession:
+    """
+    State shared by every register call made while a storage file is open for writing.
+
+    The session holds the single editable handle and remembers which adsorbates and adsorbents were already written,
+    so objects shared by many isotherms are dumped only once per session. It also records the experiments and
+    isotherm groups written, so derived data such as the point store and the catalog is refreshed once, when the
+    session ends.
+
+    The file is only opened when `file` is first accessed, since opening a HDF5 file for writing modifies it even if
+    nothing is written. A session whose register calls all skip their objects leaves the storage file untouched.
+    """
+
+    _open_file: Callable[[], File]
+    registered_adsorbates: Dict[str, Adsorbate] = Factory(dict)
+    registered_adsorbents: Dict[str, Adsorbent] = Factory(dict)
+    registered_experiments: List[Experiment] = Factory(list)
+    registered_isotherm_routes: Set[str] = Factory(set)
+    _file: Optional[File] = None
+
+    @property
+    def file(self) -> File:
+        if self._file is None:
+            self._file = self._open_file()
+        return self._file
+
+    @property
+    def is_open(self) -> bool:
+        return self._file is not None
+
+    @property
+    def isotherms_changed(self) -> bool:
+        return len(self.registered_isotherm_routes) > 0
@@ -0,0 +1,29 @@
+from typing import Optional, Tuple
+from attrs import define
+
+from adsorption_database.defaults import MIXTURE_ISOTHERMS
+from adsorption_database.models.isotherms import IsothermType
+
+
+@define(frozen=True)
+class IsothermHandle:
+    """
+    Catalog entry of a stored isotherm, without its points.
+
+    Handles are returned by queries over the catalog, and loaded in bulk with `AdsorptionDatabase.load_isotherms`.
+    """
+
+    route: str
+    experiment: str
+    kind: str
+    name: str
+    isotherm_type: IsothermType
+    temperature: Optional[float]
+    adsorbates: Tuple[str, ...]
+    points: int
+    min_pressure: Optional[float]
+    max_pressure: Optional[float]
+
+    @property
+    def is_mixture(self) -> bool:
+        return self.kind == MIXTURE_ISOTHERMS
@@ -0,0 +1,65 @@
+from typing import List
+from attrs import define
+import numpy as np
+import numpy.typing as npt
+
+
+@define
+class PointTable:
+    """
+    Points of every isotherm of a kind, concatenated along the last axis.
+
+    The points of the isotherm stored at `routes[i]` are the columns `offsets[i]:offsets[i + 1]` of the point arrays.
+    """
+
+    routes: List[str]
+    offsets: npt.NDArray[np.int64]
+    temperatures: npt.NDArray[np.float64]
+    pressures: npt.NDArray[np.float64]
+    loadings: npt.NDArray[np.float64]
+
+    @property
+    def isotherm_ids(self) -> npt.NDArray[np.int64]:
+        """
+        Get the index in `routes` of the isotherm of each point.
+
+        Returns:
+            np.ndarray: The isotherm index of each point.
+        """
+        return np.repeat(
+            np.arange(len(self.routes), dtype=np.int64), np.diff(self.offsets)
+        )
+
+    def get_isotherm_slice(self, route: str) -> slice:
+        """
+        Get the slice of the point arrays holding the points of an isotherm.
+
+        Args:
+            route (str): The route of the isotherm group, e.g. `/Experiments/<name>/Pure/<isotherm>`.
+
+        Returns:
+            slice: The slice of the points of the isotherm.
+
+        Raises:
+            ValueError: If the isotherm is not in the table.
+        """
+        index = self.routes.index(route)
+        return slice(int(self.offsets[index]), int(self.offsets[index + 1]))
+
+
+@define
+class PurePointTable(PointTable):
+    heats_of_adsorption: npt.NDArray[np.float64]
+
+
+@define
+class MixturePointTable(PointTable):
+    """
+    Points of every mixture isotherm.
+
+    `loadings` and `bulk_composition` have one row per component, padded with NaN for isotherms with less components
+    than the largest mixture.
+    """
+
+    components: npt.NDArray[np.int64]
+    bulk_composition: npt.NDArray[np.float64]
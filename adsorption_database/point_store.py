@@ -0,0 +1,560 @@
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+import numpy as np
+import numpy.typing as npt
+from attr import evolve
+from h5py import Group
+
+from adsorption_database.defaults import (
+    EXPERIMENTS,
+    GENERATION,
+    MIXTURE_ISOTHERMS,
+    MONO_ISOTHERMS,
+    POINTS,
+)
+from adsorption_database.models.points import (
+    MixturePointTable,
+    PurePointTable,
+)
+from adsorption_database.serializers.abstract_serializer import (
+    UpsertStats,
+    can_resize,
+    set_attribute,
+)
+from adsorption_database.serializers.point_table_serializer import (
+    PointTableSerializer,
+)
+from adsorption_database.storage_options import StorageOptions
+
+
+def _get_offsets(sizes: List[int]) -> npt.NDArray[np.int64]:
+    offsets: npt.NDArray[np.int64] = np.zeros(len(sizes) + 1, dtype=np.int64)
+    np.cumsum(sizes, out=offsets[1:])
+    return offsets
+
+
+def _concatenate(
+    arrays: List[npt.NDArray[np.float64]], rows: Optional[int] = None
+) -> npt.NDArray[np.float64]:
+    """
+    Concatenate point arrays along their last axis, padding 2D arrays to `rows` rows with NaN.
+    """
+    if rows is None:
+        if not arrays:
+            return np.zeros(0, dtype=np.float64)
+        return np.concatenate(arrays).astype(np.float64, copy=False)
+
+    padded = np.full((rows, sum(array.shape[-1] for array in arrays)), np.nan)
+    start = 0
+    for array in arrays:
+        end = start + array.shape[-1]
+        padded[: array.shape[0], start:end] = array
+        start = end
+    return padded
+
+
+# Point table fields holding one value per isotherm, the others hold one value per point
+_ISOTHERM_FIELDS = ["routes", "offsets", "temperatures", "components"]
+
+
+def iter_isotherm_groups(file: Group, kind: str) -> Iterator[Group]:
+    """
+    Iterate over the isotherm groups of a kind, in storage order, without listing them all first.
+
+    Args:
+        file (Group): The storage file.
+        kind (str): `MONO_ISOTHERMS` or `MIXTURE_ISOTHERMS`.
+
+    Returns:
+        Iterator[Group]: The isotherm groups.
+    """
+    experiments = file.get(EXPERIMENTS)
+    if experiments is None:
+        return
+
+    for experiment_name in experiments:
+        isotherms = experiments[experiment_name].get(kind)
+        if isotherms is None:
+            continue
+        for name in isotherms:
+            yield isotherms[name]
+
+
+def build_pure_point_table(file: Group) -> PurePointTable:
+    """
+    Build the point table of every pure isotherm of the storage file from the isotherm groups.
+
+    Missing heats of adsorption are filled with NaN.
+
+    Args:
+        file (Group): The storage file.
+
+    Returns:
+        PurePointTable: The pure isotherm points.
+    """
+    return _build_pure_point_table(iter_isotherm_groups(file, MONO_ISOTHERMS))
+
+
+def _build_pure_point_table(groups: Iterable[Group]) -> PurePointTable:
+    routes, temperatures, sizes = [], [], []
+    pressures, loadings, heats = [], [], []
+
+    for group in groups:
+        isotherm_pressures = group["pressures"][...]
+        routes.append(group.name)
+        temperatures.append(group.attrs.get("temperature", np.nan))
+        sizes.append(isotherm_pressures.shape[-1])
+        pressures.append(isotherm_pressures)
+        loadings.append(group["loadings"][...])
+        if "heats_of_adsorption" in group:
+            heats.append(group["heats_of_adsorption"][...])
+        else:
+            heats.append(np.full(isotherm_pressures.shape, np.nan))
+
+    return PurePointTable(
+        routes=routes,
+        offsets=_get_offsets(sizes),
+        temperatures=np.array(temperatures, dtype=np.float64),
+        pressures=_concatenate(pressures),
+        loadings=_concatenate(loadings),
+        heats_of_adsorption=_concatenate(heats),
+    )
+
+
+def build_mixture_point_table(file: Group) -> MixturePointTable:
+    """
+    Build the point table of every mixture isotherm of the storage file from the isotherm groups.
+
+    Args:
+        file (Group): The storage file.
+
+    Returns:
+        MixturePointTable: The mixture isotherm points.
+    """
+    return _build_mixture_point_table(
+        iter_isotherm_groups(file, MIXTURE_ISOTHERMS)
+    )
+
+
+def _build_mixture_point_table(groups: Iterable[Group]) -> MixturePointTable:
+    routes, temperatures, sizes, components = [], [], [], []
+    pressures, loadings, bulk_compositions = [], [], []
+
+    for group in groups:
+        isotherm_loadings = np.atleast_2d(group["loadings"][...])
+        routes.append(group.name)
+        temperatures.append(group.attrs.get("temperature", np.nan))
+        sizes.append(isotherm_loadings.shape[-1])
+        components.append(isotherm_loadings.shape[0])
+        pressures.append(group["pressures"][...])
+        loadings.append(isotherm_loadings)
+        bulk_compositions.append(np.atleast_2d(group["bulk_composition"][...]))
+
+    rows = max(components, default=0)
+
+    return MixturePointTable(
+        routes=routes,
+        offsets=_get_offsets(sizes),
+        temperatures=np.array(temperatures, dtype=np.float64),
+        pressures=_concatenate(pressures),
+        loadings=_concatenate(loadings, rows),
+        components=np.array(components, dtype=np.int64),
+        bulk_composition=_concatenate(bulk_compositions, rows),
+    )
+
+
+def has_point_store(file: Group) -> bool:
+    return POINTS in file
+
+
+def _get_generation(group: Group) -> int:
+    return int(group.attrs.get(GENERATION, 0))
+
+
+def is_point_store_fresh(file: Group) -> bool:
+    """
+    Check whether the storage file has a point store reflecting its isotherm groups.
+
+    The store holds the generation of the file it was last written at. Isotherm data written outside a handler write
+    session (e.g. with `AbstractSerializer.append_dataset`) increments the generation of the file (see
+    `mark_point_store_stale`), so the store is stale until a handler rebuilds it.
+
+    Args:
+        file (Group): The storage file.
+
+    Returns:
+        bool: True if the file has a point store of its current generation.
+    """
+    return has_point_store(file) and _get_generation(
+        file[POINTS]
+    ) == _get_generation(file)
+
+
+def _get_point_store_options(
+    storage_options: Optional[StorageOptions],
+) -> Optional[StorageOptions]:
+    if storage_options is not None and storage_options.deduplicate:
+        # Tables change with every isotherm, so sharing them would only leave orphaned blobs behind
+        return evolve(storage_options, deduplicate=False)
+    return storage_options
+
+
+def _write_point_table(
+    file: Group,
+    kind: str,
+    storage_options: Optional[StorageOptions],
+    upsert_stats: Optional[UpsertStats],
+) -> None:
+    table: Any = (
+        build_pure_point_table(file)
+        if kind == MONO_ISOTHERMS
+        else build_mixture_point_table(file)
+    )
+    serializer = PointTableSerializer(
+        type(table), storage_options, upsert_stats
+    )
+    serializer.dump(table, file.require_group(POINTS).require_group(kind))
+
+
+def _mark_point_store_fresh(file: Group) -> None:
+    set_attribute(file[POINTS], GENERATION, np.int64(_get_generation(file)))
+
+
+def write_point_store(
+    file: Group,
+    storage_options: Optional[StorageOptions] = None,
+    upsert_stats: Optional[UpsertStats] = None,
+) -> None:
+    """
+    Create or rebuild the consolidated point store of the storage file.
+
+    The store holds every isotherm point in two tables, `/Points/Pure` and `/Points/Mixture`, so whole-database scans
+    are a handful of bulk reads instead of several tiny reads per isotherm. The tables are rebuilt from every
+    isotherm group, which remain the source of truth, and overwritten in place where their size allows it. Table
+    datasets are chunked and unlimited, so `update_point_store` can append to them.
+
+    Args:
+        file (Group): The storage file, open for writing.
+        storage_options (Optional[StorageOptions]): The filters and chunk size of the table datasets. Defaults to
+            None.
+        upsert_stats (Optional[UpsertStats]): The counters updated by the table writes. Defaults to None.
+    """
+    storage_options = _get_point_store_options(storage_options)
+    for kind in [MONO_ISOTHERMS, MIXTURE_ISOTHERMS]:
+        _write_point_table(file, kind, storage_options, upsert_stats)
+    _mark_point_store_fresh(file)
+
+
+def update_point_store(
+    file: Group,
+    routes: Iterable[str],
+    storage_options: Optional[StorageOptions] = None,
+    upsert_stats: Optional[UpsertStats] = None,
+) -> None:
+    """
+    Refresh the rows of the given isotherm groups in the point store of the storage file.
+
+    Only the given isotherm groups are read. The rows of isotherms that keep their number of points (and fit the
+    component rows of the mixture table) are overwritten in place, and the rows of new isotherms are appended to the
+    tables. A table is rebuilt from every isotherm group (see `write_point_store`) if an isotherm changed size or the
+    table can not grow, and the whole store is rebuilt if it is stale (see `is_point_store_fresh`).
+
+    Args:
+        file (Group): The storage file, open for writing.
+        routes (Iterable[str]): The routes of the isotherm groups written, e.g. `/Experiments/<name>/Pure/<isotherm>`.
+        storage_options (Optional[StorageOptions]): The filters and chunk size of rebuilt table datasets. Defaults
+            to None.
+        upsert_stats (Optional[UpsertStats]): The counters updated by rebuilt table writes. Defaults to None.
+    """
+    if not is_point_store_fresh(file):
+        write_point_store(file, storage_options, upsert_stats)
+        return
+
+    storage_options = _get_point_store_options(storage_options)
+    for kind in [MONO_ISOTHERMS, MIXTURE_ISOTHERMS]:
+        groups = [
+            file[route]
+            for route in sorted(routes)
+            if route.split("/")[-2] == kind
+        ]
+        if not groups:
+            continue
+        points = file[POINTS].get(kind)
+        if points is None or not _update_point_table(points, kind, groups):
+            _write_point_table(file, kind, storage_options, upsert_stats)
+
+    _mark_point_store_fresh(file)
+
+
+def _get_table_fields(kind: str) -> Tuple[List[str], List[str]]:
+    """
+    Get the isotherm and point dataset fields of a point table, besides the routes and offsets.
+    """
+    model_class = (
+        PurePointTable if kind == MONO_ISOTHERMS else MixturePointTable
+    )
+    dataset_names = PointTableSerializer(model_class).get_datasets()
+    isotherm_fields = [
+        name
+        for name in dataset_names
+        if name in _ISOTHERM_FIELDS and name != "offsets"
+    ]
+    point_fields = [
+        name for name in dataset_names if name not in _ISOTHERM_FIELDS
+    ]
+    return isotherm_fields, point_fields
+
+
+def _build_point_table(
+    kind: str, groups: Iterable[Group]
+) -> Union[PurePointTable, MixturePointTable]:
+    if kind == MONO_ISOTHERMS:
+        return _build_pure_point_table(groups)
+    return _build_mixture_point_table(groups)
+
+
+def _pad_rows(
+    values: npt.NDArray[np.float64], rows: int
+) -> npt.NDArray[np.float64]:
+    if values.ndim == 1 or values.shape[0] == rows:
+        return values
+    padded = np.full((rows, values.shape[1]), np.nan)
+    padded[: values.shape[0]] = values
+    return padded
+
+
+def _update_point_table(points: Group, kind: str, groups: List[Group]) -> bool:
+    """
+    Overwrite or append the rows of isotherm groups in a point table.
+
+    Returns:
+        bool: False if the table must be rebuilt instead.
+    """
+    routes = list(points["routes"].asstr()[...])
+    indices = {route: index for index, route in enumerate(routes)}
+    existing = [group for group in groups if group.name in indices]
+    new = [group for group in groups if group.name not in indices]
+
+    if existing and not _overwrite_rows(
+        points, kind, _build_point_table(kind, existing), indices
+    ):
+        return False
+
+    return not new or _append_rows(points, kind, _build_point_table(kind, new))
+
+
+def _overwrite_rows(
+    points: Group,
+    kind: str,
+    table: Union[PurePointTable, MixturePointTable],
+    indices: Dict[str, int],
+) -> bool:
+    offsets = points["offsets"][...]
+    sizes = np.diff(table.offsets)
+    rows = points["loadings"].shape[0] if kind == MIXTURE_ISOTHERMS else 0
+
+    targets = [indices[route] for route in table.routes]
+    for size, index in zip(sizes, targets):
+        if offsets[index + 1] - offsets[index] != size:
+            return False
+    if isinstance(table, MixturePointTable) and np.any(
+        table.components > rows
+    ):
+        return False
+
+    isotherm_fields, point_fields = _get_table_fields(kind)
+    for position, index in enumerate(targets):
+        for name in isotherm_fields:
+            points[name][index] = getattr(table, name)[position]
+
+        start, end = int(offsets[index]), int(offsets[index + 1])
+        first, last = int(table.offsets[position]), int(
+            table.offsets[position + 1]
+        )
+        for name in point_fields:
+            values = getattr(table, name)[..., first:last]
+            points[name][..., start:end] = _pad_rows(values, rows)
+    return True
+
+
+def _append_rows(
+    points: Group, kind: str, table: Union[PurePointTable, MixturePointTable]
+) -> bool:
+    isotherm_fields, point_fields = _get_table_fields(kind)
+    count = points["routes"].shape[0]
+    total = int(points["offsets"][-1])
+    added = len(table.routes)
+    added_points = int(table.offsets[-1])
+
+    shapes: Dict[str, Tuple[int, ...]] = {
+        "routes": (count + added,),
+        "offsets": (count + added + 1,),
+    }
+    for name in isotherm_fields:
+        shapes[name] = (count + added,)
+    for name in point_fields:
+        shape = points[name].shape
+        if len(shape) == 2:
+            rows = max(shape[0], getattr(table, name).shape[0])
+            shapes[name] = (rows, total + added_points)
+        else:
+            shapes[name] = (total + added_points,)
+
+    if not all(
+        can_resize(points[name], shape) for name, shape in shapes.items()
+    ):
+        return False
+
+    for name, shape in shapes.items():
+        dataset = points[name]
+        old_rows = dataset.shape[0]
+        dataset.resize(shape)
+        if len(shape) == 2 and shape[0] > old_rows:
+            # rows added to the table are padding of the previous isotherms
+            dataset[old_rows:, :total] = np.nan
+
+    points["routes"][count:] = np.array(table.routes, dtype=object)
+    points["offsets"][-added:] = table.offsets[1:] + total
+    for name in isotherm_fields:
+        points[name][count:] = getattr(table, name)
+    for name in point_fields:
+        rows = shapes[name][0]
+        points[name][..., total:] = _pad_rows(getattr(table, name), rows)
+    return True
+
+
+def read_pure_point_table(
+    file: Group, memory_map: bool = False
+) -> PurePointTable:
+    """
+    Read the pure isotherm points from the point store, or build them from the isotherm groups if the store is
+    missing or stale (see `is_point_store_fresh`).
+
+    Args:
+        file (Group): The storage file.
+        memory_map (bool): Whether to memory map the table arrays instead of copying them. Defaults to False.
+
+    Returns:
+        PurePointTable: The pure isotherm points.
+    """
+    if not is_point_store_fresh(file):
+        return build_pure_point_table(file)
+
+    serializer = PointTableSerializer(PurePointTable, memory_map=memory_map)
+    table: PurePointTable = serializer.load(file[POINTS][MONO_ISOTHERMS])
+    return table
+
+
+def read_mixture_point_table(
+    file: Group, memory_map: bool = False
+) -> MixturePointTable:
+    """
+    Read the mixture isotherm points from the point store, or build them from the isotherm groups if the store is
+    missing or stale (see `is_point_store_fresh`).
+
+    Args:
+        file (Group): The storage file.
+        memory_map (bool): Whether to memory map the table arrays instead of copying them. Defaults to False.
+
+    Returns:
+        MixturePointTable: The mixture isotherm points.
+    """
+    if not is_point_store_fresh(file):
+        return build_mixture_point_table(file)
+
+    serializer = PointTableSerializer(MixturePointTable, memory_map=memory_map)
+    table: MixturePointTable = serializer.load(file[POINTS][MIXTURE_ISOTHERMS])
+    return table
+
+
+def iter_point_tables(
+    file: Group, kind: str, batch_size: int = 65536
+) -> Iterator[Union[PurePointTable, MixturePointTable]]:
+    """
+    Iterate over the points of every isotherm of a kind, in batches of whole isotherms.
+
+    Each batch holds the isotherms following the previous batch, until it has at least `batch_size` points, so
+    memory stays bounded by the batch size (and the largest isotherm) regardless of the size of the storage file.
+    Batches are sliced from the point store if it is fresh, and built from the isotherm groups otherwise. Batch
+    offsets start at zero; mixture arrays are padded to at least the number of components of the largest mixture of
+    the batch.
+
+    Args:
+        file (Group): The storage file.
+        kind (str): `MONO_ISOTHERMS` or `MIXTURE_ISOTHERMS`.
+        batch_size (int): The number of points of each batch. Defaults to 65536.
+
+    Returns:
+        Iterator[Union[PurePointTable, MixturePointTable]]: The point table of each batch.
+
+    Raises:
+        ValueError: If the kind is unknown or the batch size is not positive.
+    """
+    if kind not in [MONO_ISOTHERMS, MIXTURE_ISOTHERMS]:
+        raise ValueError(f"Unknown isotherm kind {kind}")
+    if batch_size <= 0:
+        raise ValueError("batch_size must be positive")
+
+    if is_point_store_fresh(file):
+        yield from _iter_point_store_tables(
+            file[POINTS][kind], kind, batch_size
+        )
+        return
+
+    build = (
+        _build_pure_point_table
+        if kind == MONO_ISOTHERMS
+        else _build_mixture_point_table
+    )
+    groups: List[Group] = []
+    points = 0
+    for group in iter_isotherm_groups(file, kind):
+        groups.append(group)
+        points += group["pressures"].shape[-1]
+        if points >= batch_size:
+            yield build(groups)
+            groups, points = [], 0
+
+    if groups:
+        yield build(groups)
+
+
+def _iter_point_store_tables(
+    group: Group, kind: str, batch_size: int
+) -> Iterator[Union[PurePointTable, MixturePointTable]]:
+    model_class: Any = (
+        PurePointTable if kind == MONO_ISOTHERMS else MixturePointTable
+    )
+    offsets = group["offsets"][...]
+    routes = group["routes"].asstr()
+    isotherm_fields, point_fields = _get_table_fields(kind)
+
+    first = 0
+    while first < len(offsets) - 1:
+        last = int(
+            np.searchsorted(offsets, offsets[first] + batch_size, "left")
+        )
+        last = min(max(last, first + 1), len(offsets) - 1)
+        start, end = int(offsets[first]), int(offsets[last])
+        stop = last + 1
+
+        fields: Any = {
+            "routes": list(routes[first:last]),
+            "offsets": offsets[first:stop] - start,
+        }
+        for name in isotherm_fields:
+            fields[name] = group[name][first:last]
+        for name in point_fields:
+            fields[name] = group[name][..., start:end]
+
+        yield model_class(**fields)
+        first = last
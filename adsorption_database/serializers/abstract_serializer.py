@@ -1,14 +1,124 @@
 import enum
-from typing import Any, List, Tuple
-from h5py import Group
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from h5py import Dataset, Group
 import numpy.typing as npt
 from abc import abstractmethod
 import numpy as np
 
+from attr import define
+
+from adsorption_database.blob_store import (
+    get_blob_name,
+    get_link_count,
+    is_shared,
+    require_blob,
+)
+from adsorption_database.defaults import BLOBS, GENERATION, POINTS
+from adsorption_database.serializers.field_plan import (
+    FieldPlan,
+    get_field_plan,
+)
+from adsorption_database.storage_options import StorageOptions
+
+
+@define
+class UpsertStats:
+    """
+    Counters of the dataset writes done by `AbstractSerializer.upsert_dataset`.
+
+    Attributes:
+        bytes_written (int): Bytes written to newly allocated storage.
+        bytes_reused (int): Bytes overwritten in the storage of existing datasets.
+        datasets_created (int): Datasets that did not exist.
+        datasets_overwritten (int): Datasets overwritten in place.
+        datasets_resized (int): Chunked datasets resized and overwritten in place.
+        datasets_recreated (int): Datasets deleted and created again because their layout was incompatible, or
+            because they were shared with other groups.
+        datasets_linked (int): Datasets linked to a deduplicated blob.
+        bytes_deduplicated (int): Bytes not written because a blob already held the same array.
+    """
+
+    bytes_written: int = 0
+    bytes_reused: int = 0
+    datasets_created: int = 0
+    datasets_overwritten: int = 0
+    datasets_resized: int = 0
+    datasets_recreated: int = 0
+    datasets_linked: int = 0
+    bytes_deduplicated: int = 0
+
+
+def can_resize(dataset: Dataset, shape: Tuple[int, ...]) -> bool:
+    """
+    Check whether a dataset can be resized to the given shape.
+
+    Args:
+        dataset (Dataset): The dataset.
+        shape (Tuple[int, ...]): The new shape.
+
+    Returns:
+        bool: True if the dataset is chunked and the shape fits its maximum shape.
+    """
+    if dataset.chunks is None or dataset.ndim != len(shape):
+        return False
+
+    return all(
+        max_size is None or size <= max_size
+        for size, max_size in zip(shape, dataset.maxshape)
+    )
+
+
+def set_attribute(group: Group, name: str, value: Any) -> None:
+    """
+    Set an attribute of a HDF5 object, unless it already holds the same value.
+
+    Attributes are stored in the object header, so recreating them on every upsert fragments the header and grows the
+    file even when nothing changed.
+
+    Args:
+        group (Group): The HDF5 group or dataset.
+        name (str): The attribute name.
+        value (Any): The attribute value.
+    """
+    if name in group.attrs:
+        current = group.attrs[name]
+        if np.shape(current) == np.shape(value) and np.array_equal(
+            current, value
+        ):
+            return
+
+    group.attrs.create(name, value)
+
+
+def mark_point_store_stale(group: Group) -> None:
+    """
+    Record that isotherm data of the file holding a group changed outside a handler write session.
+
+    The generation of the file is incremented, so its point store, which holds the generation it was written at (see
+    `point_store.is_point_store_fresh`), is no longer read until a handler rebuilds it. Files without a point store
+    are left untouched.
+
+    Args:
+        group (Group): A group of the storage file.
+    """
+    file = group.file
+    if POINTS in file:
+        generation = int(file.attrs.get(GENERATION, 0))
+        file.attrs[GENERATION] = np.int64(generation + 1)
+
 
 class AbstractSerializer:
-    def __init__(self, model_class: Any) -> None:
+    def __init__(
+        self,
+        model_class: Any,
+        storage_options: Optional[StorageOptions] = None,
+        upsert_stats: Optional[UpsertStats] = None,
+    ) -> None:
         self._model_class = model_class
+        self._storage_options = storage_options
+        self.upsert_stats = (
+            upsert_stats if upsert_stats is not None else UpsertStats()
+        )
 
     @abstractmethod
     def get_attributes(self) -> List[Tuple[str, Any]]:
@@ -18,6 +128,20 @@ class AbstractSerializer:
     def get_datasets(self) -> List[str]:
         raise NotImplementedError()  # pragma: no cover
 
+    def get_field_plan(self) -> FieldPlan:
+        """
+        Get the compiled attribute and dataset fields of the serializer, shared by every instance.
+
+        Returns:
+            FieldPlan: The field plan.
+        """
+        return get_field_plan(
+            type(self),
+            self._model_class,
+            self.get_attributes,
+            self.get_datasets,
+        )
+
     @abstractmethod
     def load(self, group: Group) -> Any:
         raise NotImplementedError()  # pragma: no cover
@@ -27,7 +151,7 @@ class AbstractSerializer:
         raise NotImplementedError()  # pragma: no cover
 
     def _register_attributes(
-        self, fields: List[str], object: Any, group: Group
+        self, fields: Sequence[str], object: Any, group: Group
     ) -> None:
 
         for field in fields:
@@ -36,10 +160,10 @@ class AbstractSerializer:
                 continue
             if isinstance(val, enum.Enum):
                 val = val.value
-            group.attrs.create(field, val)
+            set_attribute(group, field, val)
 
     def _register_datasets(
-        self, dataset_names: List[str], object: Any, group: Group
+        self, dataset_names: Sequence[str], object: Any, group: Group
     ) -> None:
 
         for dataset_name in dataset_names:
@@ -54,9 +178,19 @@ class AbstractSerializer:
         """
         Upsert a dataset in a HDF5 group.
 
-        This method checks if a dataset with the given `dataset_name` already exists in the `group`. If it does, it
-        is deleted and a new dataset with the same name is created with the provided `values`. If it does not exist,
-        a new dataset with the given `dataset_name` is created with the provided `values`.
+        This method checks if a dataset with the given `dataset_name` already exists in the `group`. If it does and
+        has the same shape and dtype as `values`, its data is overwritten in place. If only the size changed and the
+        dataset is chunked with enough maximum shape, it is resized and overwritten. Otherwise, it is deleted and a new
+        dataset with the same name is created with the provided `values`, since HDF5 never reclaims the space of
+        deleted datasets. If it does not exist, a new dataset with the given `dataset_name` is created with the
+        provided `values`. New datasets are laid out according to the serializer storage options, if any. A dataset
+        shared with other groups through hard links is never written in place: its link is replaced instead.
+
+        If the storage options enable deduplication, the dataset is linked to the blob holding `values`, which is
+        created if needed (see `blob_store.require_blob`).
+
+        The bytes written to new storage and the bytes reused from existing datasets are accumulated in
+        `upsert_stats`.
 
         Args:
             group (h5py.Group): The HDF5 group where the dataset will be upserted.
@@ -70,9 +204,144 @@ class AbstractSerializer:
             KeyError: If `dataset_name` is not a valid string.
         """
 
+        values = np.asarray(values)
+        if (
+            self._storage_options is not None
+            and self._storage_options.deduplicate
+        ):
+            self._link_dataset(group, dataset_name, values)
+            return
+
         dataset = group.get(dataset_name)
 
         if dataset is not None:
+            if dataset.dtype == values.dtype and not is_shared(dataset):
+                if dataset.shape == values.shape:
+                    dataset[...] = values
+                    self.upsert_stats.datasets_overwritten += 1
+                    self.upsert_stats.bytes_reused += values.nbytes
+                    return
+
+                if can_resize(dataset, values.shape):
+                    reused_bytes = (
+                        min(dataset.size, values.size) * values.itemsize
+                    )
+                    dataset.resize(values.shape)
+                    dataset[...] = values
+                    self.upsert_stats.datasets_resized += 1
+                    self.upsert_stats.bytes_reused += reused_bytes
+                    self.upsert_stats.bytes_written += max(
+                        values.nbytes - reused_bytes, 0
+                    )
+                    return
+
             del group[dataset_name]
+            self.upsert_stats.datasets_recreated += 1
+        else:
+            self.upsert_stats.datasets_created += 1
+
+        group.create_dataset(
+            dataset_name, data=values, **self._get_dataset_kwargs(values)
+        )
+        self.upsert_stats.bytes_written += values.nbytes
+
+    def _get_dataset_kwargs(
+        self, values: npt.NDArray[np.float64]
+    ) -> Dict[str, Any]:
+        """
+        Get the `h5py.Group.create_dataset` keyword arguments of a new dataset, from the storage options if any.
+        """
+        if self._storage_options is None:
+            return {}
+        return self._storage_options.get_dataset_kwargs(values)
+
+    def _link_dataset(
+        self, group: Group, dataset_name: str, values: npt.NDArray[np.float64]
+    ) -> None:
+        """
+        Link a dataset to the blob holding `values`, dropping the blob it linked to if nothing else uses it.
+        """
+        assert self._storage_options is not None
+        blob, created = require_blob(
+            group.file,
+            values,
+            self._storage_options.get_dataset_kwargs(values),
+        )
+        self.upsert_stats.datasets_linked += 1
+
+        dataset = group.get(dataset_name)
+        if dataset is not None and dataset.id == blob.id:
+            self.upsert_stats.bytes_deduplicated += values.nbytes
+            return
+
+        if dataset is not None:
+            old_blob_name = None
+            if get_link_count(dataset) == 2:
+                old_blob_name = get_blob_name(dataset[()])
+            del group[dataset_name]
+            blobs = group.file[BLOBS]
+            if old_blob_name is not None and old_blob_name in blobs:
+                if get_link_count(blobs[old_blob_name]) == 1:
+                    del blobs[old_blob_name]
+            self.upsert_stats.datasets_recreated += 1
+        else:
+            self.upsert_stats.datasets_created += 1
+
+        if created:
+            self.upsert_stats.bytes_written += values.nbytes
+        else:
+            self.upsert_stats.bytes_deduplicated += values.nbytes
+
+        group[dataset_name] = blob
+
+    def append_dataset(
+        self, group: Group, dataset_name: str, values: npt.NDArray[np.float64]
+    ) -> None:
+        """
+        Append values to a dataset in a HDF5 group along its last axis.
+
+        Isotherm points are stored along the last axis of their datasets (the only axis of `pressures`, the second
+        one of mixture `loadings`), so this method adds new points to an isotherm. If the dataset does not exist, it
+        is created chunked and unlimited along its last axis, so it can keep growing. Appended data is flushed, which
+        makes it visible to SWMR readers after a `refresh()` of the dataset. A dataset shared with other groups
+        through hard links is copied into a dataset of its own first, so the other groups are left unchanged. The
+        point store of the file, if any, is marked stale (see `mark_point_store_stale`).
+
+        Args:
+            group (h5py.Group): The HDF5 group holding the dataset.
+            dataset_name (str): The name of the dataset.
+            values (np.ndarray): The data to be appended.
+
+        Returns:
+            None
+
+        Raises:
+            TypeError: If the existing dataset can not grow along its last axis.
+        """
+        values = np.asarray(values)
+        dataset = group.get(dataset_name)
+        mark_point_store_stale(group)
+
+        if dataset is not None and is_shared(dataset):
+            values = np.concatenate([dataset[()], values], axis=-1)
+            del group[dataset_name]
+            dataset = None
+
+        if dataset is None:
+            group.create_dataset(
+                dataset_name,
+                data=values,
+                maxshape=values.shape[:-1] + (None,),
+                chunks=True,
+            )
+            return
+
+        if dataset.maxshape[-1] is not None:
+            raise TypeError(
+                f"Dataset {dataset_name} can not grow along its last axis"
+            )
 
-        group.create_dataset(dataset_name, data=values)
+        size = dataset.shape[-1]
+        dataset.resize(size + values.shape[-1], axis=dataset.ndim - 1)
+        dataset[..., size:] = values
+        dataset.flush()
@@ -6,7 +6,6 @@ from h5py import Group
 from adsorption_database.serializers.abstract_serializer import (
     AbstractSerializer,
 )
-from adsorption_database.shared import get_attr_fields_from_infos
 
 
 class AttrOnlySerializer(AbstractSerializer):
@@ -23,10 +22,8 @@ class AttrOnlySerializer(AbstractSerializer):
 
     def load(self, group: Group) -> Any:
 
-        attribute_infos = self.get_attributes()
-
         _fields: Dict[str, Any] = {}
-        get_attr_fields_from_infos(_fields, attribute_infos, group)
+        self.get_field_plan().read_attributes(_fields, group)
 
         obj = self._model_class(**_fields)
 
@@ -34,8 +31,6 @@ class AttrOnlySerializer(AbstractSerializer):
 
     def dump(self, obj: Any, group: Group) -> None:
 
-        attributes = self.get_attributes()
-
-        attributes_names = [attribute[0] for attribute in attributes]
+        attributes_names = self.get_field_plan().attribute_names
 
         self._register_attributes(attributes_names, obj, group)
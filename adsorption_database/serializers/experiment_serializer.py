@@ -1,5 +1,5 @@
 # pragma: no cover
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 from attr import fields
 
 
@@ -16,8 +16,9 @@ from adsorption_database.models.isotherms import (
 )
 from adsorption_database.serializers.abstract_serializer import (
     AbstractSerializer,
+    set_attribute,
 )
-from adsorption_database.serializers.attrs_serializer import AttrOnlySerializer
+from adsorption_database.serializers.load_context import LoadContext
 from adsorption_database.serializers.mix_isotherm_serializer import (
     MixIsothermSerializer,
 )
@@ -26,14 +27,14 @@ from adsorption_database.serializers.mono_isotherm_serializer import (
 )
 from adsorption_database.shared import (
     get_adsorbent_group_route,
-    get_attr_fields_from_infos,
-    get_root_group,
 )
 
 
 class ExperimentSerializer(AbstractSerializer):
     def __init__(self) -> None:
         super().__init__(Experiment)
+        self._mono_serializer = MonoIsothermSerializer()
+        self._mix_serializer = MixIsothermSerializer()
 
     def get_attributes(self):
         return [
@@ -46,11 +47,24 @@ class ExperimentSerializer(AbstractSerializer):
     def get_datasets(self):
         return []
 
-    def load(self, group: Group) -> Any:
+    def load(self, group: Group, context: Optional[LoadContext] = None) -> Any:
+        """
+        Load an experiment with its isotherms and adsorbent.
+
+        Args:
+            group (Group): The experiment group.
+            context (Optional[LoadContext]): The load context, shared with the other loads of the same query so
+                adsorbates and adsorbents referenced by many experiments are loaded once. Defaults to None, in which
+                case a new context with the default options is used.
+
+        Returns:
+            Experiment: The experiment.
+        """
+        if context is None:
+            context = LoadContext.from_group(group)
 
         _fields: Dict[str, Any] = {}
-        attributes = self.get_attributes()
-        get_attr_fields_from_infos(_fields, attributes, group)
+        self.get_field_plan().read_attributes(_fields, group)
 
         if MONO_ISOTHERMS in list(group):
             _fields["monocomponent_isotherms"] = []
@@ -58,7 +72,9 @@ class ExperimentSerializer(AbstractSerializer):
                 isotherm_group = group[MONO_ISOTHERMS].get(isotherm_name)
                 if isotherm_group is None:
                     continue
-                mono_isotherm = MonoIsothermSerializer().load(isotherm_group)
+                mono_isotherm = self._mono_serializer.load(
+                    isotherm_group, context
+                )
                 _fields["monocomponent_isotherms"].append(mono_isotherm)
 
         if MIXTURE_ISOTHERMS in list(group):
@@ -67,16 +83,17 @@ class ExperimentSerializer(AbstractSerializer):
                 isotherm_group = group[MIXTURE_ISOTHERMS].get(isotherm_name)
                 if isotherm_group is None:
                     continue
-                mix_isotherm = MixIsothermSerializer().load(isotherm_group)
+                mix_isotherm = self._mix_serializer.load(
+                    isotherm_group, context
+                )
                 _fields["mixture_isotherms"].append(mix_isotherm)
 
-        if "adsorbent" in list(group.attrs):
-            root_group = get_root_group(group)
-            adsorbent_group = root_group.get(group.attrs["adsorbent"])
-            if adsorbent_group is not None:
-                _fields["adsorbent"] = AttrOnlySerializer(Adsorbent).load(
-                    adsorbent_group
-                )
+        if "adsorbent" in group.attrs:
+            adsorbent = context.load_reference(
+                group.attrs["adsorbent"], Adsorbent
+            )
+            if adsorbent is not None:
+                _fields["adsorbent"] = adsorbent
 
         obj = self._model_class(**_fields)
 
@@ -84,10 +101,9 @@ class ExperimentSerializer(AbstractSerializer):
 
     def dump(self, obj: Experiment, group: Group) -> None:
 
-        attributes = self.get_attributes()
-        attribute_names = [attr[0] for attr in attributes]
+        attribute_names = self.get_field_plan().attribute_names
 
         self._register_attributes(attribute_names, obj, group)
 
         route = get_adsorbent_group_route(obj.adsorbent.name)
-        group.attrs["adsorbent"] = route
+        set_attribute(group, "adsorbent", route)
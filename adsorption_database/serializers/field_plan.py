@@ -0,0 +1,120 @@
+from typing import Any, Callable, Dict, List, Tuple
+
+from attrs import define
+from h5py import Group
+
+from adsorption_database.shared import get_valid_type
+
+Converter = Callable[[Any], Any]
+
+_FIELD_PLANS: Dict[Tuple[type, Any], "FieldPlan"] = {}
+
+
+def get_converter(_type: Any) -> Converter:
+    """
+    Get the function converting a stored attribute value to the type of a model field.
+
+    Classes (`str`, `float`, enums...) convert values themselves. Optional fields convert to their non-None type,
+    and list fields to lists.
+
+    Args:
+        _type (Any): The type annotation of the field.
+
+    Returns:
+        Converter: The converter.
+    """
+    if isinstance(_type, type):
+        return _type
+
+    valid_type = get_valid_type(_type.__args__)
+    if getattr(valid_type, "__origin__", None) is list:
+        return list
+    return valid_type
+
+
+@define(frozen=True)
+class FieldPlan:
+    """
+    The fields a serializer reads and writes for a model class, with their converters resolved once.
+
+    Attributes:
+        attributes (Tuple[Tuple[str, Converter], ...]): The names of the fields stored as HDF5 attributes, with
+            their converters.
+        datasets (Tuple[str, ...]): The names of the fields stored as datasets.
+    """
+
+    attributes: Tuple[Tuple[str, Converter], ...]
+    datasets: Tuple[str, ...]
+
+    @property
+    def attribute_names(self) -> List[str]:
+        return [name for name, _ in self.attributes]
+
+    def read_attributes(self, fields: Dict[str, Any], group: Group) -> None:
+        """
+        Read the attributes of a group into a dictionary of fields, converted to their field types.
+
+        Missing attributes are read as None.
+
+        Args:
+            fields (Dict[str, Any]): The dictionary filled with the attribute values, by field name.
+            group (Group): The group holding the attributes.
+        """
+        attrs = group.attrs
+        for name, converter in self.attributes:
+            # Cheaper than `attrs.get`, which checks that the attribute exists before reading it
+            try:
+                value = attrs[name]
+            except KeyError:
+                fields[name] = None
+                continue
+            fields[name] = converter(value)
+
+
+def compile_field_plan(
+    attribute_infos: List[Tuple[str, Any]], dataset_names: List[str]
+) -> FieldPlan:
+    """
+    Compile the attribute and dataset fields of a serializer into a field plan.
+
+    Args:
+        attribute_infos (List[Tuple[str, Any]]): The names and type annotations of the attribute fields.
+        dataset_names (List[str]): The names of the dataset fields.
+
+    Returns:
+        FieldPlan: The field plan.
+    """
+    return FieldPlan(
+        tuple((name, get_converter(_type)) for name, _type in attribute_infos),
+        tuple(dataset_names),
+    )
+
+
+def get_field_plan(
+    serializer_class: type,
+    model_class: Any,
+    attribute_infos: Callable[[], List[Tuple[str, Any]]],
+    dataset_names: Callable[[], List[str]],
+) -> FieldPlan:
+    """
+    Get the field plan of a serializer class for a model class, compiling it on the first call.
+
+    The fields a serializer selects only depend on its class and on the model class, so the plan is compiled once per
+    process and shared by every serializer instance.
+
+    Args:
+        serializer_class (type): The serializer class.
+        model_class (Any): The attrs class of the model.
+        attribute_infos (Callable[[], List[Tuple[str, Any]]]): Gets the names and type annotations of the attribute
+            fields, on the first call only.
+        dataset_names (Callable[[], List[str]]): Gets the names of the dataset fields, on the first call only.
+
+    Returns:
+        FieldPlan: The field plan.
+    """
+    key = (serializer_class, model_class)
+    plan = _FIELD_PLANS.get(key)
+    if plan is None:
+        plan = compile_field_plan(attribute_infos(), dataset_names())
+        _FIELD_PLANS[key] = plan
+    return plan
@@ -0,0 +1,70 @@
+from typing import Any, Dict, Optional, Union
+
+from attrs import Factory, define
+from h5py import Group
+
+from adsorption_database.serializers.attrs_serializer import AttrOnlySerializer
+
+
+@define(eq=False)
+class LoadContext:
+    """
+    State shared by the serializers while loading objects from one storage file.
+
+    Adsorbates and adsorbents are referenced by route from many isotherms and experiments. The context loads each
+    route once and hands the same object to every reference, and keeps the root group so references are resolved
+    without walking up the group hierarchy. Create one context per file handle and thread it through every `load`
+    call of a query.
+
+    Attributes:
+        root_group (Group): The root group of the storage file.
+        memory_map (bool): Whether to memory map the isotherm arrays. Defaults to False.
+        lazy (bool): Whether to defer reading the isotherm arrays until they are accessed. Defaults to False.
+        references (Dict[str, Any]): The objects already loaded, by route.
+    """
+
+    root_group: Group
+    memory_map: bool = False
+    lazy: bool = False
+    references: Dict[str, Any] = Factory(dict)
+
+    @classmethod
+    def from_group(cls, group: Group) -> "LoadContext":
+        """
+        Create a context with the default options for the file of a group.
+
+        Args:
+            group (Group): Any group of the storage file.
+
+        Returns:
+            LoadContext: The new context.
+        """
+        return cls(group.file)
+
+    def load_reference(
+        self, route: Union[str, bytes], model_class: Any
+    ) -> Optional[Any]:
+        """
+        Load an attributes-only object (such as an adsorbate or an adsorbent) referenced by its group route.
+
+        Args:
+            route (Union[str, bytes]): The route of the referenced group.
+            model_class (Any): The attrs class of the object.
+
+        Returns:
+            Optional[Any]: The object, or None if the referenced group does not exist.
+        """
+        # Mixture isotherms store their references as bytes
+        if isinstance(route, bytes):
+            route = route.decode()
+
+        if route in self.references:
+            return self.references[route]
+
+        group = self.root_group.get(route)
+        obj = None
+        if group is not None:
+            obj = AttrOnlySerializer(model_class).load(group)
+
+        self.references[route] = obj
+        return obj
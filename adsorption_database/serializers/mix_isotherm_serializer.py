@@ -1,4 +1,4 @@
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 from attr import fields
 
 import numpy as np
@@ -9,21 +9,24 @@ import numpy.typing as npt
 from adsorption_database.models.isotherms import MixIsotherm
 from adsorption_database.serializers.abstract_serializer import (
     AbstractSerializer,
+    UpsertStats,
+    set_attribute,
 )
-from adsorption_database.serializers.attrs_serializer import AttrOnlySerializer
-from adsorption_database.serializers.mono_isotherm_serializer import (
-    get_root_group,
-)
+from adsorption_database.serializers.load_context import LoadContext
 from adsorption_database.shared import (
     get_adsorbate_group_route,
-    get_attr_fields_from_infos,
     get_dataset_fields,
 )
+from adsorption_database.storage_options import StorageOptions
 
 
 class MixIsothermSerializer(AbstractSerializer):
-    def __init__(self) -> None:
-        super().__init__(MixIsotherm)
+    def __init__(
+        self,
+        storage_options: Optional[StorageOptions] = None,
+        upsert_stats: Optional[UpsertStats] = None,
+    ) -> None:
+        super().__init__(MixIsotherm, storage_options, upsert_stats)
 
     def get_attributes(self):
         return [
@@ -39,25 +42,23 @@ class MixIsothermSerializer(AbstractSerializer):
             if field.type in [npt.NDArray[np.float64]]
         ]
 
-    def load(self, group: Group) -> Any:
-
-        _fields: Dict[str, Any] = {}
+    def load(self, group: Group, context: Optional[LoadContext] = None) -> Any:
 
-        attributes = self.get_attributes()
-        get_attr_fields_from_infos(_fields, attributes, group)
+        if context is None:
+            context = LoadContext.from_group(group)
 
-        dataset_names = self.get_datasets()
-        get_dataset_fields(_fields, dataset_names, group)
+        plan = self.get_field_plan()
+        _fields: Dict[str, Any] = {}
+        plan.read_attributes(_fields, group)
+        get_dataset_fields(
+            _fields, plan.datasets, group, context.memory_map, context.lazy
+        )
 
-        if "adsorbates" in list(group.attrs):
-            root_group = get_root_group(group)
-            _fields["adsorbates"] = []
-            adsorbate_serializer = AttrOnlySerializer(Adsorbate)
-            for adsorbate in group.attrs["adsorbates"]:
-                adsorbate_group = root_group.get(adsorbate)
-                _fields["adsorbates"].append(
-                    adsorbate_serializer.load(adsorbate_group)
-                )
+        if "adsorbates" in group.attrs:
+            _fields["adsorbates"] = [
+                context.load_reference(route, Adsorbate)
+                for route in group.attrs["adsorbates"]
+            ]
 
         obj = self._model_class(**_fields)
 
@@ -65,21 +66,22 @@ class MixIsothermSerializer(AbstractSerializer):
 
     def dump(self, obj: Any, group: Group) -> None:
 
-        attributes = self.get_attributes()
-        attribute_names = [attr[0] for attr in attributes]
+        plan = self.get_field_plan()
 
-        self._register_attributes(attribute_names, obj, group)
+        self._register_attributes(plan.attribute_names, obj, group)
 
-        dataset_names = self.get_datasets()
-
-        self._register_datasets(dataset_names, obj, group)
+        self._register_datasets(plan.datasets, obj, group)
 
         # Since h5py still doesn't support storing arrays with object type, for mixtures we store the
         # full path to the adsorbate. In doing this, on de-serializing the stored object, the code must
         # check whether the adsorbate still exists in the storage
-        group.attrs["adsorbates"] = np.array(
-            [
-                str.encode(get_adsorbate_group_route(adsorbate.name))
-                for adsorbate in obj.adsorbates
-            ]
+        set_attribute(
+            group,
+            "adsorbates",
+            np.array(
+                [
+                    str.encode(get_adsorbate_group_route(adsorbate.name))
+                    for adsorbate in obj.adsorbates
+                ]
+            ),
         )
@@ -9,19 +9,24 @@ import numpy.typing as npt
 from adsorption_database.models.isotherms import MonoIsotherm
 from adsorption_database.serializers.abstract_serializer import (
     AbstractSerializer,
+    UpsertStats,
+    set_attribute,
 )
-from adsorption_database.serializers.attrs_serializer import AttrOnlySerializer
+from adsorption_database.serializers.load_context import LoadContext
 from adsorption_database.shared import (
     get_adsorbate_group_route,
-    get_attr_fields_from_infos,
     get_dataset_fields,
-    get_root_group,
 )
+from adsorption_database.storage_options import StorageOptions
 
 
 class MonoIsothermSerializer(AbstractSerializer):
-    def __init__(self) -> None:
-        super().__init__(MonoIsotherm)
+    def __init__(
+        self,
+        storage_options: Optional[StorageOptions] = None,
+        upsert_stats: Optional[UpsertStats] = None,
+    ) -> None:
+        super().__init__(MonoIsotherm, storage_options, upsert_stats)
 
     def get_attributes(self):
         return [
@@ -43,21 +48,21 @@ class MonoIsothermSerializer(AbstractSerializer):
             in [npt.NDArray[np.float64], Optional[npt.NDArray[np.float64]]]
         ]
 
-    def load(self, group: Group) -> Any:
+    def load(self, group: Group, context: Optional[LoadContext] = None) -> Any:
 
-        _fields: Dict[str, Any] = {}
-
-        attributes = self.get_attributes()
-        get_attr_fields_from_infos(_fields, attributes, group)
-
-        dataset_names = self.get_datasets()
-        get_dataset_fields(_fields, dataset_names, group)
+        if context is None:
+            context = LoadContext.from_group(group)
 
-        if "adsorbate" in list(group.attrs):
-            root_group = get_root_group(group)
-            adsorbate_group = root_group.get(group.attrs["adsorbate"])
-            _fields["adsorbate"] = AttrOnlySerializer(Adsorbate).load(
-                adsorbate_group
+        plan = self.get_field_plan()
+        _fields: Dict[str, Any] = {}
+        plan.read_attributes(_fields, group)
+        get_dataset_fields(
+            _fields, plan.datasets, group, context.memory_map, context.lazy
+        )
+
+        if "adsorbate" in group.attrs:
+            _fields["adsorbate"] = context.load_reference(
+                group.attrs["adsorbate"], Adsorbate
             )
 
         obj = self._model_class(**_fields)
@@ -66,14 +71,11 @@ class MonoIsothermSerializer(AbstractSerializer):
 
     def dump(self, obj: Any, group: Group) -> None:
 
-        attributes = self.get_attributes()
-        attribute_names = [attribute[0] for attribute in attributes]
-
-        self._register_attributes(attribute_names, obj, group)
+        plan = self.get_field_plan()
 
-        dataset_names = self.get_datasets()
+        self._register_attributes(plan.attribute_names, obj, group)
 
-        self._register_datasets(dataset_names, obj, group)
+        self._register_datasets(plan.datasets, obj, group)
 
         route = get_adsorbate_group_route(obj.adsorbate.name)
-        group.attrs["adsorbate"] = route
+        set_attribute(group, "adsorbate", route)
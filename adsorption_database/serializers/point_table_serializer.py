@@ -0,0 +1,87 @@
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import numpy.typing as npt
+from attr import fields
+from h5py import Group, string_dtype
+
+from adsorption_database.datasets import read_dataset
+from adsorption_database.serializers.abstract_serializer import (
+    AbstractSerializer,
+    UpsertStats,
+    can_resize,
+)
+from adsorption_database.storage_options import StorageOptions
+
+
+class PointTableSerializer(AbstractSerializer):
+    def __init__(
+        self,
+        model_class: Any,
+        storage_options: Optional[StorageOptions] = None,
+        upsert_stats: Optional[UpsertStats] = None,
+        memory_map: bool = False,
+    ) -> None:
+        super().__init__(model_class, storage_options, upsert_stats)
+        self._memory_map = memory_map
+
+    def get_attributes(self) -> List[Tuple[str, Any]]:
+        return []
+
+    def get_datasets(self) -> List[str]:
+        return [
+            field.name
+            for field in fields(self._model_class)
+            if field.name != "routes"
+        ]
+
+    def load(self, group: Group) -> Any:
+
+        _fields: Dict[str, Any] = {
+            "routes": list(group["routes"].asstr()[...])
+        }
+
+        for dataset_name in self.get_field_plan().datasets:
+            _fields[dataset_name] = read_dataset(
+                group[dataset_name], self._memory_map
+            )
+
+        return self._model_class(**_fields)
+
+    def dump(self, obj: Any, group: Group) -> None:
+
+        routes: npt.NDArray[Any] = np.array(obj.routes, dtype=object)
+        dataset = group.get("routes")
+        if dataset is not None and (
+            dataset.shape == routes.shape or can_resize(dataset, routes.shape)
+        ):
+            if dataset.shape != routes.shape:
+                dataset.resize(routes.shape)
+            dataset[...] = routes
+        else:
+            if dataset is not None:
+                del group["routes"]
+            group.create_dataset(
+                "routes",
+                data=routes,
+                dtype=string_dtype(),
+                chunks=True,
+                maxshape=(None,),
+            )
+
+        self._register_datasets(self.get_field_plan().datasets, obj, group)
+
+    def _get_dataset_kwargs(
+        self, values: npt.NDArray[np.float64]
+    ) -> Dict[str, Any]:
+        """
+        Tables are always chunked and unlimited along every axis, so rows of new isotherms can be appended to them
+        (see `point_store.update_point_store`).
+        """
+        storage_options = self._storage_options or StorageOptions()
+        chunks = storage_options.get_chunk_shape(values.shape, values.itemsize)
+
+        kwargs = super()._get_dataset_kwargs(values)
+        kwargs["chunks"] = tuple(max(size, 1) for size in chunks)
+        kwargs["maxshape"] = (None,) * values.ndim
+        return kwargs
@@ -3,9 +3,15 @@ from attr import define
 import numpy as np
 import pytest
 from h5py import Group
+from adsorption_database.blob_store import (
+    get_blob_name,
+    get_deduplication_report,
+)
+from adsorption_database.defaults import BLOBS
 from adsorption_database.serializers.abstract_serializer import (
     AbstractSerializer,
 )
+from adsorption_database.storage_options import StorageOptions
 from adsorption_database.storage_provider import StorageProvider
 
 
@@ -76,3 +82,128 @@ def test_upsert_dataset_type_o_error() -> None:
             str(exc_info.value)
             == "Object dtype dtype('O') has no native HDF5 equivalent"
         )
+
+
+def test_append_dataset() -> None:
+
+    serializer = Serializer(MockClass)
+
+    with StorageProvider().get_editable_file() as f:
+        serializer.append_dataset(f, "pressures", np.array([1.0, 2.0]))
+        serializer.append_dataset(f, "pressures", np.array([3.0]))
+        assert (np.array(f["pressures"]) == [1.0, 2.0, 3.0]).all()
+
+        serializer.append_dataset(f, "loadings", np.ones((2, 2)))
+        serializer.append_dataset(f, "loadings", np.zeros((2, 1)))
+        assert (
+            np.array(f["loadings"]) == [[1.0, 1.0, 0.0], [1.0, 1.0, 0.0]]
+        ).all()
+
+        f.create_dataset("fixed", data=np.array([1.0]))
+        with pytest.raises(TypeError):
+            serializer.append_dataset(f, "fixed", np.array([2.0]))
+
+
+def test_upsert_dataset_with_storage_options() -> None:
+
+    serializer = Serializer(
+        MockClass,
+        StorageOptions(compression="gzip", contiguous_threshold_bytes=64),
+    )
+
+    with StorageProvider().get_editable_file() as f:
+        serializer.upsert_dataset(f, "small", np.arange(4, dtype="float64"))
+        serializer.upsert_dataset(f, "large", np.arange(20, dtype="float64"))
+
+        assert f["small"].chunks is None
+        assert f["small"].compression is None
+        assert f["large"].chunks == (20,)
+        assert f["large"].maxshape == (None,)
+        assert f["large"].compression == "gzip"
+
+
+def test_upsert_dataset_in_place() -> None:
+
+    serializer = Serializer(
+        MockClass, StorageOptions(contiguous_threshold_bytes=0)
+    )
+
+    with StorageProvider().get_editable_file() as f:
+        serializer.upsert_dataset(f, "values", np.arange(4, dtype="float64"))
+        dataset_id = f["values"].id
+
+        # same layout, overwritten in place
+        serializer.upsert_dataset(f, "values", np.ones(4, dtype="float64"))
+        assert f["values"].id == dataset_id
+
+        # only the length changed, resized in place
+        serializer.upsert_dataset(f, "values", np.zeros(6, dtype="float64"))
+        assert f["values"].id == dataset_id
+        assert (np.array(f["values"]) == np.zeros(6)).all()
+
+        # incompatible layout, recreated
+        serializer.upsert_dataset(f, "values", np.zeros((2, 6)))
+        assert (np.array(f["values"]) == np.zeros((2, 6))).all()
+
+    stats = serializer.upsert_stats
+    assert stats.datasets_created == 1
+    assert stats.datasets_overwritten == 1
+    assert stats.datasets_resized == 1
+    assert stats.datasets_recreated == 1
+    assert stats.bytes_reused == 8 * 4 + 8 * 4
+    assert stats.bytes_written == 8 * 4 + 8 * 2 + 8 * 12
+
+
+def test_upsert_dataset_deduplicated() -> None:
+
+    serializer = Serializer(MockClass, StorageOptions(deduplicate=True))
+    pressures = np.arange(4.0)
+
+    with StorageProvider().get_editable_file() as f:
+        serializer.upsert_dataset(f.create_group("a"), "pressures", pressures)
+        serializer.upsert_dataset(f.create_group("b"), "pressures", pressures)
+        serializer.upsert_dataset(f["b"], "pressures", pressures)
+
+        assert list(f[BLOBS]) == [get_blob_name(pressures)]
+        assert f["a/pressures"].id == f["b/pressures"].id
+
+        report = get_deduplication_report(f)
+        assert report.blobs == 1
+        assert report.links == 2
+        assert report.bytes_stored == report.bytes_saved == pressures.nbytes
+
+        # a shared blob is never written in place
+        serializer.upsert_dataset(f["b"], "pressures", pressures * 2)
+        assert (f["a/pressures"][()] == pressures).all()
+        assert (f["b/pressures"][()] == pressures * 2).all()
+        assert len(f[BLOBS]) == 2
+
+        # the blob no longer linked by any group is dropped
+        serializer.upsert_dataset(f["a"], "pressures", pressures * 2)
+        assert list(f[BLOBS]) == [get_blob_name(pressures * 2)]
+
+    stats = serializer.upsert_stats
+    assert stats.datasets_linked == 5
+    assert stats.bytes_written == 2 * pressures.nbytes
+    assert stats.bytes_deduplicated == 3 * pressures.nbytes
+
+
+def test_write_shared_dataset() -> None:
+
+    serializer = Serializer(MockClass, StorageOptions(deduplicate=True))
+    pressures = np.arange(4.0)
+
+    with StorageProvider().get_editable_file() as f:
+        for name in ["a", "b", "c"]:
+            serializer.upsert_dataset(
+                f.create_group(name), "pressures", pressures
+            )
+
+        Serializer(MockClass).upsert_dataset(f["a"], "pressures", pressures)
+        Serializer(MockClass).append_dataset(
+            f["b"], "pressures", np.array([4.0])
+        )
+
+        assert f["a/pressures"].id != f["c/pressures"].id
+        assert (f["b/pressures"][()] == np.arange(5)).all()
+        assert (f["c/pressures"][()] == pressures).all()
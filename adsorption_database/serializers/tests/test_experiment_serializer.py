@@ -8,6 +8,7 @@ from adsorption_database.defaults import (
     MIXTURE_ISOTHERMS,
     MONO_ISOTHERMS,
 )
+from adsorption_database.datasets import LazyDataset
 from adsorption_database.helpers import Helpers
 from pytest_regressions.data_regression import DataRegressionFixture
 from adsorption_database.models.adsorbate import Adsorbate
@@ -18,6 +19,7 @@ from adsorption_database.serializers.attrs_serializer import AttrOnlySerializer
 from adsorption_database.serializers.experiment_serializer import (
     ExperimentSerializer,
 )
+from adsorption_database.serializers.load_context import LoadContext
 from adsorption_database.serializers.mix_isotherm_serializer import (
     MixIsothermSerializer,
 )
@@ -99,3 +101,41 @@ def test_load_experiment(
         obj = serializer.load(f[EXPERIMENTS]["exp-01-02"])
 
     helpers.assert_equal(setup_test_storage, obj)
+
+
+def test_load_experiment_lazy(
+    helpers: Helpers, setup_test_storage: Experiment
+) -> None:
+    serializer = ExperimentSerializer()
+
+    with StorageProvider().get_readable_file() as f:
+        obj = serializer.load(
+            f[EXPERIMENTS]["exp-01-02"], LoadContext(f, lazy=True)
+        )
+
+    isotherms = obj.monocomponent_isotherms + obj.mixture_isotherms
+    assert all(isinstance(i.pressures, LazyDataset) for i in isotherms)
+    assert not any(i.pressures.is_loaded for i in isotherms)
+
+    helpers.assert_equal(setup_test_storage, obj)
+
+
+def test_load_experiment_shares_references(
+    setup_test_storage: Experiment,
+) -> None:
+    serializer = ExperimentSerializer()
+
+    with StorageProvider().get_readable_file() as f:
+        context = LoadContext(f)
+        obj = serializer.load(f[EXPERIMENTS]["exp-01-02"], context)
+        other = serializer.load(f[EXPERIMENTS]["exp-01-02"], context)
+
+    co2_adsorbate = obj.monocomponent_isotherms[0].adsorbate
+    assert obj.mixture_isotherms[0].adsorbates[0] is co2_adsorbate
+    assert other.monocomponent_isotherms[0].adsorbate is co2_adsorbate
+    assert other.adsorbent is obj.adsorbent
+    assert set(context.references) == {
+        f"/{ADSORBATES}/Carbon Dioxide",
+        f"/{ADSORBATES}/Methane",
+        f"/{ADSORBENTS}/z01x",
+    }
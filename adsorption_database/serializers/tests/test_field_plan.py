@@ -0,0 +1,50 @@
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from adsorption_database.models.adsorbent import Adsorbent, AdsorbentType
+from adsorption_database.serializers.attrs_serializer import AttrOnlySerializer
+from adsorption_database.serializers.experiment_serializer import (
+    ExperimentSerializer,
+)
+from adsorption_database.serializers.field_plan import get_converter
+from adsorption_database.storage_provider import StorageProvider
+
+
+def test_get_converter() -> None:
+    assert get_converter(float) is float
+    assert get_converter(AdsorbentType) is AdsorbentType
+    assert get_converter(Optional[str]) is str
+    assert get_converter(Optional[List[str]]) is list
+
+
+def test_field_plan(setup_storage: Path) -> None:
+    plan = ExperimentSerializer().get_field_plan()
+
+    assert ExperimentSerializer().get_field_plan() is plan
+    assert plan.attribute_names == [
+        "name",
+        "experiment_type",
+        "comments",
+        "paper_url",
+        "authors",
+        "year",
+        "paper_doi",
+    ]
+    assert plan.datasets == ()
+
+    serializer = AttrOnlySerializer(Adsorbent)
+    assert serializer.get_field_plan() is not plan
+
+    with StorageProvider().get_editable_file() as f:
+        serializer.dump(Adsorbent(AdsorbentType.ZEOLITE, "13X", None, 0.5), f)
+
+    fields: Dict[str, Any] = {}
+    with StorageProvider().get_readable_file() as f:
+        serializer.get_field_plan().read_attributes(fields, f)
+
+    assert fields["type"] is AdsorbentType.ZEOLITE
+    assert fields["void_volume"] == 0.5
+    assert fields["manufacturer"] is None
+    assert Adsorbent(**fields) == Adsorbent(
+        AdsorbentType.ZEOLITE, "13X", None, 0.5
+    )
@@ -1,5 +1,7 @@
 from pathlib import Path
+from typing import Any, Dict
 
+import numpy as np
 import pytest
 from adsorption_database.defaults import (
     ADSORBATES,
@@ -14,9 +16,11 @@ from adsorption_database.serializers.abstract_serializer import (
     AbstractSerializer,
 )
 from adsorption_database.serializers.attrs_serializer import AttrOnlySerializer
+from adsorption_database.serializers.load_context import LoadContext
 from adsorption_database.serializers.mono_isotherm_serializer import (
     MonoIsothermSerializer,
 )
+from adsorption_database.shared import get_dataset_fields
 from adsorption_database.storage_provider import StorageProvider
 from pytest_lazyfixture import lazy_fixture
 from h5py import Group
@@ -85,3 +89,29 @@ def test_load_mono_isotherm(
         )
 
     helpers.assert_equal(isotherm, obj)
+
+
+def test_load_mono_isotherm_memory_map(
+    mono_isotherm: MonoIsotherm, co2_adsorbate: Adsorbate, helpers: Helpers
+) -> None:
+    with StorageProvider().get_editable_file() as f:
+        setup_file(MonoIsothermSerializer(), co2_adsorbate, mono_isotherm, f)
+        chunked = f.create_group("Chunked")
+        chunked.create_dataset(
+            "pressures", data=mono_isotherm.pressures, chunks=True
+        )
+
+    serializer = MonoIsothermSerializer()
+    with StorageProvider().get_readable_file() as f:
+        obj = serializer.load(
+            f[EXPERIMENTS]["A"][MONO_ISOTHERMS][mono_isotherm.name],
+            LoadContext(f, memory_map=True),
+        )
+        fields: Dict[str, Any] = {}
+        get_dataset_fields(fields, ["pressures"], f["Chunked"], True)
+
+    helpers.assert_equal(mono_isotherm, obj)
+    assert isinstance(obj.pressures, np.memmap)
+    assert not obj.pressures.flags.writeable
+    assert not isinstance(fields["pressures"], np.memmap)
+    np.testing.assert_array_equal(fields["pressures"], mono_isotherm.pressures)
@@ -1,4 +1,3 @@
-import numpy as np
 from adsorption_database.defaults import (
     ADSORBATES,
     ADSORBENTS,
@@ -6,8 +5,9 @@ from adsorption_database.defaults import (
     MIXTURE_ISOTHERMS,
     MONO_ISOTHERMS,
 )
-from typing import Any, Dict, List, Tuple, Type
+from typing import Any, Dict, List, Sequence, Tuple, Type
 from h5py import Group
+from adsorption_database.datasets import LazyDataset, read_dataset
 from adsorption_database.helpers import Helpers
 
 from adsorption_database.models.isotherms import Isotherm
@@ -15,11 +15,8 @@ from adsorption_database.storage_provider import StorageProvider
 
 
 def get_root_group(group: Group) -> Group:
-    "recursively searches for the parent group"
-    if group.name == "/":
-        return group
-    else:
-        return get_root_group(group.parent)
+    "gets the root group of the file holding the group"
+    return group.file
 
 
 def get_adsorbate_group_route(adsorbate_name: str) -> str:
@@ -59,14 +56,34 @@ def get_attr_fields_from_infos(
 
 
 def get_dataset_fields(
-    fields: Dict[str, Any], dataset_names: List[str], group: Group
+    fields: Dict[str, Any],
+    dataset_names: Sequence[str],
+    group: Group,
+    memory_map: bool = False,
+    lazy: bool = False,
 ) -> None:
+    """
+    Read the datasets of a group into a dictionary of fields.
+
+    Args:
+        fields (Dict[str, Any]): The dictionary filled with the dataset values, by dataset name.
+        dataset_names (Sequence[str]): The names of the datasets to read. Missing datasets are skipped.
+        group (Group): The group holding the datasets.
+        memory_map (bool): Whether to return read-only memory maps of the datasets instead of copies. Datasets that
+            can not be mapped (chunked or filtered ones) are copied. Defaults to False.
+        lazy (bool): Whether to return `LazyDataset` proxies, read on first access, instead of the values. Defaults to
+            False.
+    """
 
     for dataset_name in dataset_names:
         val = group.get(dataset_name)
         if val is None:
             continue
-        fields[dataset_name] = np.array(val)
+
+        if lazy:
+            fields[dataset_name] = LazyDataset(val, memory_map)
+        else:
+            fields[dataset_name] = read_dataset(val, memory_map)
 
 
 def get_mono_isotherm_group(experiment_group: Group) -> Group:
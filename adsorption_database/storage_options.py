@@ -0,0 +1,102 @@
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+import numpy.typing as npt
+from attr import define
+
+COMPRESSION_FILTERS = ("gzip", "lzf")
+
+
+@define
+class StorageOptions:
+    """
+    Options controlling how isotherm datasets are laid out on disk.
+
+    Arrays smaller than `contiguous_threshold_bytes` are stored contiguously, since chunking and filtering tiny
+    arrays costs more than it saves. Larger arrays are chunked along their last (points) axis, which is also made
+    unlimited so the datasets can later be resized or appended to, and the compression and shuffle filters are
+    applied to them.
+
+    With `deduplicate`, every isotherm array is stored once under the `Blobs` group, named after its content hash
+    (see `blob_store.require_blob`), and the isotherm groups hold hard links to it. Isotherms sharing a pressure grid
+    then share its storage, and reads are unchanged since a hard link is an ordinary dataset.
+
+    Attributes:
+        compression (Optional[str]): The compression filter, "gzip" or "lzf". Defaults to None (no compression).
+        compression_level (Optional[int]): The gzip compression level, from 0 to 9. Defaults to None (gzip default).
+        shuffle (bool): Whether to apply the byte shuffle filter, which usually improves compression of float
+            arrays. Defaults to False.
+        chunk_size_bytes (int): The target size of a chunk. Defaults to 64 KiB.
+        contiguous_threshold_bytes (int): The size below which an array is stored contiguously. Defaults to 4 KiB.
+        deduplicate (bool): Whether to store identical isotherm arrays once and link them. Defaults to False.
+    """
+
+    compression: Optional[str] = None
+    compression_level: Optional[int] = None
+    shuffle: bool = False
+    chunk_size_bytes: int = 64 * 1024
+    contiguous_threshold_bytes: int = 4 * 1024
+    deduplicate: bool = False
+
+    def __attrs_post_init__(self) -> None:
+        if (
+            self.compression is not None
+            and self.compression not in COMPRESSION_FILTERS
+        ):
+            raise ValueError(
+                f"Unknown compression filter {self.compression}, expected one of {COMPRESSION_FILTERS}"
+            )
+
+        if self.compression_level is not None and self.compression != "gzip":
+            raise ValueError("A compression level requires gzip compression")
+
+    def get_chunk_shape(
+        self, shape: Tuple[int, ...], itemsize: int
+    ) -> Tuple[int, ...]:
+        """
+        Get the chunk shape of an array.
+
+        Chunks span the whole leading axes (e.g. every component of a mixture) and as many points of the last axis
+        as fit in `chunk_size_bytes`.
+
+        Args:
+            shape (Tuple[int, ...]): The array shape.
+            itemsize (int): The size in bytes of an array item.
+
+        Returns:
+            Tuple[int, ...]: The chunk shape.
+        """
+        leading_items = int(np.prod(shape[:-1], dtype=np.int64))
+        points = self.chunk_size_bytes // (itemsize * max(leading_items, 1))
+        points = min(max(points, 1), max(shape[-1], 1))
+
+        return shape[:-1] + (points,)
+
+    def get_dataset_kwargs(
+        self, values: npt.NDArray[np.float64]
+    ) -> Dict[str, Any]:
+        """
+        Get the `h5py.Group.create_dataset` keyword arguments used to store an array.
+
+        Args:
+            values (np.ndarray): The array to be stored.
+
+        Returns:
+            Dict[str, Any]: The layout and filter arguments. Empty for arrays stored contiguously.
+        """
+        if values.ndim == 0 or values.nbytes < self.contiguous_threshold_bytes:
+            return {}
+
+        kwargs: Dict[str, Any] = {
+            "chunks": self.get_chunk_shape(values.shape, values.itemsize),
+            "maxshape": values.shape[:-1] + (None,),
+        }
+
+        if self.compression is not None:
+            kwargs["compression"] = self.compression
+            kwargs["compression_opts"] = self.compression_level
+
+        if self.shuffle:
+            kwargs["shuffle"] = True
+
+        return kwargs
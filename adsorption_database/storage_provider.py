@@ -1,26 +1,368 @@
+import os
+import shutil
+import tempfile
+import threading
+from collections import OrderedDict
 from contextlib import contextmanager
 from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+
+from attr import define
 from h5py import File
 
+from adsorption_database.storage_options import StorageOptions
+from adsorption_database.storage_tools import CompactionReport, copy_storage
+
+FileSignature = Tuple[int, int, int, int]
+_HandleKey = Tuple[Path, bool, Optional[int]]
+
+
+class InvalidStorageFile(Exception):
+    """"""
+
+
+def get_file_signature(path: Path) -> FileSignature:
+    """
+    Get a cheap signature identifying the current on-disk state of a file.
+
+    The signature changes whenever the file is replaced (new inode) or modified (new mtime or size), so it can be
+    used to detect that an open handle no longer reflects the file on disk.
+
+    Args:
+        path (Path): The file path.
+
+    Returns:
+        FileSignature: A tuple with the device, inode, modification time (ns) and size of the file.
+    """
+    stat = os.stat(path)
+    return (stat.st_dev, stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+
+def validate_storage_file(
+    path: Path, validator: Optional[Callable[[File], None]] = None
+) -> None:
+    """
+    Check that a storage file can be opened and that all of its objects are readable.
+
+    Args:
+        path (Path): The file path.
+        validator (Optional[Callable[[File], None]]): An optional extra check, called with the opened file. It must
+            raise an exception if the file is not valid.
+
+    Raises:
+        InvalidStorageFile: If the file can not be opened, traversed or fails the extra check.
+    """
+
+    def check_object(name: str, obj: Any) -> None:
+        obj.attrs.keys()
+        if hasattr(obj, "shape"):
+            obj.shape
+
+    try:
+        with File(path, "r") as f:
+            f.visititems(check_object)
+            if validator is not None:
+                validator(f)
+    except Exception as error:
+        raise InvalidStorageFile(
+            f"{path} is not a valid storage file"
+        ) from error
+
+
+def supports_swmr(file: File) -> bool:
+    """
+    Check whether an open storage file uses a format that can be written in SWMR mode.
+
+    Args:
+        file (File): The open file.
+
+    Returns:
+        bool: True if the file superblock version is at least 3.
+    """
+    superblock_version = file.id.get_create_plist().get_version()[0]
+    return bool(superblock_version >= 3)
+
+
+def replace_file(source: Path, destination: Path) -> None:
+    """
+    Atomically move `source` over `destination`.
+
+    The source is synced to disk before the rename, so after a crash the destination holds either its previous
+    content or the complete new one. Processes that still have the previous file open keep reading a consistent
+    snapshot of it. Both paths must be on the same file system.
+
+    Args:
+        source (Path): The new file.
+        destination (Path): The file to be replaced.
+    """
+    fd = os.open(source, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+    os.replace(source, destination)
+
+
+def _get_handle_key(path: Path, swmr: bool, thread_local: bool) -> _HandleKey:
+    return (path, swmr, threading.get_ident() if thread_local else None)
+
+
+@define
+class _PooledHandle:
+    file: File
+    signature: FileSignature
+    users: int = 0
+
+
+def _is_stale(
+    handle: _PooledHandle, signature: FileSignature, swmr: bool
+) -> bool:
+    if not handle.file.id.valid:
+        return True
+    if swmr:
+        # SWMR files grow in place while read, only a replaced file (new device or inode) is stale
+        return handle.signature[:2] != signature[:2]
+    return handle.signature != signature
+
+
+class ReadHandlePool:
+    """
+    A pool of read-only HDF5 handles shared across `StorageProvider` instances.
+
+    Opening a HDF5 file re-reads its superblock and metadata, which usually costs more than the queries issued by the
+    `AdsorptionDatabase`. The pool keeps one read-only handle per storage file open and hands it out to every reader.
+    Before a handle is reused, the file signature (inode, mtime and size) is compared with the one taken when the
+    handle was opened, and the file is transparently reopened if it changed on disk. SWMR handles are only reopened
+    when the file is replaced (e.g. by `compact` or `get_shadow_file`), since their readers pick up appended data
+    with `refresh()` instead.
+
+    Handles are opened without HDF5 file locking, so a process keeping pooled handles open never prevents another
+    process from opening the file for writing. The other side of it is that HDF5 does not stop a reader of a file
+    written in place by another process from seeing it half written: writers shared with readers should commit
+    through `StorageProvider.get_shadow_file` (or SWMR mode), whose readers keep a consistent snapshot.
+
+    Handles are kept open until `close` is called (or the pool is used as a context manager), so long-running
+    services can control their lifetime explicitly.
+
+    Thread-local handles (`thread_local=True`) are kept per reading thread instead of per file, so the h5py objects
+    of a thread are never touched by another one. h5py still runs every call behind its global lock, so threads do
+    not read in parallel either way; see `AdsorptionDatabase` for a process-based alternative. Handles of finished
+    threads are closed once the pool holds more than `max_handles` handles.
+    """
+
+    def __init__(self, max_handles: int = 8) -> None:
+        self._max_handles = max_handles
+        self._handles: "OrderedDict[_HandleKey, _PooledHandle]" = OrderedDict()
+        self._stale_handles: Dict[int, _PooledHandle] = {}
+        self._lock = threading.RLock()
+
+    def __enter__(self) -> "ReadHandlePool":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self._handles)
+
+    def acquire(
+        self, path: Path, swmr: bool = False, thread_local: bool = False
+    ) -> File:
+        """
+        Get an open read-only handle to the given file, reopening it if the file changed on disk.
+
+        Every call must be paired with a `release` call once the handle is no longer used.
+
+        Args:
+            path (Path): The resolved path of the storage file.
+            swmr (bool): Whether to get a handle opened in SWMR read mode. Defaults to False.
+            thread_local (bool): Whether to get a handle used by the calling thread only. Defaults to False.
+
+        Returns:
+            File: The shared read-only file object.
+        """
+        key = _get_handle_key(path, swmr, thread_local)
+        with self._lock:
+            signature = get_file_signature(path)
+            handle = self._handles.get(key)
+
+            if handle is not None and _is_stale(handle, signature, swmr):
+                self._discard(key)
+                handle = None
+
+            if handle is None:
+                # Unlocked, so pooled handles never keep writers of other processes out of the file
+                if swmr:
+                    file = File(
+                        path, "r", libver="latest", swmr=True, locking=False
+                    )
+                else:
+                    file = File(path, "r", locking=False)
+                handle = _PooledHandle(file, signature)
+                self._handles[key] = handle
+                self._evict_unused()
+
+            self._handles.move_to_end(key)
+            handle.users += 1
+            return handle.file
+
+    def release(
+        self,
+        path: Path,
+        file: File,
+        swmr: bool = False,
+        thread_local: bool = False,
+    ) -> None:
+        """
+        Give back a handle obtained with `acquire`.
+
+        Args:
+            path (Path): The resolved path of the storage file.
+            file (File): The file object returned by `acquire`.
+            swmr (bool): Whether the handle was acquired in SWMR read mode. Defaults to False.
+            thread_local (bool): Whether the handle was acquired for the calling thread only. Defaults to False.
+        """
+        with self._lock:
+            handle = self._handles.get(
+                _get_handle_key(path, swmr, thread_local)
+            )
+            if handle is not None and handle.file is file:
+                handle.users -= 1
+                return
+
+            # the handle was replaced while in use, close it once its last user is done
+            stale_handle = self._stale_handles.get(id(file))
+            if stale_handle is None:
+                return
+            stale_handle.users -= 1
+            if stale_handle.users == 0:
+                del self._stale_handles[id(file)]
+                if file.id.valid:
+                    file.close()
+
+    def invalidate(self, path: Path) -> None:
+        """
+        Close the pooled handles for the given file, if any.
+
+        HDF5 refuses to open a file for writing while it is open read-only in the same process, so this must be
+        called before editing a pooled file. Handles still in use (e.g. by a running `iter_isotherms` generator or
+        by another thread) are dropped from the pool but only closed once their last user releases them, so the file
+        can not be opened for writing until then.
+
+        Args:
+            path (Path): The resolved path of the storage file.
+        """
+        with self._lock:
+            for key in [key for key in self._handles if key[0] == path]:
+                self._discard(key)
+
+    def close(self) -> None:
+        """
+        Close every handle held by the pool. Handles still in use are closed once their last user releases them.
+        """
+        with self._lock:
+            for key in list(self._handles):
+                self._discard(key)
+
+    def _discard(self, key: _HandleKey) -> None:
+        handle = self._handles.pop(key)
+        if handle.users > 0:
+            self._stale_handles[id(handle.file)] = handle
+        elif handle.file.id.valid:
+            handle.file.close()
+
+    def _evict_unused(self) -> None:
+        for key in list(self._handles):
+            if len(self._handles) <= self._max_handles:
+                return
+            if self._handles[key].users == 0:
+                self._discard(key)
+
+
+_SHARED_READ_POOL = ReadHandlePool()
+
+
+def get_shared_read_pool() -> ReadHandlePool:
+    """
+    Get the process-wide pool of read handles used by default by every `StorageProvider`.
+
+    Returns:
+        ReadHandlePool: The shared pool.
+    """
+    return _SHARED_READ_POOL
+
 
 class StorageProvider:
+    def __init__(
+        self,
+        read_pool: Optional[ReadHandlePool] = None,
+        file_path: Optional[Path] = None,
+        thread_local: bool = False,
+    ) -> None:
+        """
+        Args:
+            read_pool (Optional[ReadHandlePool]): The pool of read handles. Defaults to None, in which case the pool
+                shared by the whole process is used.
+            file_path (Optional[Path]): The storage file path. Defaults to None, in which case the storage file
+                shipped with the package is used.
+            thread_local (bool): Whether each thread reads through its own pooled handle. Defaults to False.
+        """
+        self._read_pool = (
+            read_pool if read_pool is not None else get_shared_read_pool()
+        )
+        self._file_path = file_path
+        self._thread_local = thread_local
+
+    def __enter__(self) -> "StorageProvider":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
     def get_file_path(self) -> Path:
 
+        if self._file_path is not None:
+            return self._file_path
+
         return Path(
             Path(__file__).parent.absolute() / "storage" / "storage.hdf5"
         )  # pragma: no cover
 
+    def close(self) -> None:
+        """
+        Close the pooled read handle of the storage file.
+
+        The handle is transparently reopened by the next `get_readable_file` call.
+        """
+        self._read_pool.invalidate(self.get_file_path().resolve())
+
     @contextmanager
-    def get_editable_file(self) -> File:
+    def get_editable_file(self, swmr: bool = False) -> Iterator[File]:
         """
         Get a storage file object in a context manager fashion.
 
         This method returns a file object that provides read and write access to a storage file. The file is automatically
-        closed when the context is exited using the 'with' statement.
+        closed when the context is exited using the 'with' statement. Pooled read handles of the same file are closed
+        before opening it, since HDF5 does not allow a file to be opened for reading and writing at the same time. A
+        handle still used by a reader of this process is never closed under it: opening the file then fails with
+        OSError until the reader is done.
+
+        In SWMR (single-writer/multiple-reader) mode, readers of other processes opened with
+        `get_readable_file(swmr=True)` can keep reading while the file is written. Only data appended to existing
+        chunked datasets (see `AbstractSerializer.append_dataset`) becomes visible to them, after a `refresh()` of the
+        dataset; groups and datasets created while in SWMR mode are only seen by readers that reopen the file. The file
+        must use the latest HDF5 format, see `upgrade_file_format`.
+
+        Args:
+            swmr (bool): Whether to open the file in SWMR write mode. Defaults to False.
 
         Returns:
             File: The storage file object.
 
+        Raises:
+            InvalidStorageFile: If SWMR mode is requested on a file with an old format.
+
         Example:
             >>> my_obj = MyClass()
             >>> with my_obj.get_editable_file() as file:
@@ -29,17 +371,155 @@ class StorageProvider:
             ...
             # File is automatically closed when the context is exited
         """
-        f = File(self.get_file_path().resolve(), "a")
-        yield f
-        f.close()
+        path = self.get_file_path().resolve()
+        self._read_pool.invalidate(path)
+
+        if not swmr:
+            f = File(path, "a")
+        else:
+            f = File(path, "a", libver="latest")
+            if not supports_swmr(f):
+                f.close()
+                raise InvalidStorageFile(
+                    f"{path} must be upgraded with upgrade_file_format() to be written in SWMR mode"
+                )
+            f.swmr_mode = True
+
+        try:
+            yield f
+        finally:
+            f.close()
+
+    def upgrade_file_format(self) -> None:
+        """
+        Rewrite the storage file with the latest HDF5 file format, which is required by SWMR mode.
+
+        Every group, dataset and attribute is copied into a new file that atomically replaces the storage file. Files
+        that already use the latest format are left untouched.
+        """
+        path = self.get_file_path().resolve()
+
+        with File(path, "r") as src:
+            if supports_swmr(src):
+                return
+
+            with self._replacement_file(".upgrade") as new_path:
+                with File(new_path, "w", libver="latest") as dst:
+                    copy_storage(src, dst)
+
+    def compact(
+        self, storage_options: Optional[StorageOptions] = None
+    ) -> CompactionReport:
+        """
+        Rewrite the storage file into a fresh, tightly packed file.
+
+        HDF5 never reclaims the space of deleted datasets and attributes, so a file that is written again and again
+        accumulates dead space. This method copies every group, dataset and attribute (including the adsorbate and
+        adsorbent route attributes) into a new file, validates it and atomically swaps it in, like
+        `get_shadow_file`. The file format version is kept.
+
+        Args:
+            storage_options (Optional[StorageOptions]): The layout and filters of the rewritten datasets. Defaults to
+                None, in which case every dataset keeps its current layout.
+
+        Returns:
+            CompactionReport: The file size, in bytes, before and after the compaction.
+        """
+        path = self.get_file_path().resolve()
+        size_before = os.path.getsize(path)
+
+        with File(path, "r") as src:
+            libver = "latest" if supports_swmr(src) else None
+            with self._replacement_file(".compact") as new_path:
+                with File(new_path, "w", libver=libver) as dst:
+                    copy_storage(src, dst, storage_options)
+
+        return CompactionReport(size_before, os.path.getsize(path))
 
     @contextmanager
-    def get_readable_file(self) -> File:
+    def get_shadow_file(
+        self, validator: Optional[Callable[[File], None]] = None
+    ) -> Iterator[File]:
+        """
+        Get an editable shadow copy of the storage file that atomically replaces it on exit.
+
+        The storage file is copied next to itself and the copy is opened for writing. When the context exits without
+        errors, the copy is closed, validated with `validate_storage_file` and renamed over the live file. If an
+        exception is raised, or the validation fails, the copy is removed and the live file is left untouched, so
+        readers never see a partially written file. Readers that already have the live file open keep a consistent
+        snapshot of it, and pooled handles pick up the new file on their next use.
+
+        Only one shadow copy should be written at a time, otherwise the last one to be committed wins.
+
+        Args:
+            validator (Optional[Callable[[File], None]]): An optional extra check run on the copy before it is
+                committed.
+
+        Returns:
+            File: The storage file copy object.
+
+        Raises:
+            InvalidStorageFile: If the copy fails the validation.
+        """
+        path = self.get_file_path().resolve()
+
+        with self._replacement_file(".shadow", validator) as shadow_path:
+            if path.exists():
+                shutil.copy2(path, shadow_path)
+                f = File(shadow_path, "a")
+            else:
+                f = File(shadow_path, "w")
+
+            try:
+                yield f
+            finally:
+                f.close()
+
+    @contextmanager
+    def _replacement_file(
+        self,
+        suffix: str,
+        validator: Optional[Callable[[File], None]] = None,
+    ) -> Iterator[Path]:
+        """
+        Get a temporary path, next to the storage file, for a new version of it.
+
+        When the context exits without errors, the new file is validated, given the permission bits of the storage
+        file (`mkstemp` creates it readable by its owner only) and atomically renamed over it. The temporary file is
+        always removed otherwise.
+        """
+        path = self.get_file_path().resolve()
+
+        fd, new_name = tempfile.mkstemp(
+            prefix=f".{path.name}.", suffix=suffix, dir=path.parent
+        )
+        os.close(fd)
+        new_path = Path(new_name)
+
+        try:
+            yield new_path
+            validate_storage_file(new_path, validator)
+            if path.exists():
+                shutil.copymode(path, new_path)
+            replace_file(new_path, path)
+        finally:
+            if new_path.exists():
+                new_path.unlink()
+
+    @contextmanager
+    def get_readable_file(self, swmr: bool = False) -> Iterator[File]:
         """
         Get a storage file object in a context manager fashion.
 
-        This method returns a file object that provides read and write access to a storage file. The file is automatically
-        closed when the context is exited using the 'with' statement.
+        This method returns a read-only file object from the read handle pool. The handle is shared with other readers
+        (of the same thread, in thread-local mode) and stays open when the context is exited, so it must not be closed
+        by the caller; use `close` to release it.
+
+        In SWMR mode, the handle is opened for reading while another process writes to the file with
+        `get_editable_file(swmr=True)`. Call `refresh()` on a dataset to see the data appended since it was last read.
+
+        Args:
+            swmr (bool): Whether to open the file in SWMR read mode. Defaults to False.
 
         Returns:
             File: The storage file object.
@@ -50,8 +530,11 @@ class StorageProvider:
             ...     # Access the storage file using 'file' as the file object
             ...     # Read from the storage file here
             ...
-            # File is automatically closed when the context is exited
+            # The handle is returned to the pool when the context is exited
         """
-        f = File(self.get_file_path().resolve(), "r")
-        yield f
-        f.close()
+        path = self.get_file_path().resolve()
+        f = self._read_pool.acquire(path, swmr, self._thread_local)
+        try:
+            yield f
+        finally:
+            self._read_pool.release(path, f, swmr, self._thread_local)
@@ -0,0 +1,180 @@
+import os
+import shutil
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from attr import define
+from h5py import Dataset, File, Group
+
+from adsorption_database.blob_store import require_blob
+from adsorption_database.defaults import EXPERIMENTS
+from adsorption_database.storage_options import StorageOptions
+
+
+@define
+class CompactionReport:
+    size_before: int
+    size_after: int
+
+
+@define
+class StorageReport:
+    size_before: int
+    size_after: int
+    read_seconds_before: float
+    read_seconds_after: float
+
+
+def get_layout_kwargs(dataset: Dataset) -> Dict[str, Any]:
+    """
+    Get the `h5py.Group.create_dataset` keyword arguments reproducing the layout and filters of a dataset.
+
+    Args:
+        dataset (Dataset): The source dataset.
+
+    Returns:
+        Dict[str, Any]: The layout and filter arguments.
+    """
+    if dataset.chunks is None:
+        return {}
+
+    return {
+        "chunks": dataset.chunks,
+        "maxshape": dataset.maxshape,
+        "compression": dataset.compression,
+        "compression_opts": dataset.compression_opts,
+        "shuffle": dataset.shuffle,
+    }
+
+
+def copy_attributes(src: Any, dst: Any) -> None:
+    """
+    Copy every attribute of a HDF5 object to another one, keeping their HDF5 types.
+
+    Args:
+        src (Any): The source group or dataset.
+        dst (Any): The destination group or dataset.
+    """
+    for name in src.attrs:
+        dst.attrs.create(
+            name, src.attrs[name], dtype=src.attrs.get_id(name).dtype
+        )
+
+
+def copy_storage(
+    src: Group,
+    dst: Group,
+    storage_options: Optional[StorageOptions] = None,
+) -> None:
+    """
+    Recursively copy the groups, datasets and attributes of a storage group into another one.
+
+    Datasets are rewritten with the layout and filters of `storage_options`, or with their current layout if no
+    options are given. Route references (such as the `adsorbate` and `adsorbent` attributes) are plain attributes
+    and are kept unchanged. A dataset reachable through several hard links (such as a deduplicated blob) is copied
+    once and linked again. If the options enable deduplication, the isotherm datasets are moved into blobs (see
+    `blob_store.require_blob`).
+
+    Args:
+        src (Group): The source group.
+        dst (Group): The destination group.
+        storage_options (Optional[StorageOptions]): The layout and filters of the copied datasets. Defaults to None.
+    """
+    _copy_group(src, dst, storage_options, {})
+
+
+def _copy_group(
+    src: Group,
+    dst: Group,
+    storage_options: Optional[StorageOptions],
+    copied: Dict[Any, Dataset],
+) -> None:
+    copy_attributes(src, dst)
+
+    for name, obj in src.items():
+        if isinstance(obj, Group):
+            _copy_group(obj, dst.create_group(name), storage_options, copied)
+            continue
+
+        dataset = copied.get(obj.id)
+        if dataset is not None:
+            dst[name] = dataset
+            continue
+
+        values = obj[()]
+        if storage_options is not None:
+            kwargs = storage_options.get_dataset_kwargs(values)
+        else:
+            kwargs = get_layout_kwargs(obj)
+
+        if (
+            storage_options is not None
+            and storage_options.deduplicate
+            and src.name.startswith(f"/{EXPERIMENTS}/")
+            and len(obj.attrs) == 0
+        ):
+            dataset, _ = require_blob(dst.file, values, kwargs)
+            dst[name] = dataset
+        else:
+            dataset = dst.create_dataset(name, data=values, **kwargs)
+            copy_attributes(obj, dataset)
+        copied[obj.id] = dataset
+
+
+def measure_read_time(path: Path, repeat: int = 3) -> float:
+    """
+    Measure the time needed to open a storage file and read every dataset in it.
+
+    Args:
+        path (Path): The storage file path.
+        repeat (int): The number of measurements; the fastest one is returned. Defaults to 3.
+
+    Returns:
+        float: The read time, in seconds.
+    """
+
+    def read_dataset(name: str, obj: Any) -> None:
+        if isinstance(obj, Dataset):
+            obj[()]
+
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        with File(path, "r") as f:
+            f.visititems(read_dataset)
+        timings.append(time.perf_counter() - start)
+
+    return min(timings)
+
+
+def report_storage_options(
+    path: Path, storage_options: StorageOptions
+) -> StorageReport:
+    """
+    Report the on-disk size and read time of a storage file before and after applying storage options to it.
+
+    The storage file is left untouched: the options are applied to a temporary copy.
+
+    Args:
+        path (Path): The storage file path.
+        storage_options (StorageOptions): The storage options to evaluate.
+
+    Returns:
+        StorageReport: The sizes (in bytes) and read times (in seconds) before and after.
+    """
+    folder = tempfile.mkdtemp()
+    try:
+        new_path = Path(folder) / path.name
+        with File(path, "r") as src, File(new_path, "w") as dst:
+            copy_storage(src, dst, storage_options)
+
+        return StorageReport(
+            size_before=os.path.getsize(path),
+            size_after=os.path.getsize(new_path),
+            read_seconds_before=measure_read_time(path),
+            read_seconds_after=measure_read_time(new_path),
+        )
+    finally:
+        shutil.rmtree(folder)
@@ -0,0 +1,15 @@
+import pytest
+from pytest_mock import MockerFixture
+from pathlib import Path
+from adsorption_database.storage_provider import StorageProvider
+
+
+@pytest.fixture
+def setup_storage(tmp_path: Path, mocker: MockerFixture) -> Path:
+    storage_path = Path(tmp_path / "test_storage.hdf5")
+
+    mocker.patch.object(
+        StorageProvider, "get_file_path", return_value=storage_path
+    )
+
+    return storage_path
@@ -1,6 +1,12 @@
 import asyncio
-from typing import Any, Dict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterator
+
+import pytest
+
+from adsorption_database._adsorption_database import GroupNotFound
 from adsorption_database import AdsorptionDatabase
+from adsorption_database.defaults import MIXTURE_ISOTHERMS, MONO_ISOTHERMS
 from pytest_regressions.data_regression import DataRegressionFixture
 from adsorption_database.helpers import Helpers
 
@@ -110,6 +116,72 @@ def test_get_adsobent() -> None:
     assert adsorbent.type is not None
 
 
+def test_get_experiments(helpers: Helpers) -> None:
+    database = AdsorptionDatabase()
+
+    experiments = database.get_experiments()
+
+    assert list(experiments) == database.list_experiments()
+    for name, experiment in experiments.items():
+        helpers.assert_equal(database.get_experiment(name), experiment)
+
+    hefti_13x, hefti_zsm5 = database.get_experiments(
+        ["HEFTI-13x", "HEFTI-ZSM5"]
+    ).values()
+    assert (
+        hefti_13x.monocomponent_isotherms[0].adsorbate
+        is hefti_zsm5.monocomponent_isotherms[0].adsorbate
+    )
+
+
+def test_concurrent_readers(helpers: Helpers) -> None:
+    database = AdsorptionDatabase()
+    names = database.list_experiments()
+    expected = database.get_experiments()
+
+    with AdsorptionDatabase(thread_local=True) as thread_local_database:
+        with ThreadPoolExecutor(4) as executor:
+            experiments = list(
+                executor.map(thread_local_database.get_experiment, names * 2)
+            )
+    for name, experiment in zip(names * 2, experiments):
+        helpers.assert_equal(expected[name], experiment)
+
+    with AdsorptionDatabase(processes=2) as process_database:
+        experiments_by_name = process_database.get_experiments()
+        assert process_database.get_experiments([]) == {}
+        with pytest.raises(GroupNotFound):
+            process_database.get_experiments(["Unknown"])
+
+    assert list(experiments_by_name) == names
+    for name, experiment in experiments_by_name.items():
+        helpers.assert_equal(expected[name], experiment)
+
+    with pytest.raises(ValueError):
+        AdsorptionDatabase(memory_map=True, processes=2)
+
+
+def test_iter_isotherms() -> None:
+    database = AdsorptionDatabase()
+
+    isotherms = database.iter_isotherms(
+        MIXTURE_ISOTHERMS,
+        filter=lambda handle: handle.temperature is not None
+        and handle.temperature > 300,
+    )
+
+    assert isinstance(isotherms, Iterator)
+    temperatures = [isotherm.temperature for isotherm in isotherms]
+    assert len(temperatures) == 23
+    assert all(temperature > 300 for temperature in temperatures)
+
+    points = list(database.iter_points(MONO_ISOTHERMS, batch_size=128))
+    assert all(len(batch.pressures) >= 128 for batch in points[:-1])
+    assert sum(len(batch.routes) for batch in points) == len(
+        database.find_isotherms(mixture=False)
+    )
+
+
 def test_get_storage_regression(
     helpers: Helpers, data_regression: DataRegressionFixture
 ) -> None:
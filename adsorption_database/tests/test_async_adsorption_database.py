@@ -0,0 +1,69 @@
+import asyncio
+import time
+from typing import Any, List
+
+import pytest
+from pytest_mock import MockerFixture
+
+from adsorption_database import AdsorptionDatabase, AsyncAdsorptionDatabase
+from adsorption_database.defaults import MIXTURE_ISOTHERMS
+from adsorption_database.helpers import Helpers
+from adsorption_database import storage_provider
+
+
+def test_concurrent_get_experiment(
+    helpers: Helpers, mocker: MockerFixture
+) -> None:
+    database = AdsorptionDatabase()
+    names = database.list_experiments()
+    open_spy = mocker.spy(storage_provider, "File")
+
+    async def get_experiments() -> List[Any]:
+        async with AsyncAdsorptionDatabase(database, max_workers=4) as db:
+            return await asyncio.gather(
+                *[db.get_experiment(name) for name in names * 4]
+            )
+
+    experiments = asyncio.run(get_experiments())
+
+    # Every call shares the pooled read handle
+    assert open_spy.call_count <= 1
+    for name, experiment in zip(names * 4, experiments):
+        helpers.assert_equal(database.get_experiment(name), experiment)
+
+
+def test_timeout(mocker: MockerFixture) -> None:
+    database = AdsorptionDatabase()
+    mocker.patch.object(
+        database, "list_adsorbates", side_effect=lambda: time.sleep(0.5)
+    )
+
+    async def list_adsorbates() -> None:
+        async with AsyncAdsorptionDatabase(database, timeout=0.05) as db:
+            with pytest.raises(asyncio.TimeoutError):
+                await db.list_adsorbates()
+            await db.list_adsorbates(timeout=None)
+
+    asyncio.run(list_adsorbates())
+
+
+def test_iter_isotherms() -> None:
+    async def get_temperatures() -> List[float]:
+        async with AsyncAdsorptionDatabase() as db:
+            with pytest.raises(ValueError):
+                async for _ in db.iter_isotherms("Unknown"):
+                    pass
+
+            return [
+                isotherm.temperature
+                async for isotherm in db.iter_isotherms(
+                    MIXTURE_ISOTHERMS,
+                    filter=lambda handle: handle.temperature is not None
+                    and handle.temperature > 300,
+                )
+            ]
+
+    temperatures = asyncio.run(get_temperatures())
+
+    assert len(temperatures) == 23
+    assert all(temperature > 300 for temperature in temperatures)
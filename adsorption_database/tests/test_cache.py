@@ -0,0 +1,92 @@
+import shutil
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from adsorption_database import AdsorptionDatabase
+from adsorption_database.cache import CacheInfo, ObjectCache
+from adsorption_database.handlers.text_file_hander import TextFileHandler
+from adsorption_database.helpers import Helpers
+from adsorption_database.models.adsorbate import Adsorbate
+
+
+@pytest.fixture
+def storage_copy(setup_storage: Path) -> Path:
+    shutil.copy(
+        Path(__file__).parents[1] / "storage" / "storage.hdf5", setup_storage
+    )
+    return setup_storage
+
+
+def test_object_cache_eviction() -> None:
+    signature = (0, 0, 0, 0)
+    cache = ObjectCache(max_size=2500)
+
+    assert cache.get("first", signature) is None
+    first = np.zeros(100)
+    cache.put("first", first, signature)
+    cache.put("second", np.zeros(100), signature)
+
+    assert cache.get("first", signature) is first
+    assert not first.flags.writeable
+
+    # the least recently used entry is evicted first
+    cache.put("third", np.zeros(100), signature)
+    assert cache.get("second", signature) is None
+    assert cache.get("first", signature) is first
+
+    # objects larger than the budget are never cached, nor made read-only
+    large = cache.put("large", np.zeros(1000), signature)
+    assert cache.get("large", signature) is None
+    assert large.flags.writeable
+
+    info = cache.get_info()
+    assert (info.hits, info.misses, info.entries) == (2, 3, 2)
+    assert info.size <= info.max_size
+
+    # a new signature means the storage file changed
+    assert cache.get("first", (0, 0, 1, 0)) is None
+    assert len(cache) == 0
+
+    # objects loaded from an older version of the file are not cached
+    stale = cache.put("stale", np.zeros(100), signature)
+    assert cache.get("stale", (0, 0, 1, 0)) is None
+    assert stale.flags.writeable
+
+
+def test_cached_queries(storage_copy: Path, helpers: Helpers) -> None:
+    database = AdsorptionDatabase(cache_size=64 * 1024**2)
+
+    experiment = database.get_experiment("HEFTI-13x")
+    assert experiment is not None
+    assert database.get_experiment("HEFTI-13x") is experiment
+    isotherm = experiment.monocomponent_isotherms[0]
+    with pytest.raises(ValueError):
+        isotherm.loadings[0] = 0
+
+    experiments = database.get_experiments(["HEFTI-13x", "HEFTI-ZSM5"])
+    assert experiments["HEFTI-13x"] is experiment
+    helpers.assert_equal(
+        AdsorptionDatabase().get_experiment("HEFTI-ZSM5"),
+        experiments["HEFTI-ZSM5"],
+    )
+
+    adsorbate = database.get_adsorbate("Carbon Dioxide")
+    assert database.get_adsorbate("Carbon Dioxide") is adsorbate
+
+    lazy_experiment = database.get_experiment("HEFTI-13x", lazy=True)
+    assert lazy_experiment is not experiment
+
+    info = database.get_cache_info()
+    assert isinstance(info, CacheInfo)
+    assert (info.hits, info.misses, info.entries) == (3, 3, 3)
+
+    TextFileHandler(storage_copy.parent).register_adsorbate(
+        Adsorbate(name="Argon", chemical_formula="Ar")
+    )
+
+    assert database.get_experiment("HEFTI-13x") is not experiment
+    info = database.get_cache_info()
+    assert info is not None
+    assert (info.hits, info.misses, info.entries) == (3, 4, 1)
@@ -0,0 +1,170 @@
+import shutil
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, List
+
+import pytest
+
+from adsorption_database import AdsorptionDatabase, datasets, shared
+from adsorption_database.catalog import Catalog, get_catalog_path
+from adsorption_database.defaults import EXPERIMENTS, MONO_ISOTHERMS
+from adsorption_database.models.adsorbent import AdsorbentType
+from adsorption_database.models.isotherms import IsothermType
+from adsorption_database.storage_provider import StorageProvider
+
+
+@pytest.fixture
+def storage_copy(setup_storage: Path) -> Path:
+    shutil.copy(
+        Path(__file__).parents[1] / "storage" / "storage.hdf5", setup_storage
+    )
+    return setup_storage
+
+
+def test_catalog_listing(storage_copy: Path) -> None:
+    with AdsorptionDatabase() as database:
+        experiments = database.list_experiments()
+        pure_isotherms = database.list_pure_isotherms("HEFTI-13x")
+
+        with StorageProvider().get_readable_file() as f:
+            assert experiments == list(f[EXPERIMENTS])
+            assert pure_isotherms == list(
+                f[EXPERIMENTS]["HEFTI-13x"][MONO_ISOTHERMS]
+            )
+
+        assert database.list_mixture_isotherms("missing") == []
+
+    assert get_catalog_path(storage_copy) == storage_copy.with_name(
+        "test_storage.hdf5.catalog.sqlite"
+    )
+    assert Catalog(storage_copy, get_catalog_path(storage_copy)).is_fresh()
+
+
+def test_catalog_filtering(storage_copy: Path) -> None:
+    with AdsorptionDatabase() as database:
+        assert database.list_experiments(
+            adsorbate="Nitrogen", temperature=413.15
+        ) == ["HEFTI-13x", "HEFTI-ZSM5"]
+        assert database.list_experiments(
+            adsorbate="Carbon Dioxide",
+            temperature=298,
+            temperature_tolerance=0,
+        ) == ["Dre-norit-R1"]
+        assert database.list_experiments(
+            adsorbate="N2", temperature=413.15
+        ) == ["HEFTI-13x", "HEFTI-ZSM5"]
+        assert database.list_experiments(adsorbent="unknown") == []
+
+
+def test_catalog_rebuilt_when_stale(storage_copy: Path) -> None:
+    with AdsorptionDatabase() as database:
+        assert "New" not in database.list_experiments()
+
+        with StorageProvider().get_editable_file() as f:
+            f[EXPERIMENTS].create_group("New")
+
+        assert "New" in database.list_experiments()
+
+
+def test_catalog_reuses_connections(
+    storage_copy: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    connections: List[sqlite3.Connection] = []
+    statements: List[str] = []
+    connect = sqlite3.connect
+
+    def spy_connect(*args: Any, **kwargs: Any) -> sqlite3.Connection:
+        connection: sqlite3.Connection = connect(*args, **kwargs)
+        connection.set_trace_callback(statements.append)
+        connections.append(connection)
+        return connection
+
+    monkeypatch.setattr(sqlite3, "connect", spy_connect)
+
+    with AdsorptionDatabase() as database:
+        database.list_experiments()
+        statements.clear()
+
+        database.list_experiments(adsorbate="Nitrogen")
+        database.list_adsorbates()
+        assert len(connections) == 1
+
+        with ThreadPoolExecutor(1) as executor:
+            executor.submit(database.list_adsorbents).result()
+        assert len(connections) == 2
+
+    assert not any("CREATE" in statement for statement in statements)
+
+
+def test_catalog_in_memory(storage_copy: Path) -> None:
+    catalog = Catalog(storage_copy)
+
+    assert not catalog.is_fresh()
+
+    with StorageProvider().get_readable_file() as f:
+        catalog.rebuild(f)
+
+    assert catalog.is_fresh()
+    assert "Carbon Dioxide" in catalog.list_names("adsorbates")
+    assert not storage_copy.with_name(
+        "test_storage.hdf5.catalog.sqlite"
+    ).exists()
+
+
+def test_catalog_rebuild_reads_only_pressures(
+    storage_copy: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    with AdsorptionDatabase() as database:
+        expected = database.find_isotherms()
+
+    routes: List[str] = []
+    read_dataset = datasets.read_dataset
+
+    def spy_read_dataset(dataset: Any, *args: Any) -> Any:
+        routes.append(dataset.name)
+        return read_dataset(dataset, *args)
+
+    monkeypatch.setattr(datasets, "read_dataset", spy_read_dataset)
+    monkeypatch.setattr(shared, "read_dataset", spy_read_dataset)
+
+    catalog = Catalog(storage_copy)
+    with StorageProvider().get_readable_file() as f:
+        catalog.rebuild(f)
+
+    assert routes == []
+    assert catalog.find_isotherms() == expected
+
+
+def test_find_and_load_isotherms(storage_copy: Path) -> None:
+    with AdsorptionDatabase() as database:
+        handles = database.find_isotherms(
+            adsorbate="CO2",
+            mixture=False,
+            isotherm_type=IsothermType.EXCESS,
+            temperature_range=(290, 310),
+            pressure_range=(1e4, 9e5),
+            adsorbent_type=AdsorbentType.ZEOLITE,
+        )
+        isotherms = database.load_isotherms(handles)
+
+        mixture_handles = database.find_isotherms(
+            mixture=True, adsorbent_properties={"si_al_ratio": (100, None)}
+        )
+
+        with pytest.raises(ValueError):
+            database.find_isotherms(adsorbent_properties={"name": (0, 1)})
+
+    assert [handle.route for handle in handles] == [
+        "/Experiments/HEFTI-13x/Pure/CO2-298.15-Excess",
+        "/Experiments/MOFA-5A/Pure/CO2-303-Excess",
+    ]
+    assert [isotherm.name for isotherm in isotherms] == [
+        "CO2-298.15",
+        "CO2-303",
+    ]
+    assert handles[0].points == 20
+
+    assert {handle.experiment for handle in mixture_handles} == {"HEFTI-ZSM5"}
+    assert all(handle.is_mixture for handle in mixture_handles)
+    assert mixture_handles[0].adsorbates == ("Carbon Dioxide", "Nitrogen")
@@ -0,0 +1,63 @@
+from pathlib import Path
+
+import numpy as np
+from h5py import File
+
+from adsorption_database.datasets import LazyDataset, read_dataset
+from adsorption_database.storage_provider import StorageProvider
+
+
+def test_read_dataset_memory_map(tmp_path: Path) -> None:
+    path = tmp_path / "storage.hdf5"
+    with File(path, "w") as f:
+        f.create_dataset("contiguous", data=np.arange(4.0))
+        f.create_dataset("chunked", data=np.arange(4.0), chunks=True)
+
+    with File(path, "r") as f:
+        contiguous = read_dataset(f["contiguous"], memory_map=True)
+        chunked = read_dataset(f["chunked"], memory_map=True)
+
+    assert isinstance(contiguous, np.memmap)
+    assert not contiguous.flags.writeable
+    assert not isinstance(chunked, np.memmap)
+    np.testing.assert_array_equal(contiguous, np.arange(4.0))
+    np.testing.assert_array_equal(chunked, np.arange(4.0))
+
+
+def test_memory_map_sees_writes(tmp_path: Path) -> None:
+    path = tmp_path / "storage.hdf5"
+    with File(path, "w") as f:
+        f.create_dataset("values", data=np.arange(3.0))
+
+    with File(path, "r") as f:
+        values = read_dataset(f["values"], memory_map=True)
+        snapshot = np.array(values)
+
+    with File(path, "a") as f:
+        f["values"][...] = np.arange(3.0) * 5
+
+    np.testing.assert_array_equal(values, [0.0, 5.0, 10.0])
+    np.testing.assert_array_equal(snapshot, [0.0, 1.0, 2.0])
+
+
+def test_lazy_dataset(tmp_path: Path) -> None:
+    path = tmp_path / "storage.hdf5"
+    with File(path, "w") as f:
+        f.create_group("A").create_dataset("values", data=np.arange(4.0))
+
+    with File(path, "r") as f:
+        lazy = LazyDataset(f["A/values"])
+
+    assert lazy.route == "/A/values"
+    assert lazy.shape == (4,)
+    assert len(lazy) == 4
+    loaded = [lazy.is_loaded]
+
+    with StorageProvider(file_path=path):
+        np.testing.assert_array_equal(lazy + 1, np.arange(1.0, 5.0))
+        loaded.append(lazy.is_loaded)
+        assert loaded == [False, True]
+        assert lazy[1] == 1.0
+        assert lazy.max() == 3.0
+        assert np.concatenate([lazy, lazy]).shape == (8,)
+        assert list(lazy) == [0.0, 1.0, 2.0, 3.0]
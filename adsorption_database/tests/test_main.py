@@ -0,0 +1,77 @@
+from pathlib import Path
+
+import numpy as np
+from h5py import File
+from pytest import CaptureFixture
+
+from adsorption_database.__main__ import main
+from adsorption_database.catalog import Catalog, get_catalog_path
+
+
+def test_report_and_compact(
+    tmp_path: Path, capsys: CaptureFixture[str]
+) -> None:
+    path = tmp_path / "storage.hdf5"
+    with File(path, "w") as f:
+        f.create_dataset("pressures", data=np.linspace(0, 1, 10000))
+
+    main(["report", str(path), "--compression", "gzip", "--shuffle"])
+    assert "Size:" in capsys.readouterr().out
+
+    main(["compact", str(path), "--compression", "gzip", "--shuffle"])
+    assert "Size:" in capsys.readouterr().out
+
+    with File(path, "r") as f:
+        assert f["pressures"].compression == "gzip"
+        assert (f["pressures"][()] == np.linspace(0, 1, 10000)).all()
+
+
+def test_points(tmp_path: Path, capsys: CaptureFixture[str]) -> None:
+    path = tmp_path / "storage.hdf5"
+    with File(path, "w") as f:
+        isotherm = f.create_group("Experiments/A/Pure/B")
+        isotherm.create_dataset("pressures", data=np.arange(3.0))
+        isotherm.create_dataset("loadings", data=np.arange(3.0))
+
+    main(["points", str(path)])
+    assert "Point store written" in capsys.readouterr().out
+
+    with File(path, "r") as f:
+        assert (f["Points/Pure/pressures"][()] == np.arange(3.0)).all()
+
+
+def test_rebuild_index(tmp_path: Path, capsys: CaptureFixture[str]) -> None:
+    path = tmp_path / "storage.hdf5"
+    with File(path, "w") as f:
+        f.create_group("Experiments/A")
+
+    main(["rebuild-index", str(path)])
+    assert "Catalog:" in capsys.readouterr().out
+
+    catalog = Catalog(path, get_catalog_path(path))
+    assert catalog.is_fresh()
+    assert catalog.list_names("experiments") == ["A"]
+
+
+def test_blobs(tmp_path: Path, capsys: CaptureFixture[str]) -> None:
+    path = tmp_path / "storage.hdf5"
+    with File(path, "w") as f:
+        for name in ["A", "B"]:
+            isotherm = f.create_group(f"Experiments/{name}/Pure/C")
+            isotherm.create_dataset("pressures", data=np.arange(3.0))
+
+    main(["compact", str(path), "--deduplicate"])
+    capsys.readouterr()
+
+    main(["blobs", str(path)])
+    assert "Saved: 24 bytes" in capsys.readouterr().out
+
+    with File(path, "a") as f:
+        del f["Experiments/B"]
+        f["Blobs/orphan"] = np.arange(2.0)
+
+    main(["blobs", str(path), "--prune"])
+    output = capsys.readouterr().out
+    assert "Pruned blobs: 1" in output
+    assert "Blobs: 1 (1 links)" in output
+    assert "Saved: 0 bytes" in output
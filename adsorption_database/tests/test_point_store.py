@@ -0,0 +1,202 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+from h5py import File, Group
+from pytest_mock import MockerFixture
+
+from adsorption_database import AdsorptionDatabase, point_store
+from adsorption_database.defaults import POINTS
+from adsorption_database.point_store import (
+    build_mixture_point_table,
+    build_pure_point_table,
+    is_point_store_fresh,
+    iter_point_tables,
+    read_mixture_point_table,
+    read_pure_point_table,
+    update_point_store,
+    write_point_store,
+)
+from adsorption_database.serializers.mono_isotherm_serializer import (
+    MonoIsothermSerializer,
+)
+
+
+def test_point_store_empty_file(tmp_path: Path) -> None:
+    with File(tmp_path / "storage.hdf5", "w") as f:
+        write_point_store(f)
+
+        pure_points = read_pure_point_table(f)
+        mixture_points = read_mixture_point_table(f)
+
+    assert pure_points.routes == []
+    assert list(pure_points.offsets) == [0]
+    assert pure_points.pressures.shape == (0,)
+    assert mixture_points.loadings.shape == (0, 0)
+
+
+def test_get_points() -> None:
+    with AdsorptionDatabase() as database:
+        pure_points = database.get_pure_points()
+        mixture_points = database.get_mixture_points()
+
+        experiment = database.get_experiment("HEFTI-13x")
+
+    assert experiment is not None
+    assert len(pure_points.isotherm_ids) == len(pure_points.pressures)
+    assert len(mixture_points.components) == len(mixture_points.routes)
+
+    for isotherm in experiment.monocomponent_isotherms:
+        route = next(
+            route
+            for route in pure_points.routes
+            if route.startswith("/Experiments/HEFTI-13x/")
+            and route.endswith(
+                isotherm.name + "-" + isotherm.isotherm_type.value
+            )
+        )
+        points = pure_points.get_isotherm_slice(route)
+        np.testing.assert_array_equal(
+            pure_points.pressures[points], isotherm.pressures
+        )
+
+
+def test_write_point_store_in_place(tmp_path: Path) -> None:
+    with File(tmp_path / "storage.hdf5", "w") as f:
+        isotherm = f.create_group("Experiments/A/Mixture/B")
+        isotherm.attrs["temperature"] = 300.0
+        isotherm.create_dataset("pressures", data=np.arange(3.0))
+        isotherm.create_dataset("loadings", data=np.ones((2, 3)))
+        isotherm.create_dataset("bulk_composition", data=np.ones((2, 3)))
+        write_point_store(f)
+
+        isotherm = f.create_group("Experiments/A/Mixture/C")
+        isotherm.create_dataset("pressures", data=np.arange(2.0))
+        isotherm.create_dataset("loadings", data=np.ones((3, 2)))
+        isotherm.create_dataset("bulk_composition", data=np.ones((3, 2)))
+        write_point_store(f)
+
+        mixture_points = read_mixture_point_table(f)
+        assert f[POINTS]["Mixture"]["routes"].shape == (2,)
+        assert build_pure_point_table(f).routes == []
+        assert build_mixture_point_table(f).routes == mixture_points.routes
+
+    assert list(mixture_points.offsets) == [0, 3, 5]
+    assert list(mixture_points.components) == [2, 3]
+    assert np.isnan(mixture_points.loadings[2, :3]).all()
+    assert (mixture_points.loadings[:, 3:] == 1).all()
+    assert np.isnan(mixture_points.temperatures[1])
+
+
+def test_iter_point_tables(tmp_path: Path) -> None:
+    with File(tmp_path / "storage.hdf5", "w") as f:
+        for index, size in enumerate([3, 2, 4, 1]):
+            isotherm = f.create_group(f"Experiments/A/Pure/{index}")
+            isotherm.create_dataset("pressures", data=np.arange(size) + index)
+            isotherm.create_dataset("loadings", data=np.arange(size) + index)
+
+        from_groups = list(iter_point_tables(f, "Pure", batch_size=4))
+        write_point_store(f)
+        from_store = list(iter_point_tables(f, "Pure", batch_size=4))
+
+        with pytest.raises(ValueError):
+            next(iter_point_tables(f, "Other"))
+
+    for batches in [from_groups, from_store]:
+        assert [batch.routes for batch in batches] == [
+            ["/Experiments/A/Pure/0", "/Experiments/A/Pure/1"],
+            ["/Experiments/A/Pure/2"],
+            ["/Experiments/A/Pure/3"],
+        ]
+        assert [list(batch.offsets) for batch in batches] == [
+            [0, 3, 5],
+            [0, 4],
+            [0, 1],
+        ]
+        np.testing.assert_array_equal(batches[1].pressures, np.arange(4) + 2)
+
+
+def _write_mixture(
+    f: File, name: str, components: int, size: int, value: float
+) -> Group:
+    isotherm = f.require_group(f"Experiments/A/Mixture/{name}")
+    for dataset_name, shape in [
+        ("pressures", (size,)),
+        ("loadings", (components, size)),
+        ("bulk_composition", (components, size)),
+    ]:
+        if dataset_name in isotherm:
+            del isotherm[dataset_name]
+        isotherm.create_dataset(dataset_name, data=np.full(shape, value))
+    return isotherm
+
+
+def test_update_point_store(tmp_path: Path, mocker: MockerFixture) -> None:
+    with File(tmp_path / "storage.hdf5", "w") as f:
+        _write_mixture(f, "B", 2, 3, 1.0)
+        _write_mixture(f, "C", 2, 2, 2.0)
+        write_point_store(f)
+        scan_spy = mocker.spy(point_store, "iter_isotherm_groups")
+
+        # same size, overwritten in place
+        changed = _write_mixture(f, "B", 1, 3, 3.0)
+        changed.attrs["temperature"] = 300.0
+        # new isotherm with more components, appended
+        added = _write_mixture(f, "D", 3, 1, 4.0)
+        update_point_store(f, [changed.name, added.name])
+
+        assert scan_spy.call_count == 0
+        mixture_points = read_mixture_point_table(f)
+        assert mixture_points.routes == [
+            "/Experiments/A/Mixture/B",
+            "/Experiments/A/Mixture/C",
+            "/Experiments/A/Mixture/D",
+        ]
+        assert list(mixture_points.offsets) == [0, 3, 5, 6]
+        assert list(mixture_points.components) == [1, 2, 3]
+        assert mixture_points.temperatures[0] == 300.0
+        np.testing.assert_array_equal(
+            mixture_points.loadings,
+            [
+                [3.0, 3.0, 3.0, 2.0, 2.0, 4.0],
+                [np.nan, np.nan, np.nan, 2.0, 2.0, 4.0],
+                [np.nan, np.nan, np.nan, np.nan, np.nan, 4.0],
+            ],
+        )
+
+        # a new size rebuilds the table
+        changed = _write_mixture(f, "C", 2, 4, 5.0)
+        update_point_store(f, [changed.name])
+
+        assert scan_spy.call_count > 0
+        mixture_points = read_mixture_point_table(f)
+        assert list(mixture_points.offsets) == [0, 3, 7, 8]
+        np.testing.assert_array_equal(
+            mixture_points.bulk_composition,
+            build_mixture_point_table(f).bulk_composition,
+        )
+
+
+def test_point_store_stale_after_append(tmp_path: Path) -> None:
+    with File(tmp_path / "storage.hdf5", "w") as f:
+        isotherm = f.create_group("Experiments/A/Pure/B")
+        serializer = MonoIsothermSerializer()
+        for dataset_name in ["pressures", "loadings"]:
+            serializer.append_dataset(isotherm, dataset_name, np.arange(3.0))
+        write_point_store(f)
+        assert is_point_store_fresh(f)
+
+        for dataset_name in ["pressures", "loadings"]:
+            serializer.append_dataset(isotherm, dataset_name, np.array([3.0]))
+
+        # stale rows are never served
+        assert not is_point_store_fresh(f)
+        np.testing.assert_array_equal(
+            read_pure_point_table(f).pressures, np.arange(4.0)
+        )
+        batches = list(iter_point_tables(f, "Pure"))
+        np.testing.assert_array_equal(batches[0].loadings, np.arange(4.0))
+
+        update_point_store(f, [])
+        assert is_point_store_fresh(f)
+        assert list(read_pure_point_table(f).offsets) == [0, 4]
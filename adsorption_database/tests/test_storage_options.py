@@ -0,0 +1,51 @@
+from typing import Optional, Tuple
+
+import numpy as np
+import pytest
+
+from adsorption_database.storage_options import StorageOptions
+
+
+def test_small_arrays_stay_contiguous() -> None:
+    options = StorageOptions(compression="gzip", shuffle=True)
+
+    assert options.get_dataset_kwargs(np.arange(10, dtype="float64")) == {}
+
+
+@pytest.mark.parametrize(
+    "shape, expected_chunks, expected_maxshape",
+    [
+        ((10000,), (1024,), (None,)),
+        ((2, 10000), (2, 512), (2, None)),
+        ((3, 100), (3, 100), (3, None)),
+    ],
+)
+def test_chunked_arrays(
+    shape: Tuple[int, ...],
+    expected_chunks: Tuple[int, ...],
+    expected_maxshape: Tuple[Optional[int], ...],
+) -> None:
+    options = StorageOptions(
+        compression="lzf",
+        shuffle=True,
+        chunk_size_bytes=8 * 1024,
+        contiguous_threshold_bytes=0,
+    )
+
+    kwargs = options.get_dataset_kwargs(np.zeros(shape, dtype="float64"))
+
+    assert kwargs == {
+        "chunks": expected_chunks,
+        "maxshape": expected_maxshape,
+        "compression": "lzf",
+        "compression_opts": None,
+        "shuffle": True,
+    }
+
+
+def test_invalid_options() -> None:
+    with pytest.raises(ValueError):
+        StorageOptions(compression="zstd")
+
+    with pytest.raises(ValueError):
+        StorageOptions(compression="lzf", compression_level=4)
@@ -0,0 +1,300 @@
+import multiprocessing
+import stat
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+
+import h5py
+import numpy as np
+import pytest
+
+from adsorption_database.storage_provider import (
+    InvalidStorageFile,
+    ReadHandlePool,
+    StorageProvider,
+)
+
+
+def test_readable_file_is_shared(setup_storage: Path) -> None:
+    pool = ReadHandlePool()
+
+    with StorageProvider(pool).get_editable_file() as f:
+        f.create_dataset("values", data=np.arange(3, dtype="float64"))
+
+    with StorageProvider(pool).get_readable_file() as f1:
+        pass
+
+    with StorageProvider(pool).get_readable_file() as f2:
+        assert f2 is f1
+        assert f2.id.valid
+
+    assert len(pool) == 1
+
+    pool.close()
+
+    assert len(pool) == 0
+    assert not f1.id.valid
+
+
+def test_readable_file_reopens_on_change(setup_storage: Path) -> None:
+    pool = ReadHandlePool()
+    provider = StorageProvider(pool)
+
+    with provider.get_editable_file() as f:
+        f.create_dataset("values", data=np.arange(3, dtype="float64"))
+
+    with provider.get_readable_file() as f:
+        assert list(f) == ["values"]
+
+    with provider.get_editable_file() as f:
+        f.create_dataset("other_values", data=np.arange(5, dtype="float64"))
+
+    with provider.get_readable_file() as f:
+        assert list(f) == ["other_values", "values"]
+
+    provider.close()
+    assert len(pool) == 0
+
+
+def _write_other_values(path: Path) -> None:
+    with StorageProvider(ReadHandlePool(), path).get_editable_file() as f:
+        f.create_dataset("other_values", data=np.arange(5, dtype="float64"))
+
+
+def test_readable_file_does_not_lock_writers(setup_storage: Path) -> None:
+    pool = ReadHandlePool()
+    provider = StorageProvider(pool)
+
+    with provider.get_editable_file() as f:
+        f.create_dataset("values", data=np.arange(3, dtype="float64"))
+
+    with provider.get_readable_file() as f:
+        assert list(f) == ["values"]
+
+    # the pooled handle is still open while another process writes the file
+    with ProcessPoolExecutor(
+        1, mp_context=multiprocessing.get_context("spawn")
+    ) as executor:
+        executor.submit(_write_other_values, setup_storage).result()
+
+    with provider.get_readable_file() as f:
+        assert list(f) == ["other_values", "values"]
+
+    provider.close()
+
+
+def test_release_stale_handle(setup_storage: Path) -> None:
+    pool = ReadHandlePool()
+    provider = StorageProvider(pool)
+
+    with provider.get_editable_file() as f:
+        f.create_dataset("values", data=np.arange(3, dtype="float64"))
+
+    with provider.get_readable_file() as old_file:
+        # another process replaces the file while the handle is in use
+        other_path = setup_storage.parent / "other.hdf5"
+        with h5py.File(other_path, "w") as f:
+            f.create_dataset("new_values", data=np.arange(2, dtype="float64"))
+        other_path.replace(setup_storage)
+
+        with provider.get_readable_file() as new_file:
+            assert new_file is not old_file
+            assert list(new_file) == ["new_values"]
+
+        assert old_file.id.valid
+        assert list(old_file) == ["values"]
+
+    assert not old_file.id.valid
+
+
+def test_invalidate_handle_in_use(setup_storage: Path) -> None:
+    pool = ReadHandlePool()
+    provider = StorageProvider(pool)
+
+    with provider.get_editable_file() as f:
+        f.create_dataset("values", data=np.arange(3, dtype="float64"))
+
+    with provider.get_readable_file() as f:
+        # a writer does not close the handle under a running reader
+        with pytest.raises(OSError):
+            with provider.get_editable_file():
+                pass
+        provider.close()
+
+        assert len(pool) == 0
+        np.testing.assert_array_equal(f["values"][()], np.arange(3))
+
+    assert not f.id.valid
+
+    with provider.get_editable_file() as f:
+        f["values"][...] = np.arange(3, 6)
+
+    provider.close()
+
+
+def test_shadow_file_commit(setup_storage: Path) -> None:
+    pool = ReadHandlePool()
+    provider = StorageProvider(pool)
+
+    with provider.get_shadow_file() as f:
+        f.create_dataset("values", data=np.arange(3, dtype="float64"))
+
+    with provider.get_readable_file() as snapshot:
+        with provider.get_shadow_file() as f:
+            f.create_dataset("new_values", data=np.arange(2, dtype="float64"))
+
+        # readers keep the file they already had open
+        assert list(snapshot) == ["values"]
+
+    with provider.get_readable_file() as f:
+        assert list(f) == ["new_values", "values"]
+
+    assert list(setup_storage.parent.iterdir()) == [setup_storage]
+    pool.close()
+
+
+def test_shadow_file_rollback(setup_storage: Path) -> None:
+    provider = StorageProvider(ReadHandlePool())
+
+    with provider.get_shadow_file() as f:
+        f.create_dataset("values", data=np.arange(3, dtype="float64"))
+
+    with pytest.raises(RuntimeError):
+        with provider.get_shadow_file() as f:
+            f.create_dataset("partial", data=np.arange(3, dtype="float64"))
+            raise RuntimeError("ingestion failed")
+
+    def check_values(f: h5py.File) -> None:
+        assert "values" not in f
+
+    with pytest.raises(InvalidStorageFile):
+        with provider.get_shadow_file(check_values) as f:
+            f.create_dataset("other", data=np.arange(3, dtype="float64"))
+
+    with provider.get_readable_file() as f:
+        assert list(f) == ["values"]
+
+    assert list(setup_storage.parent.iterdir()) == [setup_storage]
+    provider.close()
+
+
+def test_swmr_mode(setup_storage: Path) -> None:
+    provider = StorageProvider(ReadHandlePool())
+
+    with provider.get_editable_file() as f:
+        f.create_dataset(
+            "values", data=np.arange(3, dtype="float64"), maxshape=(None,)
+        )
+
+    with pytest.raises(InvalidStorageFile):
+        with provider.get_editable_file(swmr=True):
+            pass
+
+    provider.upgrade_file_format()
+
+    with provider.get_editable_file(swmr=True) as f:
+        assert f.swmr_mode
+        f["values"].resize((5,))
+        f["values"][3:] = [3, 4]
+
+    with provider.get_readable_file(swmr=True) as f:
+        assert f.swmr_mode
+        dataset = f["values"]
+        dataset.refresh()
+        assert (dataset[...] == np.arange(5, dtype="float64")).all()
+
+    provider.close()
+
+
+def test_swmr_handle_reopens_on_replace(setup_storage: Path) -> None:
+    provider = StorageProvider(ReadHandlePool())
+
+    with provider.get_editable_file() as f:
+        f.create_dataset("values", data=np.arange(3, dtype="float64"))
+    provider.upgrade_file_format()
+
+    with provider.get_readable_file(swmr=True) as f1:
+        assert list(f1) == ["values"]
+
+    with provider.get_shadow_file() as f:
+        f.create_dataset("new_values", data=np.arange(2, dtype="float64"))
+
+    with provider.get_readable_file(swmr=True) as f2:
+        assert f2 is not f1
+        assert list(f2) == ["new_values", "values"]
+
+    provider.close()
+
+
+def test_compact(setup_storage: Path) -> None:
+    provider = StorageProvider(ReadHandlePool())
+
+    with provider.get_editable_file() as f:
+        group = f.create_group("Experiments/A/Pure/isotherm")
+        group.attrs["adsorbate"] = "/Adsorbates/Carbon Dioxide"
+        f.create_group("Adsorbates/Carbon Dioxide").attrs["name"] = "CO2"
+
+    # space freed in previous sessions is never reclaimed
+    for size in range(100, 1000, 100):
+        with provider.get_editable_file() as f:
+            group = f["Experiments/A/Pure/isotherm"]
+            if "pressures" in group:
+                del group["pressures"]
+            group.create_dataset("pressures", data=np.arange(size * 1.0))
+
+    report = provider.compact()
+
+    assert report.size_before > report.size_after
+    assert report.size_after == setup_storage.stat().st_size
+    assert list(setup_storage.parent.iterdir()) == [setup_storage]
+
+    with provider.get_readable_file() as f:
+        group = f["Experiments/A/Pure/isotherm"]
+        assert (group["pressures"][()] == np.arange(900.0)).all()
+        assert f[group.attrs["adsorbate"]].attrs["name"] == "CO2"
+
+    provider.close()
+
+
+@pytest.mark.parametrize("rewrite", ["compact", "upgrade_file_format"])
+def test_rewrite_keeps_file_mode(setup_storage: Path, rewrite: str) -> None:
+    provider = StorageProvider(ReadHandlePool())
+
+    with provider.get_editable_file() as f:
+        f.create_dataset("values", data=np.arange(3, dtype="float64"))
+    setup_storage.chmod(0o644)
+
+    getattr(provider, rewrite)()
+
+    assert stat.S_IMODE(setup_storage.stat().st_mode) == 0o644
+    with provider.get_readable_file() as f:
+        np.testing.assert_array_equal(f["values"][()], np.arange(3))
+
+    provider.close()
+
+
+def test_thread_local_handles(setup_storage: Path) -> None:
+    pool = ReadHandlePool()
+    provider = StorageProvider(pool, thread_local=True)
+
+    with provider.get_editable_file() as f:
+        f.create_dataset("values", data=np.arange(3, dtype="float64"))
+
+    with provider.get_readable_file() as f1:
+        pass
+    with provider.get_readable_file() as f2:
+        assert f2 is f1
+
+    def read_values() -> h5py.File:
+        with provider.get_readable_file() as f:
+            np.testing.assert_array_equal(f["values"][()], np.arange(3))
+            return f
+
+    with ThreadPoolExecutor(1) as executor:
+        f3 = executor.submit(read_values).result()
+
+    assert f3 is not f1
+    assert f3.id.valid
+    assert len(pool) == 2
+
+    provider.close()
+    assert len(pool) == 0
@@ -0,0 +1,94 @@
+from pathlib import Path
+
+import h5py
+import numpy as np
+
+from adsorption_database.blob_store import get_deduplication_report
+from adsorption_database.defaults import BLOBS
+from adsorption_database.storage_options import StorageOptions
+from adsorption_database.storage_tools import (
+    copy_storage,
+    report_storage_options,
+)
+
+
+def create_storage(path: Path) -> None:
+    with h5py.File(path, "w") as f:
+        group = f.create_group("Experiments/A/Pure/isotherm")
+        group.attrs["adsorbate"] = "/Adsorbates/Carbon Dioxide"
+        group.attrs["temperature"] = 300.0
+        group.create_dataset("pressures", data=np.linspace(0, 1, 5000))
+        group.create_dataset("loadings", data=np.zeros(5000))
+        f.create_group("Adsorbates/Carbon Dioxide").attrs[
+            "name"
+        ] = "Carbon Dioxide"
+
+
+def test_copy_storage(tmp_path: Path) -> None:
+    create_storage(tmp_path / "src.hdf5")
+    options = StorageOptions(
+        compression="gzip", shuffle=True, contiguous_threshold_bytes=0
+    )
+
+    with h5py.File(tmp_path / "src.hdf5", "r") as src, h5py.File(
+        tmp_path / "dst.hdf5", "w"
+    ) as dst:
+        copy_storage(src, dst, options)
+
+        group = dst["Experiments/A/Pure/isotherm"]
+        assert dict(group.attrs) == dict(
+            src["Experiments/A/Pure/isotherm"].attrs
+        )
+        assert group["pressures"].compression == "gzip"
+        assert group["pressures"].shuffle
+        assert (
+            group["pressures"][()]
+            == src["Experiments/A/Pure/isotherm/pressures"][()]
+        ).all()
+        assert dst[group.attrs["adsorbate"]].attrs["name"] == "Carbon Dioxide"
+
+
+def test_copy_storage_deduplicated(tmp_path: Path) -> None:
+    create_storage(tmp_path / "src.hdf5")
+    with h5py.File(tmp_path / "src.hdf5", "a") as f:
+        f["Experiments/A/Pure/copy"] = f["Experiments/A/Pure/isotherm"]
+
+    with h5py.File(tmp_path / "src.hdf5", "r") as src, h5py.File(
+        tmp_path / "dst.hdf5", "w"
+    ) as dst:
+        copy_storage(src, dst)
+        assert (
+            dst["Experiments/A/Pure/copy/pressures"].id
+            == dst["Experiments/A/Pure/isotherm/pressures"].id
+        )
+        assert BLOBS not in dst
+
+    with h5py.File(tmp_path / "dst.hdf5", "r") as src, h5py.File(
+        tmp_path / "dedup.hdf5", "w"
+    ) as dst:
+        copy_storage(src, dst, StorageOptions(deduplicate=True))
+        report = get_deduplication_report(dst)
+        # the pressures and loadings blobs, each linked by both isotherms
+        assert report.blobs == 2
+        assert report.links == 4
+        assert report.bytes_saved == report.bytes_stored == 2 * 5000 * 8
+
+    with h5py.File(tmp_path / "dedup.hdf5", "r") as src, h5py.File(
+        tmp_path / "compact.hdf5", "w"
+    ) as dst:
+        copy_storage(src, dst)
+        assert get_deduplication_report(dst) == report
+
+
+def test_report_storage_options(tmp_path: Path) -> None:
+    path = tmp_path / "storage.hdf5"
+    create_storage(path)
+
+    report = report_storage_options(
+        path, StorageOptions(compression="gzip", shuffle=True)
+    )
+
+    assert report.size_before == path.stat().st_size
+    assert report.size_after < report.size_before
+    assert report.read_seconds_before > 0
+    assert report.read_seconds_after > 0
@@ -0,0 +1,59 @@
+"""
+Latency of concurrent experiment reads through the asyncio front-end.
+
+Fires a few hundred concurrent `get_experiment` awaits at `AsyncAdsorptionDatabase` and reports the p50 and p99
+latency of each request, measured from submission to result, for a few worker counts.
+
+Usage:
+    python -m benchmarks.bench_async
+"""
+
+import asyncio
+import time
+from typing import List
+
+import numpy as np
+
+from adsorption_database import AdsorptionDatabase, AsyncAdsorptionDatabase
+
+REQUESTS = 300
+WORKERS = [1, 2, 4, 8]
+
+
+async def measure(
+    database: AsyncAdsorptionDatabase, names: List[str]
+) -> List[float]:
+    async def request(name: str) -> float:
+        start = time.perf_counter()
+        await database.get_experiment(name)
+        return time.perf_counter() - start
+
+    return await asyncio.gather(
+        *[request(names[i % len(names)]) for i in range(REQUESTS)]
+    )
+
+
+async def run(workers: int, names: List[str]) -> None:
+    async with AsyncAdsorptionDatabase(
+        AdsorptionDatabase(), max_workers=workers
+    ) as database:
+        await database.get_experiment(names[0])
+
+        start = time.perf_counter()
+        durations = await measure(database, names)
+        total = time.perf_counter() - start
+
+    values = np.array(durations) * 1e3
+    print(
+        f"{workers} workers: p50 {np.percentile(values, 50):.1f} ms, "
+        f"p99 {np.percentile(values, 99):.1f} ms, "
+        f"{REQUESTS / total:.0f} requests/s"
+    )
+
+
+if __name__ == "__main__":
+    names = AdsorptionDatabase().list_experiments()
+
+    print(f"{REQUESTS} concurrent requests over {len(names)} experiments")
+    for workers in WORKERS:
+        asyncio.run(run(workers, names))
@@ -0,0 +1,105 @@
+"""
+Per-isotherm deserialization time of the serializers.
+
+Loads every isotherm group of the shipped storage with `MonoIsothermSerializer` and `MixIsothermSerializer`, over
+one open handle and one `LoadContext`, so adsorbates are read once and the timing is dominated by the per-isotherm
+attribute and dataset reads and their conversion. Also times the attribute reads alone, with the compiled field plan
+and with the reflective `get_attr_fields_from_infos` path. Times are the best of `REPEAT` passes.
+
+Usage:
+    python -m benchmarks.bench_field_plans
+"""
+
+import time
+from typing import Any, Callable, Dict, List, Tuple, Union
+
+from h5py import Group
+
+from adsorption_database.defaults import (
+    EXPERIMENTS,
+    MIXTURE_ISOTHERMS,
+    MONO_ISOTHERMS,
+)
+from adsorption_database.serializers.abstract_serializer import (
+    AbstractSerializer,
+)
+from adsorption_database.serializers.load_context import LoadContext
+from adsorption_database.serializers.mix_isotherm_serializer import (
+    MixIsothermSerializer,
+)
+from adsorption_database.serializers.mono_isotherm_serializer import (
+    MonoIsothermSerializer,
+)
+from adsorption_database.shared import get_attr_fields_from_infos
+from adsorption_database.storage_provider import StorageProvider
+
+REPEAT = 60
+
+
+def get_isotherm_groups(file: Group, kind: str) -> List[Group]:
+    return [
+        experiment[kind][name]
+        for experiment in file[EXPERIMENTS].values()
+        if kind in experiment
+        for name in experiment[kind]
+    ]
+
+
+def measure(groups: List[Group], function: Callable[[Group], Any]) -> float:
+    for group in groups:
+        function(group)
+
+    durations = []
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        for group in groups:
+            function(group)
+        durations.append(time.perf_counter() - start)
+    return min(durations) / len(groups)
+
+
+def read_attributes_with_plan(
+    serializer: AbstractSerializer,
+) -> Callable[[Group], Any]:
+    def read(group: Group) -> Dict[str, Any]:
+        fields: Dict[str, Any] = {}
+        serializer.get_field_plan().read_attributes(fields, group)
+        return fields
+
+    return read
+
+
+def read_attributes_with_reflection(
+    serializer: AbstractSerializer,
+) -> Callable[[Group], Any]:
+    def read(group: Group) -> Dict[str, Any]:
+        fields: Dict[str, Any] = {}
+        get_attr_fields_from_infos(fields, serializer.get_attributes(), group)
+        return fields
+
+    return read
+
+
+if __name__ == "__main__":
+    with StorageProvider().get_readable_file() as f:
+        context = LoadContext(f)
+        serializers: List[
+            Tuple[str, Union[MonoIsothermSerializer, MixIsothermSerializer]]
+        ] = [
+            (MONO_ISOTHERMS, MonoIsothermSerializer()),
+            (MIXTURE_ISOTHERMS, MixIsothermSerializer()),
+        ]
+        for kind, serializer in serializers:
+            groups = get_isotherm_groups(f, kind)
+            load = measure(
+                groups, lambda group: serializer.load(group, context)
+            )
+            planned = measure(groups, read_attributes_with_plan(serializer))
+            reflected = measure(
+                groups, read_attributes_with_reflection(serializer)
+            )
+            print(
+                f"{kind} ({len(groups)} isotherms): load {load * 1e6:.0f} us, "
+                f"attributes {planned * 1e6:.0f} us with plan, "
+                f"{reflected * 1e6:.0f} us with reflection"
+            )
@@ -0,0 +1,49 @@
+"""
+Latency of loading every experiment of the shipped storage.
+
+Compares a loop of `get_experiment` calls, which re-resolves the shared adsorbates and adsorbents of every isotherm,
+with a single `get_experiments` call, which loads them once over one handle.
+
+Usage:
+    python -m benchmarks.bench_get_experiments
+"""
+
+import time
+from typing import Callable, List
+
+import numpy as np
+
+from adsorption_database import AdsorptionDatabase
+
+REPEAT = 20
+
+
+def measure(function: Callable[[], object]) -> List[float]:
+    function()
+
+    durations = []
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        function()
+        durations.append(time.perf_counter() - start)
+    return durations
+
+
+def report(name: str, durations: List[float]) -> None:
+    values = np.array(durations) * 1e3
+    print(
+        f"{name}: median {np.median(values):.2f} ms, min {values.min():.2f} ms"
+    )
+
+
+if __name__ == "__main__":
+    database = AdsorptionDatabase()
+    names = database.list_experiments()
+
+    loop = measure(lambda: [database.get_experiment(name) for name in names])
+    bulk = measure(lambda: database.get_experiments(names))
+
+    print(f"{len(names)} experiments, {REPEAT} runs")
+    report("get_experiment loop", loop)
+    report("get_experiments", bulk)
+    print(f"Speedup: {np.median(loop) / np.median(bulk):.1f}x")
@@ -0,0 +1,75 @@
+"""
+Throughput of the isotherm parsing stage of `ingest_manifests`.
+
+Writes a few hundred synthetic isotherm files to a temporary folder and parses them with `parse_isotherms`, serially
+and in pools of worker processes, reporting files and points parsed per second. Only the parse stage is timed, so
+the storage file is left untouched; the gain of the pool is bounded by the number of cores.
+
+Usage:
+    python -m benchmarks.bench_ingest
+"""
+
+import tempfile
+import time
+from pathlib import Path
+from typing import List, Optional
+
+import numpy as np
+
+from adsorption_database.handlers.ingest import ParseTask, parse_isotherms
+from adsorption_database.handlers.manifest import IsothermSpec
+from adsorption_database.handlers.text_file_hander import (
+    MonoIsothermTextFileData,
+)
+from adsorption_database.models.adsorbate import Adsorbate
+from adsorption_database.models.isotherms import IsothermType, MonoIsotherm
+
+FILES = 400
+POINTS = 2000
+PROCESSES: List[Optional[int]] = [None, 1, 2, 4]
+
+
+def write_files(folder: Path) -> List[ParseTask]:
+    adsorbate = Adsorbate(name="Carbon Dioxide", chemical_formula="CO2")
+    rng = np.random.default_rng(0)
+    tasks: List[ParseTask] = []
+    for index in range(FILES):
+        file_name = f"isotherm_{index}.txt"
+        np.savetxt(folder / file_name, rng.random((POINTS, 2)), delimiter="\t")
+        spec = IsothermSpec(
+            f"CO2-{index}",
+            298.0,
+            IsothermType.EXCESS,
+            None,
+            MonoIsothermTextFileData(
+                file_name=file_name,
+                adsorbate=adsorbate,
+                pressures_col=0,
+                loadings_col=1,
+            ),
+        )
+        tasks.append((folder, spec))
+    return tasks
+
+
+def run(tasks: List[ParseTask], processes: Optional[int]) -> None:
+    start = time.perf_counter()
+    points = 0
+    for _, isotherm in parse_isotherms(tasks, processes):
+        assert isinstance(isotherm, MonoIsotherm), isotherm
+        points += isotherm.pressures.size
+    total = time.perf_counter() - start
+
+    print(
+        f"{processes or 0} processes: {len(tasks) / total:.0f} files/s, "
+        f"{points / total:.0f} points/s"
+    )
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as folder:
+        tasks = write_files(Path(folder))
+
+        print(f"{FILES} files of {POINTS} points")
+        for processes in PROCESSES:
+            run(tasks, processes)
@@ -0,0 +1,143 @@
+"""
+Reader latency while a writer continuously appends isotherm points.
+
+A writer process appends points to the isotherms of a storage file in SWMR mode while a reader process keeps
+refreshing and reading them. The latency of each read is reported, along with the number of failed attempts of a
+plain (non-SWMR) reader, which is locked out of the file while the writer has it open.
+
+Usage:
+    python -m benchmarks.bench_swmr
+"""
+
+import multiprocessing as mp
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, List
+
+import numpy as np
+from h5py import File
+
+from adsorption_database.defaults import EXPERIMENTS, MONO_ISOTHERMS
+from adsorption_database.serializers.abstract_serializer import (
+    AbstractSerializer,
+)
+from adsorption_database.storage_provider import StorageProvider
+
+DURATION = 5.0
+N_ISOTHERMS = 20
+POINTS_PER_APPEND = 10
+DATASETS = ["pressures", "loadings"]
+
+
+def get_isotherm_routes() -> List[str]:
+    return [
+        f"/{EXPERIMENTS}/bench/{MONO_ISOTHERMS}/isotherm-{index}"
+        for index in range(N_ISOTHERMS)
+    ]
+
+
+def setup_storage(path: Path) -> None:
+    serializer = AbstractSerializer(object)
+    with File(path, "w", libver="latest") as f:
+        for route in get_isotherm_routes():
+            group = f.require_group(route)
+            for dataset_name in DATASETS:
+                serializer.append_dataset(group, dataset_name, np.empty(0))
+
+
+def writer(path: Path, started: Any, stop: Any) -> None:
+    serializer = AbstractSerializer(object)
+    provider = StorageProvider(file_path=path)
+
+    with provider.get_editable_file(swmr=True) as f:
+        started.set()
+        groups = [f[route] for route in get_isotherm_routes()]
+        while not stop.is_set():
+            for group in groups:
+                for dataset_name in DATASETS:
+                    serializer.append_dataset(
+                        group, dataset_name, np.random.rand(POINTS_PER_APPEND)
+                    )
+
+
+def swmr_reader(path: Path, started: Any, results: Any) -> None:
+    started.wait()
+    provider = StorageProvider(file_path=path)
+    latencies = []
+    points = 0
+
+    end = time.perf_counter() + DURATION
+    with provider.get_readable_file(swmr=True) as f:
+        datasets = [f[route]["pressures"] for route in get_isotherm_routes()]
+        while time.perf_counter() < end:
+            start = time.perf_counter()
+            points = 0
+            for dataset in datasets:
+                dataset.refresh()
+                points += len(dataset[...])
+            latencies.append(time.perf_counter() - start)
+
+    results.put(("swmr", latencies, points))
+
+
+def plain_reader(path: Path, started: Any, results: Any) -> None:
+    started.wait()
+    failures = 0
+    attempts = 0
+
+    end = time.perf_counter() + DURATION
+    while time.perf_counter() < end:
+        attempts += 1
+        try:
+            with File(path, "r") as f:
+                f[get_isotherm_routes()[0]]["pressures"][...]
+        except OSError:
+            failures += 1
+        time.sleep(0.01)
+
+    results.put(("plain", attempts, failures))
+
+
+def report(latencies: List[float], points: int) -> None:
+    values = np.array(latencies) * 1e3
+    print(f"SWMR reader: {len(values)} reads of {N_ISOTHERMS} isotherms")
+    print(f"  points visible at the end: {points}")
+    for percentile in [50, 95, 99]:
+        print(
+            f"  p{percentile} latency: {np.percentile(values, percentile):.3f} ms"
+        )
+    print(f"  max latency: {values.max():.3f} ms")
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as folder:
+        path = Path(folder) / "storage.hdf5"
+        setup_storage(path)
+
+        started = mp.Event()
+        stop = mp.Event()
+        results: Any = mp.Queue()
+
+        processes = [
+            mp.Process(target=writer, args=(path, started, stop)),
+            mp.Process(target=swmr_reader, args=(path, started, results)),
+            mp.Process(target=plain_reader, args=(path, started, results)),
+        ]
+        for process in processes:
+            process.start()
+
+        outputs = {}
+        for _ in range(2):
+            output = results.get()
+            outputs[output[0]] = output[1:]
+
+        stop.set()
+        for process in processes:
+            process.join()
+
+        report(*outputs["swmr"])
+        attempts, failures = outputs["plain"]
+        print(
+            f"Plain reader: {failures} of {attempts} attempts failed while the writer was active"
+        )
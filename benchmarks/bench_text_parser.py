@@ -0,0 +1,93 @@
+"""
+Read time of large isotherm exports with the `fast` and `loadtxt` text parser engines.
+
+Writes a monocomponent and a mixture export of a few hundred thousand rows (several megabytes each) to a temporary
+folder, and reports the best of a few `get_mono_data` and `get_mix_data` calls with each `TextFileHandler` engine,
+and with a `ParseCache` (every call but the first is then a cache hit).
+
+Usage:
+    python -m benchmarks.bench_text_parser
+"""
+
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+import numpy as np
+
+from adsorption_database.handlers.parse_cache import ParseCache
+from adsorption_database.handlers.text_file_hander import (
+    MixIsothermTextFileData,
+    MonoIsothermTextFileData,
+    TextFileHandler,
+)
+from adsorption_database.handlers.text_parser import ENGINES
+from adsorption_database.models.adsorbate import Adsorbate
+
+ROWS = 200_000
+REPEATS = 5
+
+
+def best_time(function: Callable[[], Any]) -> float:
+    durations = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        function()
+        durations.append(time.perf_counter() - start)
+    return min(durations)
+
+
+def write_files(folder: Path) -> None:
+    rng = np.random.default_rng(0)
+    header = "Exported isotherm"
+    np.savetxt(
+        folder / "mono.txt",
+        rng.random((ROWS, 6)),
+        delimiter="\t",
+        header=header,
+    )
+    np.savetxt(
+        folder / "mix.txt",
+        rng.random((ROWS, 8)),
+        delimiter="\t",
+        header=header,
+    )
+
+
+if __name__ == "__main__":
+    co2 = Adsorbate(name="Carbon Dioxide", chemical_formula="CO2")
+    ch4 = Adsorbate(name="Methane", chemical_formula="CH4")
+    mono_data = MonoIsothermTextFileData("mono.txt", co2, 0, 1)
+    mix_data = MixIsothermTextFileData(
+        "mix.txt",
+        [co2, ch4],
+        0,
+        [2, 4],
+        [1],
+        load_missing_composition_from_equilibrium=True,
+    )
+
+    with tempfile.TemporaryDirectory() as folder:
+        write_files(Path(folder))
+        sizes = [
+            (Path(folder) / name).stat().st_size / 2**20
+            for name in ["mono.txt", "mix.txt"]
+        ]
+        print(f"{ROWS} rows: mono {sizes[0]:.1f} MiB, mix {sizes[1]:.1f} MiB")
+
+        handlers = {
+            engine: TextFileHandler(Path(folder), engine=engine)
+            for engine in ENGINES
+        }
+        handlers["cached"] = TextFileHandler(
+            Path(folder), parse_cache=ParseCache(max_size=2**30)
+        )
+        for engine, handler in handlers.items():
+            mono = best_time(lambda: handler.get_mono_data(mono_data))
+            mix = best_time(lambda: handler.get_mix_data(mix_data))
+            print(
+                f"{engine}: mono {mono * 1e3:.0f} ms "
+                f"({ROWS / mono:.0f} rows/s), "
+                f"mix {mix * 1e3:.0f} ms ({ROWS / mix:.0f} rows/s)"
+            )
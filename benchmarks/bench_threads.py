@@ -0,0 +1,61 @@
+"""
+Scaling of concurrent experiment loading across 1, 2, 4 and 8 workers.
+
+Loads every experiment of the shipped storage `ROUNDS` times with a thread pool calling `get_experiment`, through
+the shared read handle and through thread-local handles, and with `get_experiments` split over worker processes.
+Worker processes are started before timing, so spawn and import costs are excluded.
+
+Usage:
+    python -m benchmarks.bench_threads
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List
+
+from adsorption_database import AdsorptionDatabase
+
+ROUNDS = 10
+WORKERS = [1, 2, 4, 8]
+
+
+def measure(function: Callable[[], object]) -> float:
+    function()
+
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+def load_with_threads(
+    database: AdsorptionDatabase, names: List[str], workers: int
+) -> float:
+    with ThreadPoolExecutor(workers) as executor:
+        return measure(
+            lambda: list(executor.map(database.get_experiment, names * ROUNDS))
+        )
+
+
+def load_with_processes(names: List[str], workers: int) -> float:
+    with AdsorptionDatabase(processes=workers) as database:
+        return measure(
+            lambda: [database.get_experiments(names) for _ in range(ROUNDS)]
+        )
+
+
+if __name__ == "__main__":
+    names = AdsorptionDatabase().list_experiments()
+    loads = len(names) * ROUNDS
+
+    print(f"{loads} experiment loads")
+    print("workers  shared handle  thread-local  processes (experiments/s)")
+    for workers in WORKERS:
+        shared = load_with_threads(AdsorptionDatabase(), names, workers)
+        thread_local = load_with_threads(
+            AdsorptionDatabase(thread_local=True), names, workers
+        )
+        processes = load_with_processes(names, workers)
+        print(
+            f"{workers:7d}  {loads / shared:13.1f}  {loads / thread_local:12.1f}"
+            f"  {loads / processes:9.1f}"
+        )